@@ -1,9 +1,59 @@
 import argparse
+import signal
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.experiment_runner import ExperimentRunner
+# Ağır bağımlılıklar (google.generativeai, pandas, scikit-learn, matplotlib)
+# yalnızca ExperimentRunner gereken komutlarda yüklenir.
+
+# --benchmark: 1 = regresyon, 2 = benchmark/karşılaştırma hatası
+BENCHMARK_ERROR_EXIT_CODE = 2
+
+def create_runner(args):
+    """ExperimentRunner'ı ilk ihtiyaç anında import et ve oluştur"""
+    from src.experiment_runner import ExperimentRunner
+    runner = ExperimentRunner(args.config, run_id=args.resume, telemetry_path=args.telemetry,
+                              show_progress=args.progress)
+    install_stop_handler(runner)
+    return runner
+
+def install_stop_handler(runner):
+    """İlk Ctrl+C çalışmayı mevcut batch bitince durdurur (sonuçlar kaydedilir), ikincisi hemen keser"""
+    def handle_interrupt(signum, frame):
+        if runner.stop_requested:
+            raise KeyboardInterrupt
+        print("\nStopping after the current batch (press Ctrl+C again to abort)...")
+        runner.request_stop()
+    
+    signal.signal(signal.SIGINT, handle_interrupt)
+
+def print_comparison(comparison):
+    """Ardışık eleme sonucunu (sınırlar, durum, çağrı sayısı) yazdır"""
+    summary = comparison.summary()
+    print(f"\nSequential elimination ({summary['confidence']:.0%} confidence, {summary['rounds']} rounds):")
+    for strategy, stats in summary['strategies'].items():
+        print(f"  {strategy:<16} calls={stats['calls']:<6} accuracy={stats['mean']:.3f} "
+              f"bounds=[{stats['lower']:.3f}, {stats['upper']:.3f}]  {stats['status']}")
+    
+    # Hiç elenmeyen strateji görülen tüm verilerle çalıştırılmıştır
+    items_seen = max(stats['calls'] for stats in summary['strategies'].values())
+    print(f"Model calls: {summary['total_calls']} "
+          f"(exhaustive run over the same {items_seen} items: {items_seen * len(summary['strategies'])})")
+    if summary['winner'] is None:
+        print(f"No strategy separated; current leader: {summary['leader']}")
+
+def print_sample(sample):
+    """Katmanlı örneklem tahminlerini ve güven aralıklarını yazdır"""
+    summary = sample.summary()
+    status = "reached" if summary['converged'] else "not reached"
+    print(f"\nStratified sample: {summary['sample_size']} of {summary['population_size']} items, "
+          f"target CI width {summary['target_ci_width']:.3f} {status}")
+    print("  strata: " + ", ".join(f"{stratum}={drawn}/{size}" for stratum, (drawn, size) in summary['strata'].items()))
+    for strategy, estimate in summary['strategies'].items():
+        print(f"  {strategy:<16} n={estimate['samples']:<6} accuracy={estimate['mean']:.3f} "
+              f"{summary['confidence']:.0%} CI=[{estimate['ci_low']:.3f}, {estimate['ci_high']:.3f}] "
+              f"width={estimate['width']:.3f}")
 
 def main():
     parser = argparse.ArgumentParser(description='Prompt Engineering Experiment Runner')
@@ -23,26 +73,54 @@ def main():
     # Gelişmiş özellikler
     parser.add_argument('--benchmark', action='store_true',
                        help='Performance benchmark çalıştır')
+    parser.add_argument('--benchmark-iterations', type=int, default=3,
+                       help='Benchmark tekrar sayısı (her biri soğuk + ılık önbellek)')
+    parser.add_argument('--benchmark-output', type=str,
+                       help='Benchmark JSON çıktı dosyası (varsayılan: output_dir/benchmark_<zaman>.json)')
+    parser.add_argument('--baseline', type=str, metavar='NAME',
+                       help='Benchmark sonucunu bu baseline ile karşılaştır; regresyonda çıkış kodu 1')
+    parser.add_argument('--save-baseline', type=str, metavar='NAME',
+                       help='Bu benchmark çalıştırmasını NAME adıyla baseline olarak kaydet')
     parser.add_argument('--compare-strategies', action='store_true',
                        help='Stratejileri karşılaştır')
+    parser.add_argument('--adaptive', action='store_true',
+                       help='--compare-strategies: ardışık eleme ile ayrışan stratejileri erken bırak')
+    parser.add_argument('--sample', action='store_true',
+                       help='--task: katmanlı alt örneklemi güven aralığı hedef genişliğe inene kadar büyüt')
+    parser.add_argument('--target-ci-width', type=float,
+                       help='--sample için hedef güven aralığı genişliği (varsayılan: sampling.target_ci_width)')
     parser.add_argument('--config', type=str, default='config/settings.yaml',
                        help='Config dosyası yolu')
     parser.add_argument('--output-format', choices=['console', 'csv', 'json', 'html'],
                        default='console', help='Çıktı formatı')
+    parser.add_argument('--resume', type=str, metavar='RUN_ID',
+                       help='Yarıda kalan çalıştırmaya devam et (tamamlanan birimler atlanır)')
+    parser.add_argument('--telemetry', type=str, metavar='PATH',
+                       help='Span/sayaçları topla ve dosyaya yaz (.prom: Prometheus, '
+                            '.otel.json: OpenTelemetry, diğer: Chrome trace)')
+    parser.add_argument('--progress', action='store_true',
+                       help='Strateji bazında canlı doğruluk/güven aralığı görünümü (Ctrl+C: erken durdur)')
     
     args = parser.parse_args()
+    if args.resume and args.benchmark:
+        # Benchmark her ölçümü sıfırdan çalıştırır; günlükten devam edilemez
+        parser.error("--resume cannot be combined with --benchmark")
     
     try:
-        runner = ExperimentRunner(args.config)
-        
         if args.list_tasks:
-            tasks = runner.list_available_tasks()
+            from src.core.config import Config
+            from src.tasks.registry import list_tasks
+            
+            tasks = list_tasks(Config(args.config))
             print("Available tasks:")
             for task in tasks:
                 print(f"  - {task}")
         
         elif args.task_info:
-            info = runner.get_task_info(args.task_info)
+            from src.core.config import Config
+            from src.tasks.registry import get_task_info
+            
+            info = get_task_info(args.task_info, Config(args.config))
             if "error" in info:
                 print(f"Error: {info['error']}")
             else:
@@ -51,7 +129,8 @@ def main():
                 print(f"  test_data_count: {info['test_data_count']}")
                 print(f"  available_strategies: {info['available_strategies']}")
         
-        elif args.run_all:
+        elif args.run_all or (args.resume and not args.task and not args.compare_strategies):
+            runner = create_runner(args)
             print("Running all available tasks...")
             all_results = runner.run_all_tasks()
             print("\n" + "="*60)
@@ -59,64 +138,128 @@ def main():
             print("="*60)
             
             # Özet rapor
+            aggregator = runner.get_aggregator(list(all_results))
             for task_name, results_df in all_results.items():
                 print(f"\n{task_name.upper()}:")
                 if 'Accuracy' in results_df.columns:
-                    avg_acc = results_df['Accuracy'].mean()
-                    print(f"  Average Accuracy: {avg_acc:.3f}")
-                    best_strategy = results_df.groupby('Prompt Type')['Accuracy'].mean().idxmax()
-                    print(f"  Best Strategy: {best_strategy}")
+                    print(f"  Average Accuracy: {aggregator.overall(task_name).value:.3f}")
+                    print(f"  Best Strategy: {aggregator.best_strategy(task_name)}")
         
         elif args.benchmark:
-            try:
-                from src.utils.benchmark_runner import BenchmarkRunner
-                benchmark = BenchmarkRunner(runner)
-                
-                print("Running performance benchmarks...")
-                for task_name in runner.list_available_tasks():
-                    print(f"\nBenchmarking {task_name}...")
-                    result = benchmark.run_performance_benchmark(task_name, iterations=3)
-                    print(f"Average execution time: {result.get('avg_execution_time', 0):.2f}s")
-                
-                # Benchmark raporu
-                report_df = benchmark.generate_benchmark_report()
+            runner = create_runner(args)
+            from src.benchmarking.benchmark_runner import BenchmarkRunner
+            from src.benchmarking.history import BenchmarkHistory, validate_baseline_name
+            config = runner.config
+            history = BenchmarkHistory(config.get('benchmark.history_dir', 'data/benchmarks'))
+            # Olmayan/geçersiz baseline benchmark çalışmadan önce hata versin (CI kapısı açık kalmasın)
+            if args.baseline:
+                history.baseline(args.baseline)
+            if args.save_baseline:
+                validate_baseline_name(args.save_baseline)
+            benchmark = BenchmarkRunner(runner)
+            
+            task_names = [args.task] if args.task else runner.list_available_tasks()
+            print("Running performance benchmarks...")
+            for task_name in task_names:
+                print(f"\nBenchmarking {task_name}...")
+                result = benchmark.run_performance_benchmark(
+                    task_name, iterations=args.benchmark_iterations, strategies=args.strategies
+                )
+                for mode in ("cold", "warm"):
+                    summary = result['summary'].get(mode)
+                    if summary:
+                        print(f"Average execution time ({mode} cache): {summary['wall_seconds']['mean']:.2f}s")
+            
+            # Benchmark raporu
+            report_df = benchmark.generate_benchmark_report()
+            print("\n" + "="*50)
+            print("BENCHMARK REPORT")
+            print("="*50)
+            print(report_df.to_string(index=False))
+            
+            output_path = args.benchmark_output
+            if output_path is None:
+                timestamp = __import__('datetime').datetime.now().strftime("%Y%m%d_%H%M%S")
+                output_path = os.path.join(runner.data_handler.output_dir, f"benchmark_{timestamp}.json")
+            print(f"\nBenchmark results saved to: {benchmark.save_json(output_path)}")
+            
+            # Geçmişe kaydet ve baseline ile karşılaştır
+            report = benchmark.to_dict()
+            entry_id = history.record(report, label=args.save_baseline)
+            print(f"Benchmark recorded in history as {entry_id}")
+            
+            regressed = False
+            if args.baseline:
+                comparison = history.compare(
+                    report, args.baseline,
+                    latency_threshold=config.get('benchmark.latency_threshold', 0.10),
+                    memory_threshold=config.get('benchmark.memory_threshold', 0.10),
+                    confidence=config.get('benchmark.confidence', 0.95),
+                    n_resamples=config.get('benchmark.bootstrap_resamples', 1000),
+                    min_samples=config.get('benchmark.min_samples', 2),
+                    min_latency_delta_ms=config.get('benchmark.min_latency_delta_ms', 5.0),
+                    min_memory_delta_mb=config.get('benchmark.min_memory_delta_mb', 1.0)
+                )
                 print("\n" + "="*50)
-                print("BENCHMARK REPORT")
+                print(f"COMPARISON WITH BASELINE '{args.baseline}'")
                 print("="*50)
-                print(report_df.to_string(index=False))
+                print(comparison.to_dataframe().to_string(index=False))
+                for task_name in comparison.missing_tasks:
+                    print(f"Warning: {task_name} not present in baseline")
                 
-            except ImportError:
-                print("Benchmark runner not available")
+                regressed = comparison.has_regressions
+                if regressed:
+                    print(f"\nPerformance regression detected in {len(comparison.regressions)} metric(s)")
+                else:
+                    print("\nNo performance regressions detected")
+            
+            if args.save_baseline:
+                print(f"Baseline '{args.save_baseline}' saved to: {history.set_baseline(args.save_baseline, entry_id)}")
+            
+            if regressed:
+                sys.exit(1)
         
         elif args.compare_strategies:
             if not args.task:
                 print("--task parameter required for strategy comparison")
                 return
             
+            runner = create_runner(args)
             print(f"Comparing all strategies for {args.task}...")
-            # Tüm mevcut stratejileri al
-            available_strategies = ["vanilla", "zero_shot", "one_shot", "few_shot", "zero_shot_cot", "few_shot_cot"]
-            
-            results_df = runner.run_single_task(args.task, available_strategies)
+            # --strategies verilmezse görevin desteklediği tüm stratejiler karşılaştırılır
+            results_df, comparison = runner.compare_strategies(
+                args.task, args.strategies, adaptive=True if args.adaptive else None
+            )
+            aggregator = runner.get_aggregator([args.task])
             
             print("\n" + "="*50)
             print("STRATEGY COMPARISON")
             print("="*50)
             
-            strategy_performance = runner.get_performance_summary(results_df)
+            strategy_performance = runner.get_performance_summary(results_df, aggregator)
             print(strategy_performance.to_string(index=False))
             
             # En iyi ve en kötü strateji
-            if 'Accuracy' in results_df.columns:
-                avg_by_strategy = results_df.groupby('Prompt Type')['Accuracy'].mean()
-                best = avg_by_strategy.idxmax()
-                worst = avg_by_strategy.idxmin()
+            avg_by_strategy = aggregator.strategy_means(args.task)
+            if avg_by_strategy:
+                best = aggregator.best_strategy(args.task)
+                worst = aggregator.worst_strategy(args.task)
                 print(f"\nBest Strategy: {best} ({avg_by_strategy[best]:.3f})")
                 print(f"Worst Strategy: {worst} ({avg_by_strategy[worst]:.3f})")
+            
+            if comparison is not None:
+                print_comparison(comparison)
         
         elif args.task:
-            results_df = runner.run_single_task(args.task, args.strategies)
-            runner.print_results_summary(results_df)
+            runner = create_runner(args)
+            sample = None
+            if args.sample:
+                from src.evaluation.sampling import StratifiedSample
+                sample = StratifiedSample.from_config(runner.config, target_ci_width=args.target_ci_width)
+            results_df = runner.run_single_task(args.task, args.strategies, sample=sample)
+            runner.print_results_summary(results_df, runner.get_aggregator([args.task]))
+            if sample is not None:
+                print_sample(sample)
             
             # Çıktı formatına göre kaydet
             if args.output_format != 'console':
@@ -135,8 +278,11 @@ def main():
                 elif args.output_format == 'html':
                     try:
                         from src.analytics.report_generator import ReportGenerator
-                        report_gen = ReportGenerator()
-                        report_path = report_gen.generate_comprehensive_report({args.task: results_df})
+                        report_gen = ReportGenerator.from_config(runner.config)
+                        report_path = report_gen.generate_comprehensive_report(
+                            {args.task: runner.result_paths.get(args.task, results_df)},
+                            runner.get_aggregator([args.task])
+                        )
                         print(f"\nHTML report generated: {report_path}")
                     except ImportError:
                         print("HTML report generator not available")
@@ -148,6 +294,9 @@ def main():
         print(f"Error: {str(e)}")
         import traceback
         traceback.print_exc()
+        if args.benchmark:
+            # Benchmark CI'da regresyon kapısı olarak kullanılır; hata başarı sayılmamalı
+            sys.exit(BENCHMARK_ERROR_EXIT_CODE)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
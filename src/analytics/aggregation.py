@@ -0,0 +1,361 @@
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Gruplama anahtarı: (görev, strateji, prompt formatı)
+GROUP_KEYS = ("Task", "Prompt Type", "Prompt Format")
+METRIC_COLUMNS = ("Accuracy", "Input Tokens", "Output Tokens", "Latency (s)")
+# Anlık görüntüdeki güven aralıkları için normal yaklaşım katsayısı (%95)
+CI_Z = 1.96
+
+
+class RunningStats:
+    """Adet, ortalama ve varyansı tek geçişte tutan akış istatistiği (Welford).
+
+    İki özet Chan vd. birleştirme formülüyle kayıpsız birleştirilir; böylece
+    satır, batch ve görev düzeyindeki özetler yeniden taranmadan toplanabilir.
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value: Optional[float]) -> None:
+        """Tek değer ekle (None/NaN atlanır)"""
+        if value is None or value != value:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Başka bir özeti bu özete ekle"""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Örneklem varyansı (pandas gibi ddof=1; iki değerden azsa NaN)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.count > 1 else math.nan
+
+    @property
+    def value(self) -> float:
+        """Ortalama (değer yoksa NaN)"""
+        return self.mean if self.count else math.nan
+
+    def confidence_interval(self, z: float = CI_Z) -> Tuple[float, float]:
+        """Ortalama için normal yaklaşımlı güven aralığı (iki değerden azsa NaN)"""
+        if self.count < 2:
+            return math.nan, math.nan
+        half_width = z * self.std / math.sqrt(self.count)
+        return self.mean - half_width, self.mean + half_width
+
+
+class GroupStats:
+    """Tek bir (görev, strateji, format) grubunun satır sayısı ve metrik özetleri"""
+
+    __slots__ = ("rows", "metrics")
+
+    def __init__(self):
+        self.rows = 0
+        self.metrics = {metric: RunningStats() for metric in METRIC_COLUMNS}
+
+    def merge(self, other: "GroupStats") -> None:
+        self.rows += other.rows
+        for metric, stats in other.metrics.items():
+            self.metrics[metric].merge(stats)
+
+
+class ResultAggregator:
+    """Görev/strateji/format bazındaki tüm özetleri tek geçişte toplayan katman.
+
+    Sonuçlar akarken add_records() ile artımlı, hazır DataFrame'ler için
+    add_dataframe() ile vektörel olarak beslenir. Strateji tabloları, en iyi
+    strateji ve genel özetler gruplar birleştirilerek üretilir; sonuç satırları
+    bir daha taranmaz. Sınıflandırma görevleri için (görev, strateji) başına
+    beklenen/tahmin edilen etiket sayaçları da tutulur. Çalışma sürerken başka
+    bir thread'den sorgulanabilir.
+    """
+
+    def __init__(self):
+        self._groups: Dict[Tuple[Any, Any, Any], GroupStats] = {}
+        # (görev, strateji) -> beklenen etiket -> tahmin edilen etiket -> adet
+        self._confusion: Dict[Tuple[Any, Any], Dict[Any, Dict[Any, int]]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_dataframe(cls, results_df: "pd.DataFrame", task: Optional[str] = None) -> "ResultAggregator":
+        aggregator = cls()
+        aggregator.add_dataframe(results_df, task)
+        return aggregator
+
+    @classmethod
+    def from_results(cls, all_results: Mapping[str, "pd.DataFrame"]) -> "ResultAggregator":
+        """Görev adı -> DataFrame sözlüğünden (Accuracy içermeyenler atlanır)"""
+        aggregator = cls()
+        for task_name, results_df in all_results.items():
+            if not results_df.empty and 'Accuracy' in results_df.columns:
+                aggregator.add_dataframe(results_df, task_name)
+        return aggregator
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(group.rows for group in self._groups.values())
+
+    def _group(self, key: Tuple[Any, Any, Any]) -> GroupStats:
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = GroupStats()
+        return group
+
+    # Besleme
+
+    def add_records(self, records: Iterable[Mapping[str, Any]], task: Optional[str] = None,
+                    predicted: Optional[Sequence[Any]] = None) -> None:
+        """to_record() biçimindeki satırları ekle; task verilirse Task sütunu yerine kullanılır.
+        
+        predicted (satırlarla aynı sırada tahmin edilen etiketler) verilirse
+        karışıklık sayaçları da güncellenir.
+        """
+        with self._lock:
+            for position, record in enumerate(records):
+                key = (task if task is not None else record.get("Task"),
+                       record.get("Prompt Type"), record.get("Prompt Format"))
+                group = self._group(key)
+                group.rows += 1
+                for metric in METRIC_COLUMNS:
+                    value = record.get(metric)
+                    if value is not None:
+                        group.metrics[metric].add(float(value))
+                if predicted is not None:
+                    label = predicted[position]
+                    self._count_label(key[0], key[1], record.get("Expected"),
+                                      label if label is not None else "Unknown")
+
+    def _count_label(self, task: Any, strategy: Any, expected: Any, predicted: Any, count: int = 1) -> None:
+        row = self._confusion.setdefault((task, strategy), {}).setdefault(expected, {})
+        row[predicted] = row.get(predicted, 0) + count
+
+    def add_dataframe(self, results_df: "pd.DataFrame", task: Optional[str] = None) -> None:
+        """DataFrame'i tek bir groupby geçişiyle ekle"""
+        import pandas as pd
+
+        if results_df.empty:
+            return
+
+        keys = {}
+        for column in GROUP_KEYS:
+            if column == "Task" and task is not None:
+                keys[column] = task
+            else:
+                keys[column] = results_df[column] if column in results_df.columns else None
+        metrics = [metric for metric in METRIC_COLUMNS if metric in results_df.columns]
+        frame = pd.DataFrame(keys, index=results_df.index)
+        for metric in metrics:
+            frame[metric] = pd.to_numeric(results_df[metric], errors='coerce')
+
+        grouped = frame.groupby(list(GROUP_KEYS), observed=True, sort=False, dropna=False)
+        sizes = grouped.size()
+        summaries = {metric: grouped[metric].agg(['count', 'mean', 'var']) for metric in metrics}
+
+        # size() ve agg() aynı groupby'dan geldiği için grup sıraları aynıdır
+        # (NaN içeren anahtarlarla .loc araması yapılmaz)
+        with self._lock:
+            for position, (key, rows) in enumerate(sizes.items()):
+                batch = GroupStats()
+                batch.rows = int(rows)
+                for metric, summary in summaries.items():
+                    count, mean, variance = summary.iloc[position]
+                    if count:
+                        m2 = variance * (count - 1) if count > 1 else 0.0
+                        batch.metrics[metric] = RunningStats(int(count), float(mean), float(m2))
+                self._group(tuple(None if _is_missing(part) else part for part in key)).merge(batch)
+
+    def merge(self, other: "ResultAggregator", task: Optional[str] = None) -> "ResultAggregator":
+        """Başka bir toplayıcının gruplarını ekle; task verilirse görev adı onunla değiştirilir"""
+        with other._lock:
+            groups = list(other._groups.items())
+            confusion = [(key, expected, predicted, count)
+                         for key, matrix in other._confusion.items()
+                         for expected, row in matrix.items()
+                         for predicted, count in row.items()]
+        with self._lock:
+            for (group_task, prompt_type, prompt_format), group in groups:
+                key = (task if task is not None else group_task, prompt_type, prompt_format)
+                self._group(key).merge(group)
+            for (group_task, strategy), expected, predicted, count in confusion:
+                self._count_label(task if task is not None else group_task, strategy, expected, predicted, count)
+        return self
+
+    # Sorgular
+
+    def tasks(self) -> List[Any]:
+        with self._lock:
+            return list(dict.fromkeys(key[0] for key in self._groups))
+
+    def rows(self, task: Optional[str] = None, strategy: Optional[Any] = None) -> int:
+        """Satır sayısı (doğruluğu hesaplanamayanlar dahil)"""
+        with self._lock:
+            return sum(group.rows for key, group in self._groups.items()
+                       if (task is None or key[0] == task) and (strategy is None or key[1] == strategy))
+
+    def overall(self, task: Optional[str] = None, metric: str = "Accuracy") -> RunningStats:
+        """Görevin (ya da tüm görevlerin) birleşik metrik özeti"""
+        stats = RunningStats()
+        with self._lock:
+            for key, group in self._groups.items():
+                if task is None or key[0] == task:
+                    stats.merge(group.metrics[metric])
+        return stats
+
+    def grouped(self, task: Optional[str] = None, by: Sequence[str] = ("Prompt Type",),
+                metric: str = "Accuracy") -> Dict[Tuple[Any, ...], RunningStats]:
+        """Gruplar by sütunlarına göre birleştirilmiş metrik özetleri (ilk görülme sırasıyla)"""
+        positions = [GROUP_KEYS.index(column) for column in by]
+        result: Dict[Tuple[Any, ...], RunningStats] = {}
+        with self._lock:
+            for key, group in self._groups.items():
+                if task is not None and key[0] != task:
+                    continue
+                target = tuple(key[position] for position in positions)
+                stats = result.get(target)
+                if stats is None:
+                    stats = result[target] = RunningStats()
+                stats.merge(group.metrics[metric])
+        return result
+
+    def confusion(self, task: Optional[str] = None, strategy: Optional[Any] = None) -> Dict[Any, Dict[Any, int]]:
+        """Beklenen -> tahmin edilen etiket sayaçları (görev/strateji verilmezse birleştirilir)"""
+        merged: Dict[Any, Dict[Any, int]] = {}
+        with self._lock:
+            for (matrix_task, matrix_strategy), matrix in self._confusion.items():
+                if (task is not None and matrix_task != task) or (strategy is not None and matrix_strategy != strategy):
+                    continue
+                for expected, row in matrix.items():
+                    target = merged.setdefault(expected, {})
+                    for predicted, count in row.items():
+                        target[predicted] = target.get(predicted, 0) + count
+        return merged
+
+    def strategy_means(self, task: Optional[str] = None) -> Dict[Any, float]:
+        """Strateji -> ortalama doğruluk (doğruluğu olmayan stratejiler hariç)"""
+        return {key[0]: stats.mean for key, stats in self.grouped(task).items() if stats.count}
+
+    def best_strategy(self, task: Optional[str] = None) -> Optional[Any]:
+        means = self.strategy_means(task)
+        return max(means, key=means.get) if means else None
+
+    def worst_strategy(self, task: Optional[str] = None) -> Optional[Any]:
+        means = self.strategy_means(task)
+        return min(means, key=means.get) if means else None
+
+    def strategy_table(self, task: Optional[str] = None, by: Sequence[str] = ("Prompt Type", "Prompt Format"),
+                       pricing: Optional[Dict[str, float]] = None) -> "pd.DataFrame":
+        """Strateji bazında mean/std/count tablosu; token verisi varsa verimlilik metrikleriyle"""
+        import numpy as np
+        import pandas as pd
+
+        accuracy = self.grouped(task, by)
+        if not accuracy:
+            return pd.DataFrame()
+
+        table = pd.DataFrame(
+            [(*key, stats.value, stats.std, stats.count) for key, stats in accuracy.items()],
+            columns=[*by, 'mean', 'std', 'count']
+        )
+
+        input_tokens = self.grouped(task, by, "Input Tokens")
+        output_tokens = self.grouped(task, by, "Output Tokens")
+        if any(stats.count for stats in input_tokens.values()):
+            avg_input = np.array([input_tokens[key].value for key in accuracy])
+            avg_output = np.array([output_tokens[key].value for key in accuracy])
+            total_tokens = avg_input + avg_output
+            table['avg_input_tokens'] = avg_input
+            table['avg_output_tokens'] = avg_output
+            # 1000 token başına doğruluk: kısa prompt'larla aynı doğruluğa ulaşan strateji öne çıkar
+            with np.errstate(divide='ignore', invalid='ignore'):
+                table['accuracy_per_1k_tokens'] = np.where(
+                    total_tokens > 0, table['mean'].to_numpy() / total_tokens * 1000, np.nan)
+
+                latency = self.grouped(task, by, "Latency (s)")
+                if any(stats.count for stats in latency.values()):
+                    avg_latency = np.array([latency[key].value for key in accuracy])
+                    table['latency_ms_per_output_token'] = np.where(
+                        avg_output > 0, avg_latency / avg_output * 1000, np.nan)
+
+            if pricing:
+                # Fiyatlar 1M token başına (USD); istek başı maliyet 3 basamağa yuvarlanmaz
+                cost = (avg_input * pricing.get('input_per_million', 0.0)
+                        + avg_output * pricing.get('output_per_million', 0.0)) / 1_000_000
+                return table.round(3).assign(avg_cost_usd=np.round(cost, 8))
+
+        return table.round(3)
+
+    def summary(self) -> Dict[str, Any]:
+        """Görev bazında ve genel özet (DataHandler.create_summary_report biçimi)"""
+        tasks = {}
+        for task in self.tasks():
+            accuracy = self.overall(task)
+            best = self.best_strategy(task)
+            tasks[task] = {
+                "total_tests": self.rows(task),
+                "successful_tests": accuracy.count,
+                "average_accuracy": accuracy.mean if accuracy.count else 0.0,
+                "best_strategy": best if best is not None else "Unknown"
+            }
+
+        overall = self.overall()
+        return {
+            "tasks": tasks,
+            "overall_stats": {
+                "total_tests": len(self),
+                "overall_accuracy": overall.mean if overall.count else 0.0
+            }
+        }
+
+
+    def snapshot(self, task: Optional[str] = None) -> Dict[str, Any]:
+        """Anlık özet: genel doğruluk ve strateji başına adet/ortalama/std/güven aralığı/karışıklık"""
+        with self._lock:
+            accuracy = self.overall(task)
+            strategies = {}
+            for (strategy,), stats in self.grouped(task).items():
+                ci_low, ci_high = stats.confidence_interval()
+                strategies[strategy] = {
+                    "rows": self.rows(task, strategy),
+                    "count": stats.count,
+                    "mean": stats.value,
+                    "std": stats.std,
+                    "ci_low": ci_low,
+                    "ci_high": ci_high,
+                    "confusion": self.confusion(task, strategy)
+                }
+            return {
+                "rows": self.rows(task),
+                "accuracy": {"count": accuracy.count, "mean": accuracy.value, "std": accuracy.std},
+                "best_strategy": self.best_strategy(task),
+                "strategies": strategies
+            }
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
@@ -0,0 +1,30 @@
+import base64
+import io
+from typing import List, Optional
+
+# Bu modül rapor oluşturucunun işçi sürecinde içe aktarılır; pandas gibi
+# ağır bağımlılıklar yüklenmez, matplotlib yalnızca çizim sırasında yüklenir.
+
+
+def render_strategy_chart(task_name: str, strategies: List[str], means: List[float],
+                          stds: List[Optional[float]]) -> str:
+    """Strateji doğruluk karşılaştırması grafiğini base64 PNG olarak çiz"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure, axis = plt.subplots(figsize=(max(4.0, 1.2 * len(strategies) + 2), 3.5), dpi=100)
+    try:
+        errors = [0.0 if std is None or std != std else std for std in stds]
+        axis.bar(strategies, means, yerr=errors, capsize=4, color="#4c8cbf")
+        axis.set_ylim(0, 1.05)
+        axis.set_ylabel("Accuracy")
+        axis.set_title(task_name.replace('_', ' ').title())
+        axis.grid(axis="y", alpha=0.3)
+        figure.tight_layout()
+
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format="png")
+    finally:
+        plt.close(figure)
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
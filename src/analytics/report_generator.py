@@ -1,123 +1,288 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Dict, List, Any
+from typing import Dict, Iterator, Optional, TextIO, Union
+import html
 import json
+from concurrent.futures import Future
 from datetime import datetime
 import os
+from .aggregation import ResultAggregator
+from ..utils.result_sink import read_result_chunks
+
+REPORT_STYLE = """
+    body { font-family: Arial, sans-serif; margin: 40px; }
+    .header { background-color: #f4f4f4; padding: 20px; border-radius: 5px; }
+    .task-section { margin: 30px 0; border: 1px solid #ddd; padding: 20px; }
+    .metric { display: inline-block; margin: 10px; padding: 10px; background: #e8f4f8; border-radius: 3px; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; vertical-align: top; }
+    th { background-color: #f2f2f2; }
+    .chart { margin: 20px 0; }
+    .results-table td { max-width: 480px; white-space: pre-wrap; word-break: break-word; }
+    .pager { margin: 10px 0; }
+    .pager button { margin-right: 6px; }
+"""
+
+# Sonuç satırları DataFrame'den ya da sonuç dosyasından bu büyüklükte bloklar halinde dönüştürülür
+CONVERSION_BLOCK_ROWS = 10000
+
+# Rapora gömülecek varsayılan en fazla sonuç satırı (visualization.max_detail_rows)
+DEFAULT_MAX_DETAIL_ROWS = 10000
+
+# Görevin sonuçları: bellekteki DataFrame ya da sonuç dosyasının yolu (.jsonl/.parquet/.csv)
+ResultSource = Union[pd.DataFrame, str]
+
+# Sayfa verileri <script type="application/json"> bloklarında tutulur; yalnızca
+# görüntülenen sayfa DOM'a eklenir, böylece milyonlarca satırlı raporlar da açılabilir.
+PAGER_SCRIPT = """
+document.querySelectorAll('.results-table').forEach(function (container) {
+    var pages = container.querySelectorAll('script.report-page');
+    var body = container.querySelector('tbody');
+    var label = container.querySelector('.page-label');
+    var current = 0;
+    function show(index) {
+        current = Math.max(0, Math.min(pages.length - 1, index));
+        body.textContent = '';
+        JSON.parse(pages[current].textContent).forEach(function (row) {
+            var tr = body.insertRow();
+            row.forEach(function (value) { tr.insertCell().textContent = value === null ? '' : value; });
+        });
+        label.textContent = 'Page ' + (current + 1) + ' / ' + pages.length;
+    }
+    container.querySelector('.prev').onclick = function () { show(current - 1); };
+    container.querySelector('.next').onclick = function () { show(current + 1); };
+    if (pages.length) { show(0); }
+});
+"""
+
 
 class ReportGenerator:
-    def __init__(self, output_dir: str = "data/output/reports"):
+    """HTML raporunu bölüm bölüm doğrudan dosyaya yazan rapor oluşturucu.
+
+    Sonuç tabloları rows_per_page satırlık sayfalar halinde yazılır; sonuçlar
+    dosya yolu olarak verilirse satırlar dosyadan blok blok okunur, böylece
+    bellekte aynı anda en fazla bir blok tutulur. Tabloya en fazla
+    max_detail_rows satır gömülür (None: tümü). Strateji grafikleri tablolar
+    yazılırken ayrı bir işçi süreçte çizilir.
+    """
+
+    def __init__(self, output_dir: str = "data/output/reports", rows_per_page: int = 100,
+                 max_detail_rows: Optional[int] = DEFAULT_MAX_DETAIL_ROWS, render_charts: bool = True):
         self.output_dir = output_dir
+        self.rows_per_page = rows_per_page
+        self.max_detail_rows = max_detail_rows
+        self.render_charts = render_charts
         os.makedirs(output_dir, exist_ok=True)
-        
-    def generate_comprehensive_report(self, all_results: Dict[str, pd.DataFrame]) -> str:
-        """Kapsamlı analiz raporu oluştur"""
+
+    @classmethod
+    def from_config(cls, config) -> "ReportGenerator":
+        """visualization.* ayarlarından oluştur"""
+        output_dir = os.path.join(config.get('evaluation.output_dir', 'data/output'), 'reports')
+        return cls(
+            output_dir=output_dir,
+            rows_per_page=config.get('visualization.rows_per_page', 100),
+            max_detail_rows=config.get('visualization.max_detail_rows', DEFAULT_MAX_DETAIL_ROWS),
+            render_charts=config.get('visualization.enabled', True)
+        )
+
+    def generate_comprehensive_report(self, all_results: Dict[str, ResultSource],
+                                      aggregator: Optional[ResultAggregator] = None) -> str:
+        """Kapsamlı analiz raporu oluştur (aggregator verilirse özetler ondan okunur)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_path = os.path.join(self.output_dir, f"comprehensive_report_{timestamp}.html")
-        
-        html_content = self._create_html_report(all_results)
-        
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
+
+        if aggregator is None:
+            aggregator = self._build_aggregator(all_results)
+        task_stats = {task_name: _strategy_stats(aggregator, task_name) for task_name in all_results}
+        executor = self._start_chart_worker() if self.render_charts else None
+        try:
+            charts = self._submit_charts(executor, task_stats) if executor is not None else {}
+            with open(report_path, 'w', encoding='utf-8') as f:
+                self._write_report(f, all_results, aggregator, task_stats, charts)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
         return report_path
-    
-    def _create_html_report(self, all_results: Dict[str, pd.DataFrame]) -> str:
-        """HTML raporu oluştur"""
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Prompt Engineering Analysis Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 40px; }
-                .header { background-color: #f4f4f4; padding: 20px; border-radius: 5px; }
-                .task-section { margin: 30px 0; border: 1px solid #ddd; padding: 20px; }
-                .metric { display: inline-block; margin: 10px; padding: 10px; background: #e8f4f8; border-radius: 3px; }
-                table { border-collapse: collapse; width: 100%; }
-                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-                th { background-color: #f2f2f2; }
-                .chart { margin: 20px 0; }
-            </style>
-        </head>
-        <body>
-        """
-        
+
+    def _build_aggregator(self, all_results: Dict[str, ResultSource]) -> ResultAggregator:
+        """Özetleri sonuçlardan blok blok topla (Accuracy içermeyen bloklar atlanır)"""
+        aggregator = ResultAggregator()
+        for task_name, source in all_results.items():
+            for block in self._iter_blocks(source, CONVERSION_BLOCK_ROWS):
+                if 'Accuracy' in block.columns:
+                    aggregator.add_dataframe(block, task_name)
+        return aggregator
+
+    def _iter_blocks(self, source: ResultSource, block_rows: int) -> Iterator[pd.DataFrame]:
+        """Sonuçları en fazla block_rows satırlık DataFrame blokları halinde dolaş"""
+        if isinstance(source, pd.DataFrame):
+            for start in range(0, len(source), block_rows):
+                yield source.iloc[start:start + block_rows]
+        else:
+            yield from read_result_chunks(source, block_rows)
+
+    def _start_chart_worker(self):
+        """Grafikler için tek işçili süreç havuzu (başlatılamazsa None)"""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            # spawn: ana süreçteki thread'ler ve açık dosyalar işçiye kopyalanmaz
+            return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        except (OSError, ValueError) as e:
+            print(f"Warning: Chart worker could not be started, charts skipped: {e}")
+            return None
+
+    def _submit_charts(self, executor, task_stats: Dict[str, Optional[pd.DataFrame]]) -> Dict[str, Future]:
+        """Her görevin strateji grafiğini işçi sürece gönder"""
+        from .charts import render_strategy_chart
+
+        charts = {}
+        for task_name, stats in task_stats.items():
+            if stats is None or stats.empty:
+                continue
+            charts[task_name] = executor.submit(
+                render_strategy_chart, task_name,
+                [str(strategy) for strategy in stats.index],
+                stats['mean'].fillna(0.0).tolist(), stats['std'].tolist()
+            )
+        return charts
+
+    def _write_report(self, f: TextIO, all_results: Dict[str, ResultSource], aggregator: ResultAggregator,
+                      task_stats: Dict[str, Optional[pd.DataFrame]], charts: Dict[str, Future]) -> None:
+        """Raporu bölüm bölüm yaz"""
+        f.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n")
+        f.write("<title>Prompt Engineering Analysis Report</title>\n")
+        f.write(f"<style>{REPORT_STYLE}</style>\n</head>\n<body>\n")
+
         # Header
-        html += f"""
+        f.write(f"""
         <div class="header">
             <h1>Prompt Engineering Analysis Report</h1>
             <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
             <p>Total Tasks Analyzed: {len(all_results)}</p>
         </div>
-        """
-        
+        """)
+
         # Task-specific analysis
-        for task_name, results_df in all_results.items():
-            html += self._create_task_section(task_name, results_df)
-        
+        for task_name, source in all_results.items():
+            self._write_task_section(f, task_name, source, aggregator,
+                                     task_stats[task_name], charts.get(task_name))
+
         # Overall comparison
-        html += self._create_comparison_section(all_results)
-        
-        html += "</body></html>"
-        return html
-    
-    def _create_task_section(self, task_name: str, results_df: pd.DataFrame) -> str:
-        """Görev-spesifik bölüm oluştur"""
-        section = f"""
+        self._write_comparison_section(f, aggregator, task_stats)
+
+        f.write(f"<script>{PAGER_SCRIPT}</script>\n</body></html>\n")
+
+    def _write_task_section(self, f: TextIO, task_name: str, source: ResultSource,
+                            aggregator: ResultAggregator, stats: Optional[pd.DataFrame],
+                            chart: Optional[Future]) -> None:
+        """Görev-spesifik bölümü yaz"""
+        f.write(f"""
         <div class="task-section">
-            <h2>{task_name.replace('_', ' ').title()}</h2>
-        """
-        
-        if 'Accuracy' in results_df.columns:
+            <h2>{html.escape(task_name.replace('_', ' ').title())}</h2>
+        """)
+
+        if stats is not None:
             # Performance metrics
-            avg_accuracy = results_df['Accuracy'].mean()
-            best_strategy = results_df.groupby('Prompt Type')['Accuracy'].mean().idxmax()
-            
-            section += f"""
-            <div class="metric">Average Accuracy: <strong>{avg_accuracy:.3f}</strong></div>
-            <div class="metric">Best Strategy: <strong>{best_strategy}</strong></div>
-            <div class="metric">Total Tests: <strong>{len(results_df)}</strong></div>
-            """
-            
+            f.write(f"""
+            <div class="metric">Average Accuracy: <strong>{aggregator.overall(task_name).value:.3f}</strong></div>
+            <div class="metric">Best Strategy: <strong>{html.escape(_best_strategy(aggregator, task_name))}</strong></div>
+            <div class="metric">Total Tests: <strong>{aggregator.rows(task_name)}</strong></div>
+            """)
+
             # Strategy comparison table
-            strategy_stats = results_df.groupby('Prompt Type')['Accuracy'].agg(['mean', 'std', 'count'])
-            section += "<h3>Strategy Performance</h3>"
-            section += strategy_stats.to_html(classes="strategy-table")
-        
-        section += "</div>"
-        return section
-    
-    def _create_comparison_section(self, all_results: Dict[str, pd.DataFrame]) -> str:
+            f.write("<h3>Strategy Performance</h3>")
+            f.write(stats.to_html(classes="strategy-table"))
+
+            if chart is not None:
+                self._write_chart(f, task_name, chart)
+
+        total_rows = len(source) if isinstance(source, pd.DataFrame) else aggregator.rows(task_name)
+        self._write_results_table(f, task_name, source, total_rows)
+        f.write("</div>\n")
+
+    def _write_chart(self, f: TextIO, task_name: str, chart: Future) -> None:
+        """İşçi süreçte çizilen grafiği göm"""
+        try:
+            image = chart.result()
+        except Exception as e:
+            print(f"Warning: Could not render chart for {task_name}: {e}")
+            return
+        f.write(f'<div class="chart"><img alt="Strategy comparison" src="data:image/png;base64,{image}"></div>\n')
+
+    def _write_results_table(self, f: TextIO, task_name: str, source: ResultSource, total_rows: int) -> None:
+        """Sonuç satırlarını sayfalı tablo olarak yaz (ilk max_detail_rows satır)"""
+        shown_rows = total_rows if self.max_detail_rows is None else min(total_rows, self.max_detail_rows)
+        if shown_rows == 0:
+            return
+
+        # Satırlar sayfa boyutunun katı olan bloklar halinde dönüştürülür; pandas
+        # çağrı maliyeti sayfa başına değil blok başına ödenir
+        pages_per_block = max(1, CONVERSION_BLOCK_ROWS // self.rows_per_page)
+        block_rows = pages_per_block * self.rows_per_page
+        written = 0
+        for block in self._iter_blocks(source, block_rows):
+            if written == 0:
+                self._write_table_header(f, task_name, block.columns, shown_rows, total_rows)
+            block = block.iloc[:shown_rows - written]
+            rows = block.astype(object).where(block.notna(), None).values.tolist()
+            for start in range(0, len(rows), self.rows_per_page):
+                # </script> dizisi sayfa bloğunu erken kapatmasın
+                payload = json.dumps(rows[start:start + self.rows_per_page], ensure_ascii=False,
+                                     default=str).replace("</", "<\\/")
+                f.write(f'<script type="application/json" class="report-page">{payload}</script>\n')
+            written += len(rows)
+            if written >= shown_rows:
+                break
+        if written:
+            f.write("</div>\n")
+
+    def _write_table_header(self, f: TextIO, task_name: str, columns: pd.Index,
+                            shown_rows: int, total_rows: int) -> None:
+        """Sonuç tablosunun başlığını ve sayfalama düğmelerini yaz"""
+        f.write(f'<h3>Results</h3>\n<div class="results-table" id="results-{html.escape(task_name)}">\n')
+        if shown_rows < total_rows:
+            f.write(f"<p>Showing first {shown_rows} of {total_rows} rows.</p>\n")
+        f.write('<div class="pager"><button class="prev">&laquo; Prev</button>'
+                '<button class="next">Next &raquo;</button><span class="page-label"></span></div>\n')
+        header = "".join(f"<th>{html.escape(str(column))}</th>" for column in columns)
+        f.write(f"<table><thead><tr>{header}</tr></thead><tbody></tbody></table>\n")
+
+    def _write_comparison_section(self, f: TextIO, aggregator: ResultAggregator,
+                                  task_stats: Dict[str, Optional[pd.DataFrame]]) -> None:
         """Karşılaştırma bölümü"""
-        section = """
+        f.write("""
         <div class="task-section">
             <h2>Cross-Task Analysis</h2>
-        """
-        
-        # Task performance summary
-        task_summary = {}
-        for task_name, results_df in all_results.items():
-            if 'Accuracy' in results_df.columns:
-                task_summary[task_name] = {
-                    'avg_accuracy': results_df['Accuracy'].mean(),
-                    'total_tests': len(results_df),
-                    'best_strategy': results_df.groupby('Prompt Type')['Accuracy'].mean().idxmax()
-                }
-        
-        section += "<h3>Task Performance Summary</h3><table>"
-        section += "<tr><th>Task</th><th>Avg Accuracy</th><th>Total Tests</th><th>Best Strategy</th></tr>"
-        
-        for task, stats in task_summary.items():
-            section += f"""
+        """)
+
+        f.write("<h3>Task Performance Summary</h3><table>")
+        f.write("<tr><th>Task</th><th>Avg Accuracy</th><th>Total Tests</th><th>Best Strategy</th></tr>")
+
+        for task, stats in task_stats.items():
+            if stats is None:
+                continue
+            f.write(f"""
             <tr>
-                <td>{task.replace('_', ' ').title()}</td>
-                <td>{stats['avg_accuracy']:.3f}</td>
-                <td>{stats['total_tests']}</td>
-                <td>{stats['best_strategy']}</td>
+                <td>{html.escape(task.replace('_', ' ').title())}</td>
+                <td>{aggregator.overall(task).value:.3f}</td>
+                <td>{aggregator.rows(task)}</td>
+                <td>{html.escape(_best_strategy(aggregator, task))}</td>
             </tr>
-            """
-        
-        section += "</table></div>"
-        return section
\ No newline at end of file
+            """)
+
+        f.write("</table></div>\n")
+
+
+def _strategy_stats(aggregator: ResultAggregator, task_name: str) -> Optional[pd.DataFrame]:
+    """Strateji başına doğruluk özeti (görevin doğruluk verisi yoksa None)"""
+    if task_name not in aggregator.tasks():
+        return None
+    table = aggregator.strategy_table(task_name, by=("Prompt Type",))
+    return table.set_index("Prompt Type")[['mean', 'std', 'count']]
+
+
+def _best_strategy(aggregator: ResultAggregator, task_name: str) -> str:
+    best = aggregator.best_strategy(task_name)
+    return str(best) if best is not None else "-"
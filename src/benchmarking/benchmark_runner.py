@@ -1,83 +1,330 @@
+import gc
+import json
+import platform
+import shutil
+import tempfile
 import time
-import psutil
+import tracemalloc
 import pandas as pd
-from typing import Dict, List, Any
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
-import gc
+
+from ..core.response_cache import ResponseCache
+
+BENCHMARK_FORMAT_VERSION = 1
+PHASES = ("prompt", "model", "scoring", "io")
+CACHE_MODES = ("cold", "warm")
+# Regresyon karşılaştırması için saklanan en fazla gecikme örneği (mod başına)
+MAX_LATENCY_SAMPLES = 2000
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Doğrusal enterpolasyonlu yüzdelik (numpy.percentile varsayılanı ile aynı)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    """Saniye cinsinden gecikmelerden milisaniye özet istatistikleri"""
+    millis = [value * 1000.0 for value in latencies]
+    return {
+        "count": len(millis),
+        "mean": sum(millis) / len(millis) if millis else 0.0,
+        "p50": percentile(millis, 50),
+        "p95": percentile(millis, 95),
+        "p99": percentile(millis, 99),
+        "max": max(millis) if millis else 0.0
+    }
+
+
+def thin_samples(values: List[float], limit: int = MAX_LATENCY_SAMPLES) -> List[float]:
+    """Sıralı örneklerden eşit aralıklı en fazla limit kadarını seç (dağılım korunur)"""
+    ordered = sorted(values)
+    if len(ordered) <= limit:
+        return ordered
+    step = (len(ordered) - 1) / (limit - 1)
+    return [ordered[round(i * step)] for i in range(limit)]
+
+
+class _RunProbe:
+    """Tek bir ölçüm çalıştırması boyunca aşama sürelerini ve istek gecikmelerini toplar"""
+
+    def __init__(self):
+        self.phases = {phase: 0.0 for phase in PHASES}
+        self.latencies: List[float] = []
+        self._patched: List[tuple] = []
+
+    def time_phase(self, owner: Any, attribute: str, phase: str) -> None:
+        """owner.attribute çağrılarının süresini phase aşamasına ekle"""
+        original = getattr(owner, attribute)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.phases[phase] += time.perf_counter() - start
+
+        self._patch(owner, attribute, timed)
+
+    def time_requests(self, owner: Any, attribute: str) -> None:
+        """Her model çağrısının gecikmesini kaydet (thread havuzundan da çağrılabilir)"""
+        original = getattr(owner, attribute)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+
+        self._patch(owner, attribute, timed)
+
+    def time_sink(self, owner: Any, attribute: str) -> None:
+        """Açılan sink'in okuma/kapatma çağrılarını da io aşamasına ekle"""
+        original = getattr(owner, attribute)
+
+        def opened(*args, **kwargs):
+            sink = original(*args, **kwargs)
+            for method in ("read_dataframe", "close"):
+                self.time_phase(sink, method, "io")
+            return sink
+
+        self._patch(owner, attribute, opened)
+
+    def _patch(self, owner: Any, attribute: str, replacement: Callable) -> None:
+        had_instance_attribute = attribute in vars(owner)
+        self._patched.append((owner, attribute, had_instance_attribute, vars(owner).get(attribute)))
+        setattr(owner, attribute, replacement)
+
+    def restore(self) -> None:
+        for owner, attribute, had_instance_attribute, previous in reversed(self._patched):
+            if had_instance_attribute:
+                setattr(owner, attribute, previous)
+            else:
+                delattr(owner, attribute)
+        self._patched.clear()
+
 
 class BenchmarkRunner:
-    def __init__(self, experiment_runner):
+    """Görevleri soğuk/ılık önbellekle tekrar tekrar çalıştırıp ölçen benchmark paketi.
+
+    Her çalıştırma için istek başına gecikme yüzdelikleri (p50/p95/p99),
+    verim (istek/sn), prompt/model/puanlama/io aşama süreleri, tracemalloc
+    tepe belleği ve önbellek isabetleri kaydedilir. Ölçüm süresince model
+    yöneticisine geçici bir önbellek takılır (yapılandırılmış önbellek hiç
+    temizlenmez); soğuk çalıştırmadan önce geçici önbellek temizlenir, ılık
+    çalıştırma aynı birimleri dolu önbellekle tekrarlar.
+    """
+
+    def __init__(self, experiment_runner, trace_memory: bool = True):
         self.experiment_runner = experiment_runner
-        self.benchmark_results = []
-    
-    def run_performance_benchmark(self, task_name: str, iterations: int = 3) -> Dict[str, Any]:
+        self.trace_memory = trace_memory
+        self.benchmark_results: List[Dict[str, Any]] = []
+
+    def run_performance_benchmark(self, task_name: str, iterations: int = 3,
+                                  strategies: Optional[List[str]] = None) -> Dict[str, Any]:
         """Performans benchmark'ı çalıştır"""
         results = {
             'task_name': task_name,
             'iterations': iterations,
-            'execution_times': [],
-            'memory_usage_mb': [],
-            'timestamp': datetime.now().isoformat()
+            'strategies': strategies,
+            'timestamp': datetime.now().isoformat(),
+            'runs': []
         }
-        
-        for i in range(iterations):
-            print(f"Benchmark iteration {i+1}/{iterations} for {task_name}")
-            
-            # Memory temizle
-            gc.collect()
-            
-            # Başlangıç ölçümleri
-            start_time = time.time()
-            process = psutil.Process()
-            start_memory = process.memory_info().rss / 1024 / 1024  # MB
-            
-            # Task çalıştır
-            try:
-                _ = self.experiment_runner.run_single_task(task_name)
-                success = True
-            except Exception as e:
-                print(f"Benchmark iteration {i+1} failed: {e}")
-                success = False
-            
-            # Bitiş ölçümleri
-            end_time = time.time()
-            end_memory = process.memory_info().rss / 1024 / 1024
-            
-            if success:
-                execution_time = end_time - start_time
-                memory_delta = end_memory - start_memory
-                
-                results['execution_times'].append(execution_time)
-                results['memory_usage_mb'].append(max(0, memory_delta))  # Negatif değerleri önle
-                
-                print(f"  Execution time: {execution_time:.2f}s")
-                print(f"  Memory delta: {memory_delta:.2f}MB")
-        
-        # İstatistikler
-        if results['execution_times']:
-            results['avg_execution_time'] = sum(results['execution_times']) / len(results['execution_times'])
-            results['avg_memory_usage'] = sum(results['memory_usage_mb']) / len(results['memory_usage_mb'])
-            results['min_execution_time'] = min(results['execution_times'])
-            results['max_execution_time'] = max(results['execution_times'])
-        
+        latencies: Dict[str, List[float]] = {mode: [] for mode in CACHE_MODES}
+
+        with self._benchmark_cache() as cache:
+            for i in range(iterations):
+                for mode in CACHE_MODES:
+                    print(f"Benchmark iteration {i+1}/{iterations} ({mode} cache) for {task_name}")
+                    if mode == "cold":
+                        cache.clear()
+                    run, run_latencies = self._measure_run(task_name, strategies, cache)
+                    run.update({'iteration': i + 1, 'mode': mode})
+                    latencies[mode].extend(run_latencies)
+                    results['runs'].append(run)
+
+                    print(f"  Wall time: {run['wall_seconds']:.3f}s, "
+                          f"p95 latency: {run['latency_ms']['p95']:.2f}ms, "
+                          f"throughput: {run['throughput_rps']:.1f} req/s")
+
+        results['summary'] = self._summarize(results['runs'], latencies)
         self.benchmark_results.append(results)
         return results
-    
+
+    def _measure_run(self, task_name: str, strategies: Optional[List[str]],
+                     cache: ResponseCache) -> Tuple[Dict[str, Any], List[float]]:
+        """Görevi bir kez çalıştır; ölçümleri ve istek gecikmelerini döndür"""
+        runner = self.experiment_runner
+        task = runner.get_task(task_name)
+        probe = _RunProbe()
+        probe.time_phase(task, "_build_prompt", "prompt")
+        probe.time_phase(task, "_generate_responses", "model")
+        probe.time_phase(task, "_score_responses", "scoring")
+        probe.time_phase(task, "_store_results", "io")
+        probe.time_phase(runner.data_handler, "save_results", "io")
+        probe.time_sink(runner.data_handler, "open_result_sink")
+        # Görevler yanıtları token kullanımıyla birlikte generate_with_usage üzerinden alır
+        request_method = "generate_with_usage" if hasattr(runner.model_manager, "generate_with_usage") else "generate"
+        probe.time_requests(runner.model_manager, request_method)
+
+        hits_before, misses_before = cache.hits, cache.misses
+        gc.collect()
+        # Dışarıda zaten açık bir tracemalloc oturumu varsa kapatılmaz
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        baseline_bytes = 0
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline_bytes = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        try:
+            results_df = runner.run_single_task(task_name, strategies)
+        finally:
+            wall_seconds = time.perf_counter() - start
+            peak_bytes = 0
+            if self.trace_memory:
+                peak_bytes = tracemalloc.get_traced_memory()[1] - baseline_bytes
+            if started_tracing:
+                tracemalloc.stop()
+            probe.restore()
+
+        phases = dict(probe.phases)
+        phases["other"] = max(0.0, wall_seconds - sum(phases.values()))
+        return {
+            'wall_seconds': wall_seconds,
+            'requests': len(probe.latencies),
+            'results': len(results_df),
+            'throughput_rps': len(probe.latencies) / wall_seconds if wall_seconds > 0 else 0.0,
+            'latency_ms': latency_summary(probe.latencies),
+            'phases_seconds': phases,
+            'peak_memory_mb': peak_bytes / 1024 / 1024,
+            'cache': {'hits': cache.hits - hits_before, 'misses': cache.misses - misses_before}
+        }, probe.latencies
+
+    @contextmanager
+    def _benchmark_cache(self) -> Iterator[ResponseCache]:
+        """Ölçüm boyunca kullanılacak geçici önbellek; ilerleme günlüğü devre dışı bırakılır.
+
+        Kullanıcının önbelleği (ücretli API yanıtları) soğuk çalıştırmalar için
+        temizlenmemeli; bu yüzden her zaman geçici bir önbellek takılır ve
+        sonunda özgün önbellek geri yüklenir.
+        """
+        runner = self.experiment_runner
+        model_manager = runner.model_manager
+        # Günlük açıkken ılık çalıştırma tamamlanmış birimleri atlayıp hiç iş yapmazdı
+        journal, runner.journal = runner.journal, None
+
+        original_cache = model_manager.cache
+        temp_dir = tempfile.mkdtemp(prefix="benchmark_cache_")
+        model_manager.cache = ResponseCache(temp_dir)
+        try:
+            yield model_manager.cache
+        finally:
+            runner.journal = journal
+            model_manager.cache.close()
+            model_manager.cache = original_cache
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _summarize(self, runs: List[Dict[str, Any]],
+                   latencies: Dict[str, List[float]]) -> Dict[str, Any]:
+        """Çalıştırmaları önbellek moduna göre birleştir; yüzdelikler tüm isteklerden hesaplanır"""
+        summary: Dict[str, Any] = {}
+        for mode in CACHE_MODES:
+            mode_runs = [run for run in runs if run['mode'] == mode]
+            if not mode_runs:
+                continue
+            wall_times = [run['wall_seconds'] for run in mode_runs]
+            requests = sum(run['requests'] for run in mode_runs)
+            summary[mode] = {
+                'runs': len(mode_runs),
+                'requests': requests,
+                'wall_seconds': {'mean': sum(wall_times) / len(wall_times),
+                                 'min': min(wall_times), 'max': max(wall_times)},
+                'throughput_rps': requests / sum(wall_times) if sum(wall_times) > 0 else 0.0,
+                'latency_ms': latency_summary(latencies[mode]),
+                'latency_samples_ms': [value * 1000.0 for value in thin_samples(latencies[mode])],
+                'phases_seconds': {phase: sum(run['phases_seconds'][phase] for run in mode_runs) / len(mode_runs)
+                                   for phase in PHASES + ("other",)},
+                'peak_memory_mb': max(run['peak_memory_mb'] for run in mode_runs),
+                'cache_hit_rate': self._hit_rate(mode_runs)
+            }
+
+        if 'cold' in summary and 'warm' in summary:
+            warm_wall = summary['warm']['wall_seconds']['mean']
+            summary['warm_speedup'] = (summary['cold']['wall_seconds']['mean'] / warm_wall
+                                       if warm_wall > 0 else None)
+        return summary
+
+    @staticmethod
+    def _hit_rate(runs: List[Dict[str, Any]]) -> float:
+        hits = sum(run['cache']['hits'] for run in runs)
+        lookups = hits + sum(run['cache']['misses'] for run in runs)
+        return hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Makine tarafından okunabilir benchmark çıktısı"""
+        config = self.experiment_runner.config
+        return {
+            'format_version': BENCHMARK_FORMAT_VERSION,
+            'timestamp': datetime.now().isoformat(),
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'trace_memory': self.trace_memory
+            },
+            'config': {
+                'model': config.model_name,
+                'backend': config.get('model.backend', 'gemini'),
+                'mock_mode': config.get('model.mock_mode', False),
+                'parallel_processing': config.get('advanced_features.parallel_processing', False),
+                'max_workers': config.get('advanced_features.max_workers', 8),
+                'batch_size': config.get('advanced_features.batch_size', 32),
+                'result_sink': config.get('evaluation.result_sink', 'csv')
+            },
+            'tasks': self.benchmark_results
+        }
+
+    def save_json(self, filepath: str) -> str:
+        """Benchmark çıktısını JSON dosyasına yaz"""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=4)
+        return filepath
+
     def generate_benchmark_report(self) -> pd.DataFrame:
         """Benchmark raporu oluştur"""
         if not self.benchmark_results:
             return pd.DataFrame()
-        
+
         report_data = []
         for result in self.benchmark_results:
-            report_data.append({
-                'Task': result['task_name'],
-                'Iterations': result['iterations'],
-                'Avg Time (s)': f"{result.get('avg_execution_time', 0):.2f}",
-                'Min Time (s)': f"{result.get('min_execution_time', 0):.2f}",
-                'Max Time (s)': f"{result.get('max_execution_time', 0):.2f}",
-                'Avg Memory (MB)': f"{result.get('avg_memory_usage', 0):.2f}",
-                'Timestamp': result['timestamp']
-            })
-        
-        return pd.DataFrame(report_data)
\ No newline at end of file
+            for mode, summary in result['summary'].items():
+                if mode not in CACHE_MODES:
+                    continue
+                report_data.append({
+                    'Task': result['task_name'],
+                    'Cache': mode,
+                    'Runs': summary['runs'],
+                    'Requests': summary['requests'],
+                    'Avg Time (s)': f"{summary['wall_seconds']['mean']:.3f}",
+                    'Throughput (req/s)': f"{summary['throughput_rps']:.1f}",
+                    'p50 (ms)': f"{summary['latency_ms']['p50']:.2f}",
+                    'p95 (ms)': f"{summary['latency_ms']['p95']:.2f}",
+                    'p99 (ms)': f"{summary['latency_ms']['p99']:.2f}",
+                    'Model (s)': f"{summary['phases_seconds']['model']:.3f}",
+                    'Scoring (s)': f"{summary['phases_seconds']['scoring']:.3f}",
+                    'IO (s)': f"{summary['phases_seconds']['io']:.3f}",
+                    'Peak Memory (MB)': f"{summary['peak_memory_mb']:.2f}",
+                    'Cache Hit Rate': f"{summary['cache_hit_rate']:.1%}"
+                })
+
+        return pd.DataFrame(report_data)
@@ -0,0 +1,283 @@
+import json
+import math
+import os
+import re
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Karşılaştırılan metrikler: (ad, örnek kaynağı, istatistik, eşik türü)
+METRICS = (
+    ("latency_p50_ms", "latency", "p50", "latency"),
+    ("latency_p95_ms", "latency", "p95", "latency"),
+    ("wall_seconds", "wall", "mean", "latency"),
+    ("peak_memory_mb", "memory", "mean", "memory"),
+)
+
+_BASELINE_NAME = re.compile(r'^[A-Za-z0-9_.-]+$')
+
+
+def validate_baseline_name(name: str) -> None:
+    """Baseline adı dosya adı olarak güvenli değilse ValueError fırlat"""
+    if not _BASELINE_NAME.match(name):
+        raise ValueError(f"Invalid baseline name: {name!r} (use letters, digits, '.', '_' or '-')")
+
+
+def bootstrap_diff_ci(baseline: List[float], current: List[float], statistic: str = "mean",
+                      n_resamples: int = 1000, confidence: float = 0.95,
+                      seed: int = 0) -> Tuple[float, float]:
+    """statistic(current) - statistic(baseline) farkı için yüzdelik bootstrap güven aralığı.
+
+    statistic: "mean" ya da "p50"/"p95"/"p99" gibi bir yüzdelik.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    baseline_values = np.asarray(baseline, dtype=float)
+    current_values = np.asarray(current, dtype=float)
+
+    def resampled(values, size):
+        indices = rng.integers(0, len(values), size=(size, len(values)))
+        samples = values[indices]
+        if statistic == "mean":
+            return samples.mean(axis=1)
+        return np.percentile(samples, float(statistic.lstrip("p")), axis=1)
+
+    # Büyük örneklerde bellek kullanımını sınırlamak için bloklar halinde
+    differences = []
+    remaining = n_resamples
+    while remaining > 0:
+        size = min(250, remaining)
+        differences.append(resampled(current_values, size) - resampled(baseline_values, size))
+        remaining -= size
+    differences = np.concatenate(differences)
+
+    alpha = (1.0 - confidence) / 2.0
+    return float(np.quantile(differences, alpha)), float(np.quantile(differences, 1.0 - alpha))
+
+
+@dataclass
+class MetricComparison:
+    task: str
+    mode: str
+    metric: str
+    baseline: float
+    current: float
+    change_pct: float
+    ci_low: float
+    ci_high: float
+    threshold_pct: float
+    significant: bool
+    regressed: bool
+    # Örnek sayısı anlamlılık için yetersiz (ör. tek iterasyonluk süre/bellek)
+    inconclusive: bool = False
+
+
+@dataclass
+class BenchmarkComparison:
+    baseline_name: str
+    confidence: float
+    rows: List[MetricComparison] = field(default_factory=list)
+    missing_tasks: List[str] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> List[MetricComparison]:
+        return [row for row in self.rows if row.regressed]
+
+    @property
+    def has_regressions(self) -> bool:
+        return any(row.regressed for row in self.rows)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "baseline": self.baseline_name,
+            "confidence": self.confidence,
+            "has_regressions": self.has_regressions,
+            "missing_tasks": self.missing_tasks,
+            "metrics": [asdict(row) for row in self.rows]
+        }
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        return pd.DataFrame([{
+            'Task': row.task,
+            'Cache': row.mode,
+            'Metric': row.metric,
+            'Baseline': f"{row.baseline:.3f}",
+            'Current': f"{row.current:.3f}",
+            'Change': f"{row.change_pct:+.1f}%",
+            f'{self.confidence:.0%} CI (diff)': "-" if row.inconclusive else f"[{row.ci_low:+.3f}, {row.ci_high:+.3f}]",
+            'Status': _status(row)
+        } for row in self.rows])
+
+
+def _status(row: MetricComparison) -> str:
+    if row.regressed:
+        return "REGRESSION"
+    if row.inconclusive:
+        return "inconclusive"
+    return "significant" if row.significant else "ok"
+
+
+class BenchmarkHistory:
+    """Benchmark çıktılarını saklayan geçmiş deposu ve adlandırılmış baseline'lar.
+
+    Her kayıt history.jsonl dosyasına eklenir; baseline'lar geçmiş
+    temizlense bile korunmaları için baselines/<ad>.json olarak ayrıca yazılır.
+    """
+
+    def __init__(self, history_dir: str = "data/benchmarks"):
+        self.history_dir = history_dir
+        self.history_path = os.path.join(history_dir, "history.jsonl")
+        self.baseline_dir = os.path.join(history_dir, "baselines")
+        os.makedirs(self.baseline_dir, exist_ok=True)
+
+    def record(self, report: Dict[str, Any], label: Optional[str] = None) -> str:
+        """BenchmarkRunner.to_dict() çıktısını geçmişe ekle ve kayıt kimliğini döndür"""
+        entry_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        entry = {"id": entry_id, "recorded_at": datetime.now().isoformat(),
+                 "label": label, "report": report}
+        with open(self.history_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return entry_id
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Geçmiş kayıtlarını eskiden yeniye döndür"""
+        if not os.path.exists(self.history_path):
+            return
+        with open(self.history_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Yazılırken kesilmiş son satır
+                    continue
+
+    def get(self, entry_id: str) -> Dict[str, Any]:
+        for entry in self.entries():
+            if entry["id"] == entry_id:
+                return entry
+        raise ValueError(f"Benchmark entry '{entry_id}' not found in {self.history_path}")
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        latest = None
+        for latest in self.entries():
+            pass
+        return latest
+
+    def set_baseline(self, name: str, entry_id: Optional[str] = None) -> str:
+        """Kaydı (varsayılan: en son kayıt) name adıyla baseline olarak işaretle"""
+        validate_baseline_name(name)
+        entry = self.get(entry_id) if entry_id else self.latest()
+        if entry is None:
+            raise ValueError("No benchmark entries recorded yet")
+
+        path = os.path.join(self.baseline_dir, f"{name}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"name": name, "set_at": datetime.now().isoformat(), "entry": entry},
+                      f, ensure_ascii=False, indent=4)
+        return path
+
+    def baseline(self, name: str) -> Dict[str, Any]:
+        path = os.path.join(self.baseline_dir, f"{name}.json")
+        if not os.path.exists(path):
+            raise ValueError(f"Baseline '{name}' not found. Available baselines: {self.list_baselines()}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)["entry"]
+
+    def list_baselines(self) -> List[str]:
+        return sorted(name[:-5] for name in os.listdir(self.baseline_dir) if name.endswith(".json"))
+
+    def compare(self, report: Dict[str, Any], baseline_name: str, latency_threshold: float = 0.10,
+                memory_threshold: float = 0.10, confidence: float = 0.95,
+                n_resamples: int = 1000, seed: int = 0, min_samples: int = 2,
+                min_latency_delta_ms: float = 5.0, min_memory_delta_mb: float = 1.0) -> BenchmarkComparison:
+        """Benchmark çıktısını baseline ile karşılaştır.
+
+        Bir metrik, göreli artışı eşiği aştığında, mutlak artışı taban değeri
+        (gecikme/süre için min_latency_delta_ms, bellek için
+        min_memory_delta_mb) geçtiğinde ve farkın güven aralığı tamamen sıfırın
+        üstünde olduğunda (anlamlı artış) regresyon sayılır. Taraflardan biri
+        min_samples'tan (en az 2) az örnek içeriyorsa metrik sonuçsuz sayılır.
+        """
+        baseline_tasks = {task["task_name"]: task for task in self.baseline(baseline_name)["report"]["tasks"]}
+        comparison = BenchmarkComparison(baseline_name, confidence)
+
+        for task in report["tasks"]:
+            baseline_task = baseline_tasks.get(task["task_name"])
+            if baseline_task is None:
+                comparison.missing_tasks.append(task["task_name"])
+                continue
+
+            for mode, summary in task["summary"].items():
+                baseline_summary = baseline_task["summary"].get(mode)
+                if not isinstance(summary, dict) or not isinstance(baseline_summary, dict):
+                    continue
+
+                for metric, source, statistic, threshold_kind in METRICS:
+                    current_samples = _samples(task, mode, source)
+                    baseline_samples = _samples(baseline_task, mode, source)
+                    if not current_samples or not baseline_samples:
+                        continue
+
+                    if threshold_kind == "memory":
+                        threshold, min_delta = memory_threshold, min_memory_delta_mb
+                    else:
+                        threshold = latency_threshold
+                        min_delta = min_latency_delta_ms / 1000.0 if metric.endswith("_seconds") \
+                            else min_latency_delta_ms
+                    comparison.rows.append(_compare_metric(
+                        task["task_name"], mode, metric, statistic, baseline_samples, current_samples,
+                        threshold, min_delta, max(2, min_samples), confidence, n_resamples, seed
+                    ))
+        return comparison
+
+
+def _samples(task: Dict[str, Any], mode: str, source: str) -> List[float]:
+    """Görev çıktısından metrik örneklerini çıkar"""
+    if source == "latency":
+        return task["summary"][mode].get("latency_samples_ms", [])
+    runs = [run for run in task["runs"] if run["mode"] == mode]
+    if source == "wall":
+        return [run["wall_seconds"] for run in runs]
+    return [run["peak_memory_mb"] for run in runs]
+
+
+def _statistic(values: List[float], statistic: str) -> float:
+    import numpy as np
+
+    if statistic == "mean":
+        return float(np.mean(values))
+    return float(np.percentile(values, float(statistic.lstrip("p"))))
+
+
+def _compare_metric(task: str, mode: str, metric: str, statistic: str, baseline_samples: List[float],
+                    current_samples: List[float], threshold: float, min_delta: float, min_samples: int,
+                    confidence: float, n_resamples: int, seed: int) -> MetricComparison:
+    baseline_value = _statistic(baseline_samples, statistic)
+    current_value = _statistic(current_samples, statistic)
+    change = (current_value - baseline_value) / baseline_value if baseline_value > 0 else 0.0
+    result = MetricComparison(
+        task=task, mode=mode, metric=metric,
+        baseline=baseline_value, current=current_value,
+        change_pct=change * 100.0, ci_low=math.nan, ci_high=math.nan,
+        threshold_pct=threshold * 100.0, significant=False, regressed=False
+    )
+    # Tek örnekte bootstrap aralığı tek noktaya çöker; her fark "anlamlı" görünür
+    if min(len(baseline_samples), len(current_samples)) < min_samples:
+        result.inconclusive = True
+        return result
+
+    result.ci_low, result.ci_high = bootstrap_diff_ci(baseline_samples, current_samples, statistic,
+                                                      n_resamples, confidence, seed)
+    result.significant = result.ci_low > 0 or result.ci_high < 0
+    result.regressed = change > threshold and current_value - baseline_value > min_delta and result.ci_low > 0
+    return result
@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Elemanları en fazla size uzunluğunda listeler halinde ver"""
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(generate_fn: Callable[[str], str], prompts: Sequence[str],
+              chunk_size: int = 32, max_workers: int = 1,
+              return_exceptions: bool = False) -> List[Any]:
+    """Prompt listesini tekilleştirip parçalar halinde üret, sonuçları girdi sırasına eşle.
+
+    Aynı prompt yalnızca bir kez gönderilir. max_workers > 1 ise her parça
+    içindeki çağrılar thread havuzunda paralel yürütülür. return_exceptions=True
+    ise başarısız prompt'ların yerine exception nesnesi döner.
+    """
+    unique_prompts = list(dict.fromkeys(prompts))
+    responses = {}
+
+    def call(prompt: str) -> Any:
+        try:
+            return generate_fn(prompt)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return e
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk in chunked(unique_prompts, chunk_size):
+                responses.update(zip(chunk, executor.map(call, chunk)))
+    else:
+        for chunk in chunked(unique_prompts, chunk_size):
+            responses.update((prompt, call(prompt)) for prompt in chunk)
+
+    return [responses[prompt] for prompt in prompts]
@@ -32,4 +32,8 @@ class Config:
     
     @property
     def temperature(self) -> float:
-        return self.get('model.temperature', 0.1)
\ No newline at end of file
+        return self.get('model.temperature', 0.1)
+    
+    @property
+    def max_tokens(self) -> int:
+        return self.get('model.max_tokens', 2048)
\ No newline at end of file
@@ -0,0 +1,72 @@
+import asyncio
+import json
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Optional
+
+from .mock_backend import MockResponse, UsageMetadata
+
+
+class GeminiRestClient:
+    """Gemini generateContent REST uç noktası için bağımlılıksız istemci.
+
+    SDK yerine doğrudan HTTP kullanır; base_url ile yerel MockGeminiServer'a
+    yönlendirilebilir. Hatalar, rate limit tespiti için HTTP durum kodunu içeren
+    RuntimeError olarak yükseltilir.
+    """
+
+    def __init__(self, base_url: str, model_name: str, api_key: Optional[str] = None,
+                 generation_config: Optional[Dict[str, Any]] = None, timeout: float = 60.0):
+        self.base_url = base_url.rstrip("/")
+        self.model_name = model_name
+        self.api_key = api_key
+        self.generation_config = generation_config or {}
+        self.timeout = timeout
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.base_url}/v1beta/models/{self.model_name}:generateContent"
+
+    def generate_content(self, prompt: str) -> MockResponse:
+        body = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        if self.generation_config:
+            body["generationConfig"] = {
+                "temperature": self.generation_config.get("temperature"),
+                "maxOutputTokens": self.generation_config.get("max_output_tokens")
+            }
+        request = urllib.request.Request(
+            self.endpoint, data=json.dumps(body).encode("utf-8"), method="POST",
+            headers={"Content-Type": "application/json"}
+        )
+        if self.api_key:
+            request.add_header("x-goog-api-key", self.api_key)
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(self._error_message(e)) from None
+
+        parts = payload["candidates"][0]["content"]["parts"]
+        usage = payload.get("usageMetadata", {})
+        return MockResponse(
+            "".join(part.get("text", "") for part in parts),
+            UsageMetadata(usage.get("promptTokenCount", 0), usage.get("candidatesTokenCount", 0),
+                          usage.get("totalTokenCount", 0))
+        )
+
+    async def generate_content_async(self, prompt: str) -> MockResponse:
+        # urllib engelleyici olduğu için çağrı thread havuzunda çalıştırılır
+        return await asyncio.to_thread(self.generate_content, prompt)
+
+    @staticmethod
+    def _error_message(error: urllib.error.HTTPError) -> str:
+        message = error.reason
+        try:
+            message = json.loads(error.read())["error"]["message"]
+        except (ValueError, KeyError, TypeError):
+            pass
+        retry_after = error.headers.get("Retry-After")
+        if retry_after and "retry after" not in str(message).lower():
+            message = f"{message} (retry after {retry_after}s)"
+        return f"{error.code} {message}"
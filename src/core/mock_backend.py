@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .rate_limiter import estimate_tokens
+
+# Yanıt metni bu kelimelerden üretilir (her kelime ~1 token)
+_VOCABULARY = (
+    "model", "yanıt", "adım", "sonuç", "değer", "toplam", "fiyat", "metin",
+    "olumlu", "olumsuz", "nötr", "denklem", "çözüm", "veri", "test", "örnek",
+)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+class InjectedError(RuntimeError):
+    """Sahte backend'in kasıtlı olarak ürettiği hata"""
+
+    def __init__(self, status: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+@dataclass
+class UsageMetadata:
+    prompt_token_count: int
+    candidates_token_count: int
+    total_token_count: int
+
+
+@dataclass
+class MockResponse:
+    """google.generativeai yanıtının kullanılan alanlarını taklit eder"""
+    text: str
+    usage_metadata: UsageMetadata
+
+
+class MockBackend:
+    """Gemini modeli yerine geçen, yük testi için deterministik sahte backend.
+
+    Çıktı uzunluğu ve içeriği (seed, prompt) çiftinden türetilir; aynı prompt
+    her çağrıda aynı yanıtı alır. Gecikme ve hata/429 enjeksiyonu ise seed ile
+    başlatılan tek bir RNG'den çekilir, böylece seri çalıştırmalar tekrarlanabilir.
+    generate_content / generate_content_async arayüzü ModelManager'ın gerçek
+    modelden beklediğiyle aynıdır.
+    """
+
+    def __init__(self, seed: int = 0, latency_ms: float = 0.0, latency_distribution: str = "fixed",
+                 latency_jitter_ms: float = 0.0, error_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 retry_after_seconds: Optional[float] = 1.0, min_output_tokens: int = 20,
+                 max_output_tokens: int = 200, responder: Optional[Callable[[str], str]] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {latency_distribution}. "
+                             f"Available: {list(LATENCY_DISTRIBUTIONS)}")
+        if not 0.0 <= error_rate + rate_limit_rate <= 1.0:
+            raise ValueError("error_rate + rate_limit_rate must be between 0 and 1")
+        if min_output_tokens > max_output_tokens:
+            raise ValueError("min_output_tokens must not exceed max_output_tokens")
+
+        self.seed = seed
+        self.latency_ms = latency_ms
+        self.latency_distribution = latency_distribution
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after_seconds = retry_after_seconds
+        self.min_output_tokens = min_output_tokens
+        self.max_output_tokens = max_output_tokens
+        self.responder = responder
+        self._sleep = sleep
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.rate_limited = 0
+
+    @classmethod
+    def from_config(cls, config, responder: Optional[Callable[[str], str]] = None) -> "MockBackend":
+        """model.mock_backend ayarlarından oluştur"""
+        options = config.get('model.mock_backend', {}) or {}
+        return cls(
+            seed=options.get('seed', 0),
+            latency_ms=options.get('latency_ms', 0.0),
+            latency_distribution=options.get('latency_distribution', 'fixed'),
+            latency_jitter_ms=options.get('latency_jitter_ms', 0.0),
+            error_rate=options.get('error_rate', 0.0),
+            rate_limit_rate=options.get('rate_limit_rate', 0.0),
+            retry_after_seconds=options.get('retry_after_seconds', 1.0),
+            min_output_tokens=options.get('min_output_tokens', 20),
+            max_output_tokens=options.get('max_output_tokens', 200),
+            responder=responder if options.get('canned_responses', False) else None
+        )
+
+    def generate_content(self, prompt: str) -> MockResponse:
+        delay, failure = self._next_call()
+        if delay > 0:
+            self._sleep(delay)
+        if failure is not None:
+            raise failure
+        return self.render(prompt)
+
+    async def generate_content_async(self, prompt: str) -> MockResponse:
+        delay, failure = self._next_call()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if failure is not None:
+            raise failure
+        return self.render(prompt)
+
+    def render(self, prompt: str) -> MockResponse:
+        """Prompt için deterministik yanıt üret (gecikme ve hata uygulanmaz)"""
+        prompt_tokens = estimate_tokens(prompt)
+        if self.responder is not None:
+            text = self.responder(prompt)
+            output_tokens = estimate_tokens(text)
+        else:
+            digest = hashlib.sha1(f"{self.seed}:{prompt}".encode("utf-8")).digest()
+            rng = random.Random(digest)
+            output_tokens = rng.randint(self.min_output_tokens, self.max_output_tokens)
+            text = " ".join(rng.choice(_VOCABULARY) for _ in range(output_tokens))
+        return MockResponse(text, UsageMetadata(prompt_tokens, output_tokens, prompt_tokens + output_tokens))
+
+    def _next_call(self):
+        """Bir sonraki çağrının gecikmesini (saniye) ve varsa enjekte edilecek hatayı çek"""
+        with self._lock:
+            self.calls += 1
+            delay = self._sample_latency() / 1000.0
+            draw = self._rng.random()
+            failure = None
+            if draw < self.rate_limit_rate:
+                self.rate_limited += 1
+                hint = ""
+                if self.retry_after_seconds is not None:
+                    hint = f" (retry after {self.retry_after_seconds}s)"
+                failure = InjectedError(429, f"429 Resource exhausted: injected rate limit{hint}",
+                                        self.retry_after_seconds)
+            elif draw < self.rate_limit_rate + self.error_rate:
+                self.errors += 1
+                failure = InjectedError(500, "500 Internal error: injected failure")
+        return delay, failure
+
+    def _sample_latency(self) -> float:
+        mean, jitter = self.latency_ms, self.latency_jitter_ms
+        if mean <= 0:
+            return 0.0
+        if self.latency_distribution == "uniform":
+            return self._rng.uniform(max(0.0, mean - jitter), mean + jitter)
+        if self.latency_distribution == "exponential":
+            return self._rng.expovariate(1.0 / mean)
+        if self.latency_distribution == "lognormal":
+            # jitter standart sapma olarak yorumlanır; ortalama latency_ms olacak şekilde
+            sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2)) if jitter > 0 else 0.0
+            return self._rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+        return mean
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"calls": self.calls, "errors": self.errors, "rate_limited": self.rate_limited}
@@ -0,0 +1,149 @@
+import argparse
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .mock_backend import InjectedError, MockBackend
+
+# Gemini REST uç noktası: POST /v1beta/models/{model}:generateContent
+_GENERATE_PATH = re.compile(r'^/v1beta/models/(?P<model>[^/:]+):generateContent$')
+
+
+class _GeminiHandler(BaseHTTPRequestHandler):
+    server_version = "MockGemini/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        match = _GENERATE_PATH.match(self.path.split("?", 1)[0])
+        if not match:
+            self._send_error(404, f"Unknown path: {self.path}", "NOT_FOUND")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            prompt = "".join(part.get("text", "")
+                             for content in body.get("contents", [])
+                             for part in content.get("parts", []))
+        except (ValueError, AttributeError) as e:
+            self._send_error(400, f"Invalid request body: {e}", "INVALID_ARGUMENT")
+            return
+
+        try:
+            response = self.server.backend.generate_content(prompt)
+        except InjectedError as e:
+            status = "RESOURCE_EXHAUSTED" if e.status == 429 else "INTERNAL"
+            self._send_error(e.status, str(e), status, e.retry_after)
+            return
+
+        usage = response.usage_metadata
+        self._send_json(200, {
+            "candidates": [{
+                "content": {"parts": [{"text": response.text}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0
+            }],
+            "usageMetadata": {
+                "promptTokenCount": usage.prompt_token_count,
+                "candidatesTokenCount": usage.candidates_token_count,
+                "totalTokenCount": usage.total_token_count
+            },
+            "modelVersion": match.group("model")
+        })
+
+    def _send_error(self, code: int, message: str, status: str, retry_after: Optional[float] = None):
+        headers = {}
+        if retry_after is not None:
+            headers["Retry-After"] = str(retry_after)
+        self._send_json(code, {"error": {"code": code, "message": message, "status": status}}, headers)
+
+    def _send_json(self, code: int, payload: dict, headers: Optional[dict] = None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Yük testlerinde her istek için log basma
+        pass
+
+
+class MockGeminiServer:
+    """Gemini generateContent uç noktasını taklit eden yerel HTTP sunucusu.
+
+    Yanıtlar, gecikmeler ve enjekte edilen hatalar verilen MockBackend'den gelir.
+    port=0 ile boş bir port seçilir; adres için url özelliğini kullanın.
+    """
+
+    def __init__(self, backend: Optional[MockBackend] = None, host: str = "127.0.0.1", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), _GeminiHandler)
+        self._server.daemon_threads = True
+        self._server.backend = backend or MockBackend()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> MockBackend:
+        return self._server.backend
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockGeminiServer":
+        """Sunucuyu arka plan thread'inde başlat"""
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "MockGeminiServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel sahte Gemini sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-distribution", default="fixed")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    backend = MockBackend(
+        seed=args.seed, latency_ms=args.latency_ms,
+        latency_distribution=args.latency_distribution,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate
+    )
+    server = MockGeminiServer(backend, args.host, args.port)
+    print(f"Mock Gemini server listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
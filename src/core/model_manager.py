@@ -1,27 +1,100 @@
-import google.generativeai as genai
+import asyncio
 import time
-import hashlib
-from typing import Optional, Dict
+from typing import Optional, Dict, Any, List, Sequence
 from .config import Config
+from .response_cache import ResponseCache
+from .batching import run_batch
+from .rate_limiter import RateLimiter, estimate_tokens, is_rate_limit_error, parse_retry_after
+from .usage import GenerationResult
+from ..utils.keyword_matcher import KeywordMatcher
+from ..utils.telemetry import telemetry
+
+# Mock yanıt yönlendirmesinde aranan kelimeler (tek geçişte bulunur)
+POSITIVE_KEYWORDS = ["güzel", "harika", "sevdim", "tavsiye"]
+NEGATIVE_KEYWORDS = ["kötü", "sinir", "hayal kırıklığı", "geç"]
+_MOCK_ROUTING_MATCHER = KeywordMatcher(
+    ["elma", "portakal", "kahve", "çay", "bilet", "çocuk", "yetişkin", "sınıflandır", "duygu"]
+    + POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS
+)
 
 class ModelManager:
     def __init__(self, config: Config):
         self.config = config
         self._model = None
         self.mock_mode = config.get('model.mock_mode', False)
+        # gemini: SDK, http: REST uç noktası (örn. yerel mock sunucu), mock: yük testi backend'i
+        self.backend = config.get('model.backend', 'gemini')
         
         # Mock responses cache - farklı promptlar için farklı yanıtlar
         self.mock_responses = self._initialize_mock_responses()
         
+        # Disk tabanlı yanıt önbelleği (advanced_features.response_caching)
+        self.cache: Optional[ResponseCache] = None
+        if config.get('advanced_features.response_caching', False):
+            self.cache = self._initialize_cache()
+        
+        # Aynı backend/model/limit ayarlarını kullanan görev ve thread'lerin paylaştığı RPM/TPM sınırlayıcısı.
+        # Mock backend yüksek hacimli sentetik yük için varsayılan olarak kotaya tabi değildir
+        # (model.mock_backend.rate_limited: true ile açılır); enjekte edilen 429'lar yine de geri çekilir.
+        if self.backend == 'mock' and not config.get('model.mock_backend.rate_limited', False):
+            self.rate_limiter = RateLimiter(
+                base_backoff=config.get('rate_limit.base_backoff_seconds', 2.0),
+                max_backoff=config.get('rate_limit.max_backoff_seconds', 60.0)
+            )
+        else:
+            self.rate_limiter = RateLimiter.from_config(config)
+        self.max_retries = config.get('rate_limit.max_retries', 3)
+        
         if not self.mock_mode:
             self._initialize_model()
         else:
             print("Mock mode enabled - using realistic simulated responses")
     
     def _initialize_model(self) -> None:
-        """Gemini modelini başlat"""
+        """model.backend ayarına göre modeli başlat"""
+        generation_config = {
+            "temperature": self.config.temperature,
+            "max_output_tokens": self.config.max_tokens
+        }
+        
+        if self.backend == 'mock':
+            from .mock_backend import MockBackend
+            self._model = MockBackend.from_config(self.config, responder=self._generate_smart_mock_response)
+            print("Mock backend enabled - using synthetic load-test responses")
+            return
+        
+        if self.backend == 'http':
+            from .gemini_rest import GeminiRestClient
+            self._model = GeminiRestClient(
+                self.config.get('model.base_url', 'https://generativelanguage.googleapis.com'),
+                self.config.model_name,
+                api_key=self.config.gemini_api_key,
+                generation_config=generation_config,
+                timeout=self.config.get('model.timeout_seconds', 60)
+            )
+            return
+        
+        if self.backend != 'gemini':
+            raise ValueError(f"Unknown model backend: {self.backend}. Available: gemini, http, mock")
+        
+        # SDK ağır bir bağımlılık; yalnızca gerçek model kullanılacaksa yüklenir
+        import google.generativeai as genai
+        
         genai.configure(api_key=self.config.gemini_api_key)
-        self._model = genai.GenerativeModel(self.config.model_name)
+        self._model = genai.GenerativeModel(
+            self.config.model_name,
+            generation_config=generation_config
+        )
+    
+    def _initialize_cache(self) -> ResponseCache:
+        """Yanıt önbelleğini ayarlardan oluştur"""
+        ttl_hours = self.config.get('cache.ttl_hours')
+        return ResponseCache(
+            cache_dir=self.config.get('cache.directory', 'data/cache'),
+            max_entries=self.config.get('cache.max_entries', 10000),
+            max_size_mb=self.config.get('cache.max_size_mb', 256),
+            ttl_seconds=ttl_hours * 3600 if ttl_hours else None
+        )
     
     def _initialize_mock_responses(self) -> Dict[str, str]:
         """Farklı problem türleri için farklı mock yanıtları"""
@@ -81,45 +154,230 @@ Yanıt: Çocuk bileti: 6 TL, Yetişkin bileti: 12 TL
             "neutral": "Nötr"
         }
     
-    def generate(self, prompt: str, max_retries: int = 3) -> str:
+    def generate(self, prompt: str, max_retries: Optional[int] = None) -> str:
+        """Prompt ile metin üret - önbellek etkinse önce önbelleğe bakar"""
+        return self.generate_with_usage(prompt, max_retries).text
+    
+    def generate_with_usage(self, prompt: str, max_retries: Optional[int] = None) -> GenerationResult:
+        """Metni token kullanımı ve gecikmeyle (bekleme ve yeniden denemeler dahil) birlikte üret"""
+        start = time.perf_counter()
+        with telemetry.span("model.generate"):
+            if self.cache is None:
+                result = self._generate_uncached(prompt, max_retries)
+            else:
+                cache_key = self._cache_key(prompt)
+                cached = self._cache_lookup(cache_key)
+                if cached is not None:
+                    result = GenerationResult.from_cache(prompt, cached)
+                else:
+                    result = self._generate_uncached(prompt, max_retries)
+                    self.cache.put(cache_key, result.text, result.usage_metadata())
+        
+        result.latency_seconds = time.perf_counter() - start
+        self._count_tokens(result)
+        return result
+    
+    def generate_batch(self, prompts: Sequence[str], chunk_size: Optional[int] = None,
+                       max_workers: Optional[int] = None,
+                       return_exceptions: bool = False, with_usage: bool = False) -> List[Any]:
+        """Prompt listesini toplu üret - tekrarlar bir kez gönderilir, sonuçlar girdi sırasıyla döner.
+        
+        with_usage=True ise metin yerine GenerationResult döner.
+        """
+        if chunk_size is None:
+            chunk_size = self.config.get('advanced_features.batch_size', 32)
+        if max_workers is None:
+            max_workers = 1
+            if self.config.get('advanced_features.parallel_processing', False):
+                max_workers = self.config.get('advanced_features.max_workers', 8)
+        
+        generate_fn = self.generate_with_usage if with_usage else self.generate
+        return run_batch(generate_fn, prompts, chunk_size, max_workers, return_exceptions)
+    
+    def _cache_key(self, prompt: str) -> str:
+        """Backend, model adı, temperature, max_tokens ve prompt özetinden anahtar üret"""
+        # Mock ve başka uç noktalardan (ör. yerel mock sunucu) gelen yanıtlar gerçek
+        # Gemini yanıtlarıyla karışmasın; gemini SDK anahtarları önceki biçimde kalır
+        model_name = self.config.model_name
+        if self.mock_mode:
+            model_name = f"mock:{model_name}"
+        elif self.backend == 'http':
+            model_name = f"http:{self.config.get('model.base_url', '')}:{model_name}"
+        elif self.backend != 'gemini':
+            model_name = f"{self.backend}:{model_name}"
+        return ResponseCache.make_key(
+            model_name, self.config.temperature, self.config.max_tokens, prompt
+        )
+    
+    def _cache_lookup(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Önbelleğe bak ve isabet/ıskalamayı telemetriye say"""
+        with telemetry.span("cache.get"):
+            cached = self.cache.get(cache_key)
+        telemetry.count("cache_lookups", result="miss" if cached is None else "hit")
+        return cached
+    
+    @staticmethod
+    def _count_tokens(result: GenerationResult) -> None:
+        """Token kullanımını telemetri sayaçlarına ekle"""
+        source = "cache" if result.cached else ("estimate" if result.estimated else "api")
+        telemetry.count("tokens", result.input_tokens, direction="input", source=source)
+        telemetry.count("tokens", result.output_tokens, direction="output", source=source)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Önbellek isabet/ıskalama istatistiklerini döndür"""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
+    
+    def _generate_uncached(self, prompt: str, max_retries: Optional[int] = None) -> GenerationResult:
         """Prompt ile metin üret - gerçekçi mock responses ile"""
         if self.mock_mode:
-            return self._generate_smart_mock_response(prompt)
+            return GenerationResult.estimate(prompt, self._generate_smart_mock_response(prompt))
+        
+        if max_retries is None:
+            max_retries = self.max_retries
+        estimated_tokens = estimate_tokens(prompt)
+        
+        for attempt in range(max_retries):
+            # Kota uygun olana kadar bekle (429 sonrası ceza süresi dahil)
+            with telemetry.span("rate_limit.acquire"):
+                waited = self.rate_limiter.acquire(estimated_tokens)
+            telemetry.count("rate_limit_wait_seconds", waited)
+            try:
+                with telemetry.span("model.call", attempt=attempt + 1):
+                    response = self._model.generate_content(prompt)
+                telemetry.count("model_calls", outcome="success")
+                return GenerationResult.from_response(prompt, response)
+            except Exception as e:
+                error_msg = str(e)
+                
+                wait_time = self._retry_wait_time(error_msg, attempt, max_retries)
+                telemetry.count("model_calls", outcome="error" if wait_time is None else "rate_limited")
+                if wait_time is not None:
+                    print(f"Rate limit hit. Backing off {wait_time:.1f} seconds...")
+                    continue
+                    
+                raise RuntimeError(f"Model generation failed: {error_msg}")
+    
+    def _retry_wait_time(self, error_msg: str, attempt: int, max_retries: int) -> Optional[float]:
+        """Yeniden denenecekse bekleme süresini, denenmeyecekse None döndür"""
+        # 429 (rate limit) hatası: retry-after ipucu ya da jitter'lı üstel bekleme.
+        # Bekleme sınırlayıcıya işlenir, böylece diğer thread'ler de aynı limite çarpmaz.
+        if is_rate_limit_error(error_msg) and attempt < max_retries - 1:
+            wait_time = self.rate_limiter.backoff_delay(attempt, parse_retry_after(error_msg))
+            self.rate_limiter.penalize(wait_time)
+            telemetry.count("model_retries")
+            telemetry.count("retry_backoff_seconds", wait_time)
+            return wait_time
+        return None
+    
+    async def agenerate(self, prompt: str, max_retries: Optional[int] = None,
+                        timeout: Optional[float] = None) -> str:
+        """generate'in asenkron karşılığı; timeout saniye cinsinden çağrı başına süre sınırı"""
+        return (await self.agenerate_with_usage(prompt, max_retries, timeout)).text
+    
+    async def agenerate_with_usage(self, prompt: str, max_retries: Optional[int] = None,
+                                   timeout: Optional[float] = None) -> GenerationResult:
+        """generate_with_usage'ın asenkron karşılığı"""
+        if timeout is not None:
+            return await asyncio.wait_for(self._agenerate(prompt, max_retries), timeout)
+        return await self._agenerate(prompt, max_retries)
+    
+    async def agenerate_many(self, prompts: Sequence[str], max_concurrency: Optional[int] = None,
+                             timeout: Optional[float] = None,
+                             return_exceptions: bool = False) -> List[Any]:
+        """Prompt listesini tek event loop üzerinde sınırlı eşzamanlılıkla üret.
+        
+        Sonuçlar prompt sırasıyla döner. return_exceptions=True ise başarısız
+        çağrıların yerine exception nesnesi konur; aksi halde ilk hatada kalan
+        çağrılar iptal edilir ve hata yükseltilir.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.config.get('advanced_features.max_workers', 8)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate(prompt, timeout=timeout)
+        
+        tasks = [asyncio.ensure_future(run_one(prompt)) for prompt in prompts]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        finally:
+            # Hata ya da dış iptal durumunda bekleyen çağrıları sızdırma
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _agenerate(self, prompt: str, max_retries: Optional[int]) -> GenerationResult:
+        """Önbellek kontrolü ile asenkron üretim"""
+        start = time.perf_counter()
+        with telemetry.span("model.generate", mode="async"):
+            cached = None
+            if self.cache is not None:
+                cache_key = self._cache_key(prompt)
+                cached = self._cache_lookup(cache_key)
+            
+            if cached is not None:
+                result = GenerationResult.from_cache(prompt, cached)
+            else:
+                result = await self._agenerate_uncached(prompt, max_retries)
+                if self.cache is not None:
+                    self.cache.put(cache_key, result.text, result.usage_metadata())
+        
+        result.latency_seconds = time.perf_counter() - start
+        self._count_tokens(result)
+        return result
+    
+    async def _agenerate_uncached(self, prompt: str, max_retries: Optional[int]) -> GenerationResult:
+        """Gemini asenkron istemcisi veya mock yol ile üret"""
+        if self.mock_mode:
+            return GenerationResult.estimate(prompt, self._generate_smart_mock_response(prompt))
+        
+        if max_retries is None:
+            max_retries = self.max_retries
+        estimated_tokens = estimate_tokens(prompt)
         
         for attempt in range(max_retries):
+            with telemetry.span("rate_limit.acquire"):
+                waited = await self.rate_limiter.aacquire(estimated_tokens)
+            telemetry.count("rate_limit_wait_seconds", waited)
             try:
-                response = self._model.generate_content(prompt)
-                return response.text.strip()
+                with telemetry.span("model.call", attempt=attempt + 1):
+                    response = await self._model.generate_content_async(prompt)
+                telemetry.count("model_calls", outcome="success")
+                return GenerationResult.from_response(prompt, response)
             except Exception as e:
                 error_msg = str(e)
                 
-                # 429 (rate limit) hatası için bekleme
-                if "429" in error_msg and attempt < max_retries - 1:
-                    wait_time = 60 * (attempt + 1)  # 60, 120, 180 saniye
-                    print(f"Rate limit hit. Waiting {wait_time} seconds...")
-                    time.sleep(wait_time)
+                wait_time = self._retry_wait_time(error_msg, attempt, max_retries)
+                telemetry.count("model_calls", outcome="error" if wait_time is None else "rate_limited")
+                if wait_time is not None:
+                    print(f"Rate limit hit. Backing off {wait_time:.1f} seconds...")
                     continue
                     
                 raise RuntimeError(f"Model generation failed: {error_msg}")
     
     def _generate_smart_mock_response(self, prompt: str) -> str:
         """Prompt içeriğine göre akıllı mock yanıt üret"""
-        prompt_lower = prompt.lower()
+        hits = _MOCK_ROUTING_MATCHER.find_all(prompt)
         
         # Mathematical reasoning problems
-        if "elma" in prompt_lower and "portakal" in prompt_lower:
+        if "elma" in hits and "portakal" in hits:
             return self.mock_responses["elma_portakal"]
-        elif "kahve" in prompt_lower and "çay" in prompt_lower:
+        elif "kahve" in hits and "çay" in hits:
             return self.mock_responses["kahve_cay"]
-        elif "bilet" in prompt_lower or ("çocuk" in prompt_lower and "yetişkin" in prompt_lower):
+        elif "bilet" in hits or ("çocuk" in hits and "yetişkin" in hits):
             return self.mock_responses["bilet"]
         
         # Sentiment classification 
-        elif "sınıflandır" in prompt_lower or "duygu" in prompt_lower:
+        elif "sınıflandır" in hits or "duygu" in hits:
             # Prompt içeriğine göre sentiment belirle
-            if any(word in prompt_lower for word in ["güzel", "harika", "sevdim", "tavsiye"]):
+            if not hits.isdisjoint(POSITIVE_KEYWORDS):
                 return self.mock_responses["positive"]
-            elif any(word in prompt_lower for word in ["kötü", "sinir", "hayal kırıklığı", "geç"]):
+            elif not hits.isdisjoint(NEGATIVE_KEYWORDS):
                 return self.mock_responses["negative"]  
             else:
                 return self.mock_responses["neutral"]
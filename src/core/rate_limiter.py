@@ -0,0 +1,170 @@
+import asyncio
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Hata mesajlarındaki "tekrar dene" ipuçları (gRPC RetryInfo, HTTP Retry-After, serbest metin)
+_RETRY_AFTER_PATTERNS = [
+    re.compile(r'retry_delay\s*\{\s*seconds:\s*(\d+(?:\.\d+)?)', re.IGNORECASE),
+    re.compile(r'retry[- ]after[:=\s]+(\d+(?:\.\d+)?)', re.IGNORECASE),
+    re.compile(r'retry in\s+(\d+(?:\.\d+)?)\s*s', re.IGNORECASE),
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Kaba token tahmini (~4 karakter = 1 token)"""
+    return max(1, len(text) // 4)
+
+
+def is_rate_limit_error(error_msg: str) -> bool:
+    """Hata mesajı kota/rate limit aşımını mı belirtiyor"""
+    error_lower = error_msg.lower()
+    return "429" in error_msg or "resource exhausted" in error_lower or "resourceexhausted" in error_lower
+
+
+def parse_retry_after(error_msg: str) -> Optional[float]:
+    """Hata mesajından sunucunun önerdiği bekleme süresini (saniye) çıkar"""
+    for pattern in _RETRY_AFTER_PATTERNS:
+        match = pattern.search(error_msg)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+class TokenBucket:
+    """Dakikalık kapasiteyle sürekli dolan token kovası.
+
+    reserve() miktarı hemen düşer ve bakiyenin tekrar sıfıra çıkması için
+    gereken bekleme süresini döndürür; böylece bekleyenler sırayla hizmet alır.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        now = self._clock()
+        self._refill(now)
+        # Kapasiteden büyük istekler tek seferde tüm kovayı kullanır
+        self._tokens -= min(amount, self.capacity)
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Dakikalık istek (RPM) ve token (TPM) sınırlayıcısı.
+
+    Aynı backend, uç nokta, model ve limit ayarlarını kullanan tüm görevler ve
+    worker thread'ler shared() ile tek bir örneği paylaşır; farklı limitlerle
+    oluşturulan yöneticiler ayrı sınırlayıcı alır. 429 sonrası penalize() tüm
+    çağıranları birlikte bekletir.
+    """
+
+    _shared: Dict[Hashable, "RateLimiter"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None,
+                 base_backoff: float = 2.0, max_backoff: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._request_bucket = TokenBucket(requests_per_minute, clock) if requests_per_minute else None
+        self._token_bucket = TokenBucket(tokens_per_minute, clock) if tokens_per_minute else None
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+        self.throttled_requests = 0
+        self.total_wait_seconds = 0.0
+
+    @classmethod
+    def shared(cls, key: Hashable, **kwargs: Any) -> "RateLimiter":
+        """Anahtara göre süreç genelinde paylaşılan sınırlayıcıyı döndür"""
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(**kwargs)
+            return cls._shared[key]
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Paylaşılan sınırlayıcıları unut (testler ve yeni çalıştırmalar için)"""
+        with cls._shared_lock:
+            cls._shared.clear()
+
+    @classmethod
+    def from_config(cls, config) -> "RateLimiter":
+        """rate_limit ayarlarından paylaşılan sınırlayıcı oluştur.
+
+        Anahtar backend, uç nokta, model adı ve tüm limit ayarlarını içerir;
+        böylece ilk çağıranın limitleri farklı ayarlı yöneticilere dayatılmaz.
+        """
+        limits = {
+            "requests_per_minute": config.get('rate_limit.requests_per_minute'),
+            "tokens_per_minute": config.get('rate_limit.tokens_per_minute'),
+            "base_backoff": config.get('rate_limit.base_backoff_seconds', 2.0),
+            "max_backoff": config.get('rate_limit.max_backoff_seconds', 60.0)
+        }
+        key = (config.get('model.backend', 'gemini'), config.get('model.base_url'), config.model_name,
+               *limits.values())
+        return cls.shared(key, **limits)
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Kota ayır ve çağıranın beklemesi gereken süreyi döndür"""
+        with self._lock:
+            now = self._clock()
+            wait = max(0.0, self._blocked_until - now)
+            if self._request_bucket is not None:
+                wait = max(wait, self._request_bucket.reserve(1))
+            if self._token_bucket is not None:
+                wait = max(wait, self._token_bucket.reserve(tokens))
+            if wait > 0:
+                self.throttled_requests += 1
+                self.total_wait_seconds += wait
+            return wait
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Kota uygun olana kadar bekle (thread'ler için)"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 1) -> float:
+        """Kota uygun olana kadar bekle (event loop'u bloklamadan)"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Retry-after ipucu varsa onu, yoksa full-jitter üstel bekleme süresini döndür"""
+        if retry_after is not None:
+            # Aynı anda uyanan thread'lerin yeniden çarpışmasını önlemek için küçük jitter
+            return retry_after + random.uniform(0, self.base_backoff)
+        ceiling = min(self.max_backoff, self.base_backoff * (2 ** attempt))
+        return random.uniform(self.base_backoff / 2, ceiling)
+
+    def penalize(self, delay: float) -> None:
+        """Tüm çağıranları en az delay saniye beklet (429 sonrası)"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Bekleme istatistiklerini döndür"""
+        return {
+            "throttled_requests": self.throttled_requests,
+            "total_wait_seconds": self.total_wait_seconds
+        }
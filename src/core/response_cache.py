@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """Model yanıtları için disk tabanlı, içerik adresli önbellek.
+
+    Anahtar; model adı, temperature, max_tokens ve prompt'un SHA-256
+    özetinden üretilir. Kayıtlar SQLite dosyasında tutulur, LRU sırasıyla
+    (son erişim zamanı) kayıt sayısı ve toplam boyut sınırına göre silinir.
+    """
+
+    def __init__(self, cache_dir: str = "data/cache", max_entries: int = 10000,
+                 max_size_mb: float = 256, ttl_seconds: Optional[float] = None):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(cache_dir, "responses.sqlite3"),
+            timeout=30,
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                metadata TEXT,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_name: str, temperature: Any, max_tokens: Any, prompt: str) -> str:
+        """Model parametreleri ve prompt özetinden önbellek anahtarı üret"""
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        key_material = json.dumps(
+            [model_name, temperature, max_tokens, prompt_hash],
+            sort_keys=True
+        )
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Kayıt varsa ve süresi dolmadıysa {'response', 'metadata'} döndür"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, metadata, created_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, metadata, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return {
+            "response": response,
+            "metadata": json.loads(metadata) if metadata else {}
+        }
+
+    def put(self, key: str, response: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Yanıtı kaydet ve gerekirse LRU tahliyesi yap"""
+        now = time.time()
+        metadata_json = json.dumps(metadata, ensure_ascii=False) if metadata else None
+        size = len(response.encode("utf-8")) + (len(metadata_json) if metadata_json else 0)
+
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO responses
+                   (key, response, metadata, size, created_at, last_access)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, response, metadata_json, size, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Sınırlar aşıldıysa en uzun süre erişilmeyen kayıtları sil"""
+        if self.ttl_seconds is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        count, total_size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        if self.max_entries and count > self.max_entries:
+            excess = count - self.max_entries
+            self._conn.execute(
+                """DELETE FROM responses WHERE key IN (
+                       SELECT key FROM responses ORDER BY last_access ASC LIMIT ?
+                   )""",
+                (excess,)
+            )
+            self.evictions += excess
+            total_size = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+        if self.max_size_bytes is not None and total_size > self.max_size_bytes:
+            overflow = total_size - self.max_size_bytes
+            freed = 0
+            victims = []
+            for key, size in self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access ASC"
+            ):
+                victims.append((key,))
+                freed += size
+                if freed >= overflow:
+                    break
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+            self.evictions += len(victims)
+
+    def clear(self) -> None:
+        """Tüm kayıtları sil ve sayaçları sıfırla"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Önbellek istatistiklerini döndür"""
+        with self._lock:
+            count, total_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": count,
+            "size_bytes": total_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .rate_limiter import estimate_tokens
+
+
+@dataclass(slots=True)
+class GenerationResult:
+    """Model yanıtı ve çağrının token kullanımı / gecikmesi"""
+    text: str
+    input_tokens: int
+    output_tokens: int
+    latency_seconds: Optional[float] = None
+    cached: bool = False
+    # True: sayılar API'den değil yerel tahminden (~4 karakter = 1 token)
+    estimated: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    @classmethod
+    def estimate(cls, prompt: str, text: str, latency_seconds: Optional[float] = None) -> "GenerationResult":
+        """Kullanım bilgisi olmayan yanıtlar için token sayılarını tahmin et"""
+        return cls(text, estimate_tokens(prompt), estimate_tokens(text), latency_seconds, estimated=True)
+
+    @classmethod
+    def from_response(cls, prompt: str, response: Any) -> "GenerationResult":
+        """SDK/REST yanıtından metni ve usage_metadata'yı al; yoksa tahmin et"""
+        text = response.text.strip()
+        usage = getattr(response, "usage_metadata", None)
+        prompt_tokens = getattr(usage, "prompt_token_count", None)
+        if prompt_tokens is None:
+            return cls.estimate(prompt, text)
+        return cls(text, prompt_tokens, getattr(usage, "candidates_token_count", None) or 0)
+
+    @classmethod
+    def from_cache(cls, prompt: str, entry: Dict[str, Any]) -> "GenerationResult":
+        """Önbellek kaydından (metadata'da saklanan kullanım bilgisiyle) oluştur"""
+        metadata = entry.get("metadata") or {}
+        if "input_tokens" not in metadata:
+            result = cls.estimate(prompt, entry["response"])
+        else:
+            result = cls(entry["response"], metadata["input_tokens"], metadata["output_tokens"],
+                         estimated=metadata.get("estimated", False))
+        result.cached = True
+        return result
+
+    def usage_metadata(self) -> Dict[str, Any]:
+        """Önbelleğe yazılacak kullanım bilgisi"""
+        return {"input_tokens": self.input_tokens, "output_tokens": self.output_tokens,
+                "estimated": self.estimated}
@@ -1,7 +1,7 @@
 from typing import Dict, List, Any, Optional
 import pandas as pd
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 import numpy as np
+from ..analytics.aggregation import ResultAggregator
 
 class EvaluationMetrics:
     def __init__(self):
@@ -18,6 +18,9 @@ class EvaluationMetrics:
     def generate_classification_report(self, expected: List[str], predicted: List[str], 
                                     labels: Optional[List[str]] = None) -> Dict[str, Any]:
         """Detaylı sınıflandırma raporu"""
+        # scikit-learn yalnızca bu rapor istendiğinde yüklenir
+        from sklearn.metrics import classification_report
+        
         try:
             report = classification_report(
                 expected, predicted, 
@@ -30,13 +33,16 @@ class EvaluationMetrics:
             print(f"Classification report error: {e}")
             return {}
     
-    def calculate_strategy_performance(self, results_df: pd.DataFrame) -> pd.DataFrame:
-        """Strateji bazında performans analizi"""
-        if 'Prompt Type' not in results_df.columns or 'Accuracy' not in results_df.columns:
-            return pd.DataFrame()
+    def calculate_strategy_performance(self, results_df: pd.DataFrame,
+                                       pricing: Optional[Dict[str, float]] = None,
+                                       aggregator: Optional[ResultAggregator] = None) -> pd.DataFrame:
+        """Strateji bazında performans analizi (token sütunları varsa verimlilik metrikleriyle)
         
-        performance = results_df.groupby(['Prompt Type', 'Prompt Format'])['Accuracy'].agg([
-            'mean', 'std', 'count'
-        ]).round(3)
+        aggregator verilirse (örn. görevin çalışırken güncellediği özet) sonuçlar yeniden taranmaz.
+        """
+        if aggregator is None:
+            if 'Prompt Type' not in results_df.columns or 'Accuracy' not in results_df.columns:
+                return pd.DataFrame()
+            aggregator = ResultAggregator.from_dataframe(results_df)
         
-        return performance.reset_index()
\ No newline at end of file
+        return aggregator.strategy_table(pricing=pricing)
\ No newline at end of file
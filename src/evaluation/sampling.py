@@ -0,0 +1,172 @@
+import math
+import random
+from statistics import NormalDist
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from ..analytics.aggregation import RunningStats
+
+# İki değerden az puanı olan katmanlar için varsayılan varyans ([0, 1] puanlarda üst sınır)
+MAX_VARIANCE = 0.25
+
+
+class StratifiedSample:
+    """Katmanlı alt örneklemle değerlendirme planı.
+
+    Veriler katman anahtarına (ör. etiket, problem türü) göre gruplanır ve
+    her katman seed ile karıştırılır. draw() her çağrıda örneklemi katman
+    büyüklükleriyle orantılı olarak initial_size, sonra step kadar büyütür.
+    Strateji doğruluğu katman ağırlıklarıyla tahmin edilir; güven aralığı
+    katmanlı varyansla (sonlu evren düzeltmesiyle) hesaplanır. Katman
+    varyansı Agresti–Coull düzeltmeli p(1-p) ile alttan sınırlanır; böylece
+    ilk puanları hep aynı olan katmanlar sıfır genişlikli aralık vermez. Tüm
+    stratejilerin aralık genişliği target_ci_width'e indiğinde, max_size
+    dolduğunda ya da veri bittiğinde örneklem büyümeyi durdurur.
+    """
+
+    def __init__(self, target_ci_width: float = 0.1, initial_size: int = 30, step: int = 30,
+                 max_size: Optional[int] = None, confidence: float = 0.95, seed: int = 42):
+        if target_ci_width <= 0:
+            raise ValueError(f"target_ci_width must be positive, got {target_ci_width}")
+        if initial_size < 1 or step < 1:
+            raise ValueError("initial_size and step must be positive")
+        if not 0 < confidence < 1:
+            raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+        self.target_ci_width = target_ci_width
+        self.initial_size = initial_size
+        self.step = step
+        self.max_size = max_size
+        self.confidence = confidence
+        self.seed = seed
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self._strata: Dict[Hashable, List[Dict[str, Any]]] = {}
+        self._drawn: Dict[Hashable, int] = {}
+        # strateji -> katman -> puan özeti
+        self._stats: Dict[str, Dict[Hashable, RunningStats]] = {}
+
+    @classmethod
+    def from_config(cls, config, **overrides) -> "StratifiedSample":
+        """sampling.* ayarlarından oluştur; None olmayan overrides ayarları geçersiz kılar"""
+        initial_size = config.get('sampling.initial_size', 30)
+        options = {
+            "target_ci_width": config.get('sampling.target_ci_width', 0.1),
+            "initial_size": initial_size,
+            "step": config.get('sampling.step', initial_size),
+            "max_size": config.get('sampling.max_size'),
+            "confidence": config.get('sampling.confidence', 0.95),
+            "seed": config.get('sampling.seed', 42)
+        }
+        options.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**options)
+
+    def prepare(self, items: Iterable[Dict[str, Any]], key: Callable[[Dict[str, Any]], Hashable]) -> None:
+        """Verileri katmanlara ayır ve karıştır (evrenin tamamı bellekte tutulur)"""
+        rng = random.Random(self.seed)
+        strata: Dict[Hashable, List[Dict[str, Any]]] = {}
+        for item in items:
+            strata.setdefault(key(item), []).append(item)
+        for pool in strata.values():
+            rng.shuffle(pool)
+        self._strata = strata
+        self._drawn = {stratum: 0 for stratum in strata}
+        self._stats = {}
+
+    @property
+    def population_size(self) -> int:
+        return sum(len(pool) for pool in self._strata.values())
+
+    @property
+    def sample_size(self) -> int:
+        return sum(self._drawn.values())
+
+    def stratum_sizes(self) -> Dict[Hashable, Tuple[int, int]]:
+        """Katman -> (örneklenen, evren) sayıları"""
+        return {stratum: (self._drawn[stratum], len(pool)) for stratum, pool in self._strata.items()}
+
+    def draw(self) -> List[Tuple[Hashable, Dict[str, Any]]]:
+        """Örneklemi bir adım büyüt; yeni (katman, veri) çiftlerini döndür (bittiyse boş)"""
+        size = self.initial_size if self.sample_size == 0 else self.step
+        total = min(self.sample_size + size, self.population_size)
+        if self.max_size is not None:
+            total = min(total, max(self.max_size, self.sample_size))
+        if total <= self.sample_size:
+            return []
+
+        targets = self._allocate(total)
+        drawn = []
+        for stratum, pool in self._strata.items():
+            drawn.extend((stratum, item) for item in pool[self._drawn[stratum]:targets[stratum]])
+            self._drawn[stratum] = targets[stratum]
+        return drawn
+
+    def _allocate(self, total: int) -> Dict[Hashable, int]:
+        """Katman başına toplam örnek hedefi: orantılı dağıtım (en büyük kalan), her katmandan en az bir"""
+        population = self.population_size
+        quotas = {stratum: total * len(pool) / population for stratum, pool in self._strata.items()}
+        targets = {stratum: min(len(self._strata[stratum]), max(self._drawn[stratum], 1, math.floor(quota)))
+                   for stratum, quota in quotas.items()}
+        order = sorted(quotas, key=lambda stratum: quotas[stratum] - math.floor(quotas[stratum]), reverse=True)
+        while sum(targets.values()) < total:
+            for stratum in order:
+                if sum(targets.values()) < total and targets[stratum] < len(self._strata[stratum]):
+                    targets[stratum] += 1
+        return targets
+
+    def update(self, strategy: str, stratum: Hashable, accuracy: Optional[float]) -> None:
+        """Stratejinin bir katmandaki puanını ekle (None/NaN atlanır)"""
+        strata = self._stats.setdefault(strategy, {})
+        strata.setdefault(stratum, RunningStats()).add(accuracy)
+
+    def estimate(self, strategy: str) -> Dict[str, float]:
+        """Katmanlı doğruluk tahmini, güven aralığı ve puanlanan örnek sayısı"""
+        stats = {stratum: summary for stratum, summary in self._stats.get(strategy, {}).items() if summary.count}
+        if not stats:
+            return {"mean": math.nan, "ci_low": math.nan, "ci_high": math.nan, "width": math.nan, "samples": 0}
+
+        # Henüz puanı olmayan katmanlar varsa ağırlıklar gözlenen katmanlara göre normalize edilir
+        sizes = {stratum: len(self._strata[stratum]) for stratum in stats}
+        observed = sum(sizes.values())
+        mean = 0.0
+        variance = 0.0
+        for stratum, summary in stats.items():
+            weight = sizes[stratum] / observed
+            stratum_variance = max(summary.variance, self._variance_floor(summary)) \
+                if summary.count > 1 else MAX_VARIANCE
+            mean += weight * summary.mean
+            variance += weight * weight * stratum_variance / summary.count * (1 - summary.count / sizes[stratum])
+        half_width = self.z * math.sqrt(max(variance, 0.0))
+        return {
+            "mean": mean,
+            "ci_low": max(0.0, mean - half_width),
+            "ci_high": min(1.0, mean + half_width),
+            "width": 2 * half_width,
+            "samples": sum(summary.count for summary in stats.values())
+        }
+
+    def _variance_floor(self, summary: RunningStats) -> float:
+        """Agresti–Coull düzeltmeli oranın p(1-p) varyansı (z²/2 başarı ve başarısızlık eklenir)"""
+        adjusted = (summary.mean * summary.count + self.z * self.z / 2) / (summary.count + self.z * self.z)
+        return adjusted * (1 - adjusted)
+
+    @property
+    def max_ci_width(self) -> float:
+        """Stratejiler arasındaki en geniş güven aralığı (puanı olmayan strateji varsa sonsuz)"""
+        widths = [self.estimate(strategy)["width"] for strategy in self._stats]
+        if not widths or any(math.isnan(width) for width in widths):
+            return math.inf
+        return max(widths)
+
+    @property
+    def converged(self) -> bool:
+        """Tüm stratejilerin güven aralığı hedef genişlikte mi"""
+        return self.max_ci_width <= self.target_ci_width
+
+    def summary(self) -> Dict[str, Any]:
+        """Örneklem büyüklüğü, katmanlar ve strateji bazında tahminler"""
+        return {
+            "sample_size": self.sample_size,
+            "population_size": self.population_size,
+            "target_ci_width": self.target_ci_width,
+            "confidence": self.confidence,
+            "converged": self.converged,
+            "strata": {str(stratum): sizes for stratum, sizes in self.stratum_sizes().items()},
+            "strategies": {strategy: self.estimate(strategy) for strategy in self._stats}
+        }
@@ -0,0 +1,136 @@
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from ..analytics.aggregation import RunningStats
+
+
+class SuccessiveElimination:
+    """Stratejileri tur tur karşılaştıran ardışık eleme (successive elimination).
+
+    Her turda yarışmada kalan tüm stratejiler aynı round_size veri üzerinde
+    çalıştırılır. Doğruluk [0, 1] aralığında olduğundan her stratejinin
+    ortalaması için Hoeffding güven sınırı kullanılır; sınır turlar ve
+    stratejiler üzerinden birleşim (union bound) ile düzeltildiği için
+    karşılaştırma istenildiği kadar erken durdurulsa da en iyi stratejiyi
+    yanlışlıkla eleme olasılığı en fazla 1 - confidence olur. Üst sınırı en
+    iyi alt sınırın altında kalan strateji elenir ve bir daha model çağrısı
+    almaz; tek strateji kaldığında kazanan istatistiksel olarak ayrışmıştır.
+    """
+
+    def __init__(self, strategies: Iterable[str], confidence: float = 0.95, round_size: int = 16,
+                 min_samples: int = 16, max_samples: Optional[int] = None):
+        self.strategies = list(dict.fromkeys(strategies))
+        if not self.strategies:
+            raise ValueError("At least one strategy is required for a comparison")
+        if not 0 < confidence < 1:
+            raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+        if round_size < 1:
+            raise ValueError(f"round_size must be positive, got {round_size}")
+        self.confidence = confidence
+        self.round_size = round_size
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.active = list(self.strategies)
+        self.stats: Dict[str, RunningStats] = {strategy: RunningStats() for strategy in self.strategies}
+        self.calls: Dict[str, int] = {strategy: 0 for strategy in self.strategies}
+        # strateji -> elendiği tur
+        self.eliminated: Dict[str, int] = {}
+        self.rounds = 0
+
+    @classmethod
+    def from_config(cls, config, strategies: Iterable[str]) -> "SuccessiveElimination":
+        """comparison.* ayarlarından oluştur"""
+        round_size = config.get('comparison.round_size', 16)
+        return cls(
+            strategies,
+            confidence=config.get('comparison.confidence', 0.95),
+            round_size=round_size,
+            min_samples=config.get('comparison.min_samples', round_size),
+            max_samples=config.get('comparison.max_samples')
+        )
+
+    def update(self, strategy: str, accuracies: Iterable[Optional[float]], calls: int = None) -> None:
+        """Stratejinin bu turdaki puanlarını ekle (None/NaN puanlar sayılmaz)"""
+        accuracies = list(accuracies)
+        stats = self.stats[strategy]
+        for accuracy in accuracies:
+            stats.add(accuracy)
+        self.calls[strategy] += len(accuracies) if calls is None else calls
+
+    def radius(self, strategy: str) -> float:
+        """Stratejinin ortalaması için güven sınırı yarı genişliği (veri yoksa sonsuz)"""
+        count = self.stats[strategy].count
+        if count == 0:
+            return math.inf
+        rounds = max(self.rounds, 1)
+        delta = 1 - self.confidence
+        return math.sqrt(math.log(2 * len(self.strategies) * rounds * (rounds + 1) / delta) / (2 * count))
+
+    def bounds(self, strategy: str) -> Tuple[float, float]:
+        """(alt, üst) güven sınırları; [0, 1] aralığına kırpılır"""
+        stats = self.stats[strategy]
+        if stats.count == 0:
+            return 0.0, 1.0
+        radius = self.radius(strategy)
+        return max(0.0, stats.mean - radius), min(1.0, stats.mean + radius)
+
+    def end_round(self) -> List[str]:
+        """Turu kapat ve ayrışan stratejileri ele; elenenleri döndür"""
+        self.rounds += 1
+        if len(self.active) < 2 or any(self.stats[s].count < self.min_samples for s in self.active):
+            return []
+
+        best_lower = max(self.bounds(strategy)[0] for strategy in self.active)
+        eliminated = [strategy for strategy in self.active if self.bounds(strategy)[1] < best_lower]
+        for strategy in eliminated:
+            self.active.remove(strategy)
+            self.eliminated[strategy] = self.rounds
+        return eliminated
+
+    @property
+    def finished(self) -> bool:
+        """Kazanan ayrıştı ya da stratejiler örnek sınırına ulaştı"""
+        if len(self.active) < 2:
+            return True
+        return self.max_samples is not None and all(self.calls[s] >= self.max_samples for s in self.active)
+
+    @property
+    def winner(self) -> Optional[str]:
+        """İstatistiksel olarak ayrışan kazanan (ayrışmadıysa None)"""
+        return self.active[0] if len(self.active) == 1 else None
+
+    @property
+    def leader(self) -> Optional[str]:
+        """Yarışmadaki stratejilerden ortalaması en yüksek olan"""
+        scored = [strategy for strategy in self.active if self.stats[strategy].count]
+        return max(scored, key=lambda strategy: self.stats[strategy].mean) if scored else None
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """Strateji bazında örnek sayısı, ortalama, sınırlar ve durum"""
+        strategies = {}
+        for strategy in self.strategies:
+            stats = self.stats[strategy]
+            lower, upper = self.bounds(strategy)
+            if strategy in self.eliminated:
+                status = f"eliminated (round {self.eliminated[strategy]})"
+            else:
+                status = "winner" if strategy == self.winner else "in contention"
+            strategies[strategy] = {
+                "calls": self.calls[strategy],
+                "samples": stats.count,
+                "mean": stats.value,
+                "lower": lower,
+                "upper": upper,
+                "status": status
+            }
+        return {
+            "rounds": self.rounds,
+            "confidence": self.confidence,
+            "winner": self.winner,
+            "leader": self.leader,
+            "total_calls": self.total_calls,
+            "strategies": strategies
+        }
@@ -1,125 +1,320 @@
-from typing import Dict, List, Any
+import os
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 from .core.config import Config
 from .core.model_manager import ModelManager
 from .prompts.prompt_library import PromptLibrary
-from .tasks.text_classification import TextClassificationTask
+from .tasks import BaseTask
+from .tasks import registry
 from .evaluation.metrics import EvaluationMetrics
+from .evaluation.sampling import StratifiedSample
+from .evaluation.sequential import SuccessiveElimination
 from .utils.data_handler import DataHandler
+from .utils.progress import ProgressView
+from .utils.run_journal import RunJournal
+from .utils import telemetry as telemetry_module
+from .analytics.aggregation import ResultAggregator
 from .analytics.report_generator import ReportGenerator
 
 class ExperimentRunner:
-    def __init__(self, config_path: str = "config/settings.yaml"):
+    def __init__(self, config_path: str = "config/settings.yaml", run_id: Optional[str] = None,
+                 telemetry_path: Optional[str] = None, show_progress: bool = False):
         print("ExperimentRunner initializing...")
         self.config = Config(config_path)
         print("Config loaded")
+        # Span/sayaç toplama: telemetry.enabled ya da telemetry_path (--telemetry) ile açılır
+        self.telemetry = telemetry_module.configure_from_config(self.config)
+        self.telemetry_path = telemetry_path or self.config.get('telemetry.export_path')
+        if telemetry_path:
+            self.telemetry.configure(enabled=True)
         self.model_manager = ModelManager(self.config)
         print("Model manager created")
         self.prompt_library = PromptLibrary()
         print("Prompt library created")
         self.evaluator = EvaluationMetrics()
         self.data_handler = DataHandler(self.config.get('evaluation.output_dir', 'data/output'))
-        self.report_generator = ReportGenerator()
-        self.tasks = {}
-        print("About to initialize tasks...")
-        self._initialize_tasks()
-        print(f"Initialization complete. Tasks: {list(self.tasks.keys())}")
-    
-    def _initialize_tasks(self):
-        """Görevleri başlat"""
-        print("Starting task initialization...")
-        
-        # Text classification
-        if self.config.get('tasks.text_classification.enabled', True):
-            self.tasks['text_classification'] = TextClassificationTask(
+        self.report_generator = ReportGenerator.from_config(self.config)
+        self.journal = self._open_journal(run_id)
+        # Görevler ilk çalıştırıldıklarında oluşturulur (bkz. get_task)
+        self.tasks: Dict[str, BaseTask] = {}
+        # Görev -> son çalıştırmanın sonuç dosyası; rapor satırları buradan akıtılır
+        self.result_paths: Dict[str, str] = {}
+        # Canlı izleme: görev başına durum ve işlenen birim sayısı (bkz. snapshot)
+        self._progress: Dict[str, Dict[str, Any]] = {}
+        self._stop_event = threading.Event()
+        self.progress_view = None
+        if show_progress:
+            self.progress_view = ProgressView(min_interval=self.config.get('evaluation.progress_interval', 1.0))
+        print("Initialization complete")
+    
+    def get_task(self, task_name: str) -> BaseTask:
+        """Görevi katalogdan ilk kullanımda oluştur ve önbelleğe al"""
+        if task_name not in self.tasks:
+            if task_name not in self.list_available_tasks():
+                raise ValueError(f"Task '{task_name}' not found. Available tasks: {self.list_available_tasks()}")
+            self.tasks[task_name] = registry.create_task(
+                task_name,
                 self.model_manager, 
                 self.prompt_library, 
                 self.config
             )
-            print("Text classification task added")
+        return self.tasks[task_name]
+    
+    def _open_journal(self, run_id: Optional[str]) -> Optional[RunJournal]:
+        """İlerleme günlüğünü aç; run_id verilirse o çalıştırmadan devam et"""
+        if run_id is None and not self.config.get('evaluation.checkpointing', True):
+            return None
         
-        # Mathematical reasoning
-        try:
-            from .tasks.mathematical_reasoning import MathematicalReasoningTask
-            self.tasks['mathematical_reasoning'] = MathematicalReasoningTask(
-                self.model_manager, 
-                self.prompt_library, 
-                self.config
-            )
-            print("Mathematical reasoning task added")
-        except Exception as e:
-            print(f"Error adding mathematical reasoning task: {e}")
-            import traceback
-            traceback.print_exc()
+        output_dir = self.config.get('evaluation.output_dir', 'data/output')
+        journal_dir = self.config.get('evaluation.journal_dir', os.path.join(output_dir, 'runs'))
         
-        print(f"Final tasks dictionary: {list(self.tasks.keys())}")
+        if run_id is not None and not RunJournal.exists(journal_dir, run_id):
+            raise ValueError(f"Run '{run_id}' not found in {journal_dir}")
+        
+        journal = RunJournal(journal_dir, run_id)
+        if run_id is not None:
+            print(f"Resuming run {run_id}: {journal.completed_count} completed units will be skipped")
+        else:
+            print(f"Run ID: {journal.run_id}")
+        return journal
     
-    def run_single_task(self, task_name: str, strategies: List[str] = None) -> pd.DataFrame:
-        """Tek bir görevi çalıştır"""
-        if task_name not in self.tasks:
-            raise ValueError(f"Task '{task_name}' not found. Available tasks: {list(self.tasks.keys())}")
+    def run_single_task(self, task_name: str, strategies: List[str] = None,
+                        comparison: Optional[SuccessiveElimination] = None,
+                        sample: Optional[StratifiedSample] = None) -> pd.DataFrame:
+        """Tek bir görevi çalıştır.
+        
+        comparison verilirse stratejiler ardışık elemeyle karşılaştırılır;
+        sample verilirse katmanlı alt örneklem değerlendirilir. Önceki
+        çalıştırmalardan kalan durdurma isteği temizlenir.
+        """
+        self.reset_stop()
+        return self._run_task(task_name, strategies, comparison, sample)
+    
+    def _run_task(self, task_name: str, strategies: Optional[List[str]],
+                  comparison: Optional[SuccessiveElimination],
+                  sample: Optional[StratifiedSample]) -> pd.DataFrame:
+        """Görevi mevcut durdurma isteğine uyarak çalıştır, sonuçları kaydet"""
+        task = self.get_task(task_name)
         
         if strategies is None:
             strategies = self.config.get(f'tasks.{task_name}.strategies', 
                                        ['zero_shot', 'one_shot', 'few_shot'])
         
         print(f"Running {task_name} with strategies: {strategies}")
-        task = self.tasks[task_name]
-        results_df = task.run_experiment(strategies)
+        
+        save_results = self.config.get('evaluation.save_results', True)
+        self.result_paths.pop(task_name, None)
+        sink_format = self.config.get('evaluation.result_sink', 'csv')
+        
+        state = self._progress[task_name] = {
+            "status": "running", "completed_units": 0, "started_at": time.time(), "finished_at": None
+        }
+        
+        def on_batch(units: int) -> None:
+            state["completed_units"] += units
+            if self.progress_view is not None:
+                self.progress_view.update(self.snapshot(task_name))
+        
+        run_options = {"stop_event": self._stop_event, "on_batch": on_batch}
+        if sample is not None:
+            # Örneklem seed ile belirlenir; günlükten devam etmek yerine yeniden seçilir
+            run = task.run_experiment
+            run_options.update(strategies=strategies, sample=sample)
+        elif comparison is None:
+            run = task.run_experiment
+            run_options.update(strategies=strategies, journal=self.journal)
+        else:
+            # Uyarlamalı dağıtım birim bazlı devam etmeye uymadığı için günlük kullanılmaz
+            run = task.run_comparison
+            run_options.update(comparison=comparison)
+        try:
+            # jsonl/parquet: sonuçlar batch batch diske eklenir, DataFrame dosyadan okunur
+            if save_results and sink_format != 'csv':
+                with self.data_handler.open_result_sink(
+                    task_name, sink_format, self.config.get('evaluation.sink_flush_every')
+                ) as sink:
+                    results_df = run(sink=sink, **run_options)
+            else:
+                results_df = run(**run_options)
+        except BaseException:
+            state["status"] = "failed"
+            raise
+        finally:
+            if state["status"] == "running":
+                state["status"] = "stopped" if self._stop_event.is_set() else "completed"
+            state["finished_at"] = time.time()
+            if self.progress_view is not None:
+                self.progress_view.update(self.snapshot(task_name), force=True)
+                self.progress_view.close()
+        
+        if save_results and sink_format != 'csv':
+            self.result_paths[task_name] = sink.path
+            print(f"Results saved to: {sink.path}")
+            self.export_telemetry()
+            return results_df
         
         # Sonuçları kaydet
-        if self.config.get('evaluation.save_results', True):
+        if save_results:
             filepath = self.data_handler.save_results(results_df, task_name)
+            self.result_paths[task_name] = filepath
             print(f"Results saved to: {filepath}")
         
+        self.export_telemetry()
         return results_df
     
+    def compare_strategies(self, task_name: str, strategies: Optional[List[str]] = None,
+                           adaptive: Optional[bool] = None) -> Tuple[pd.DataFrame, Optional[SuccessiveElimination]]:
+        """Görevin desteklediği stratejileri karşılaştır.
+        
+        strategies verilmezse görevin tüm stratejileri kullanılır; görevin
+        desteklemediği stratejiler ayıklanır. adaptive (varsayılan:
+        comparison.adaptive) açıksa ardışık eleme kullanılır ve eleme durumu da
+        döner; kapalıysa tüm stratejiler tüm veri üzerinde çalıştırılır.
+        """
+        task = self.get_task(task_name)
+        strategies = task.supported_strategies(strategies or task.available_strategies)
+        if not strategies:
+            raise ValueError(f"No supported strategies to compare for '{task_name}'")
+        
+        if adaptive is None:
+            adaptive = self.config.get('comparison.adaptive', False)
+        if not adaptive:
+            return self.run_single_task(task_name, strategies), None
+        
+        comparison = SuccessiveElimination.from_config(self.config, strategies)
+        return self.run_single_task(task_name, strategies, comparison=comparison), comparison
+    
+    def export_telemetry(self) -> Optional[str]:
+        """Toplanan telemetriyi (şimdiye kadarki tüm görevler) dosyaya yaz"""
+        if not self.telemetry.enabled or not self.telemetry_path:
+            return None
+        path = self.telemetry.export(self.telemetry_path, self.config.get('telemetry.format'))
+        print(f"Telemetry exported to: {path}")
+        return path
+    
     def run_all_tasks(self) -> Dict[str, pd.DataFrame]:
-        """Tüm görevleri çalıştır"""
+        """Tüm görevleri çalıştır (durdurma isteğinden sonra kalan görevler atlanır)"""
         all_results = {}
+        self.reset_stop()
         
-        for task_name in self.tasks.keys():
+        for task_name in self.list_available_tasks():
+            if self._stop_event.is_set():
+                print(f"Stop requested: {task_name} skipped")
+                continue
             try:
-                results_df = self.run_single_task(task_name)
+                results_df = self._run_task(task_name, None, None, None)
                 all_results[task_name] = results_df
                 print(f"✓ {task_name} completed")
             except Exception as e:
                 print(f"✗ {task_name} failed: {str(e)}")
         
+        # Özetler görevlerin çalışırken güncellediği toplayıcılardan okunur
+        aggregator = self.get_aggregator(list(all_results))
+        
         # Genel özet rapor oluştur
-        summary = self.data_handler.create_summary_report(all_results)
+        summary = self.data_handler.create_summary_report(all_results, aggregator)
         self.data_handler.save_json(summary, "experiment_summary.json")
         
-        # HTML raporu oluştur
+        # HTML raporu oluştur; kaydedilen görevlerin satırları dosyadan blok blok okunur
+        report_sources = {task_name: self.result_paths.get(task_name, results_df)
+                          for task_name, results_df in all_results.items()}
         try:
-            report_path = self.report_generator.generate_comprehensive_report(all_results)
+            report_path = self.report_generator.generate_comprehensive_report(report_sources, aggregator)
             print(f"Comprehensive report generated: {report_path}")
         except Exception as e:
             print(f"Warning: Could not generate HTML report: {e}")
         
         return all_results
     
-    def get_performance_summary(self, results_df: pd.DataFrame) -> pd.DataFrame:
+    def request_stop(self) -> None:
+        """Çalışmayı sıradaki batch'ten önce durdur (başka bir thread'den ya da sinyal işleyicisinden).
+        
+        O ana kadarki sonuçlar kaydedilir; günlük açıksa --resume ile devam edilebilir.
+        """
+        self._stop_event.set()
+    
+    def reset_stop(self) -> None:
+        """Durdurma isteğini temizle (run_single_task ve run_all_tasks başında çağrılır)"""
+        self._stop_event.clear()
+    
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop_event.is_set()
+    
+    def snapshot(self, task_name: Optional[str] = None) -> Dict[str, Any]:
+        """Çalışan ya da tamamlanan görevlerin anlık özeti (çalışma sürerken sorgulanabilir)"""
+        now = time.time()
+        tasks = {}
+        for name, state in list(self._progress.items()):
+            if task_name is not None and name != task_name:
+                continue
+            elapsed = (state["finished_at"] or now) - state["started_at"]
+            tasks[name] = {
+                **state,
+                "elapsed_seconds": elapsed,
+                "units_per_second": state["completed_units"] / elapsed if elapsed > 0 else 0.0,
+                **self.tasks[name].aggregator.snapshot()
+            }
+        return {
+            "run_id": self.journal.run_id if self.journal is not None else None,
+            "stop_requested": self._stop_event.is_set(),
+            "tasks": tasks
+        }
+    
+    def get_aggregator(self, task_names: Optional[List[str]] = None) -> ResultAggregator:
+        """Görevlerin son çalıştırmalarına ait özetleri (görev adıyla) birleştir"""
+        if task_names is None:
+            task_names = list(self.tasks)
+        aggregator = ResultAggregator()
+        for task_name in task_names:
+            task = self.tasks.get(task_name)
+            if task is not None:
+                aggregator.merge(task.aggregator, task=task_name)
+        return aggregator
+    
+    def get_performance_summary(self, results_df: pd.DataFrame,
+                                aggregator: Optional[ResultAggregator] = None) -> pd.DataFrame:
         """Performans özetini getir"""
-        return self.evaluator.calculate_strategy_performance(results_df)
+        return self.evaluator.calculate_strategy_performance(
+            results_df, self.config.get('model.pricing'), aggregator
+        )
     
-    def print_results_summary(self, results_df: pd.DataFrame):
-        """Sonuçları konsola yazdır"""
+    def print_results_summary(self, results_df: pd.DataFrame, aggregator: Optional[ResultAggregator] = None):
+        """Sonuçları konsola yazdır (aggregator verilmezse DataFrame'den bir kez hesaplanır)"""
         print("\n" + "="*50)
         print("EXPERIMENT RESULTS SUMMARY")
         print("="*50)
         
+        if aggregator is None:
+            aggregator = ResultAggregator.from_dataframe(results_df)
+        accuracy = aggregator.overall()
+        
         if 'Accuracy' in results_df.columns:
-            performance = self.get_performance_summary(results_df)
+            performance = self.get_performance_summary(results_df, aggregator)
             print("\nPerformance by Strategy:")
             print(performance.to_string(index=False))
         
-        print(f"\nTotal tests: {len(results_df)}")
-        print(f"Successful tests: {results_df['Accuracy'].notna().sum()}")
+        print(f"\nTotal tests: {len(aggregator)}")
+        print(f"Successful tests: {accuracy.count}")
         
         if 'Accuracy' in results_df.columns:
-            avg_accuracy = results_df['Accuracy'].mean()
-            print(f"Average accuracy: {avg_accuracy:.3f}")
+            print(f"Average accuracy: {accuracy.value:.3f}")
+        
+        if self.telemetry.enabled:
+            spans = self.telemetry.span_summary()
+            print("\nTime breakdown:")
+            for name in ("task.generate_prompt", "model.generate", "model.call",
+                         "rate_limit.acquire", "task.evaluate", "io.sink_flush", "io.save_results"):
+                if name in spans:
+                    print(f"  {name}: {spans[name]['total_seconds']:.3f}s ({spans[name]['count']} spans)")
+        
+        cache_stats = self.model_manager.cache_stats()
+        if cache_stats["enabled"]:
+            print(f"Response cache: {cache_stats['hits']} hits, "
+                  f"{cache_stats['misses']} misses "
+                  f"(hit rate {cache_stats['hit_rate']:.1%}, {cache_stats['entries']} entries)")
     
     def add_custom_task(self, task_name: str, task_instance):
         """Özel görev ekleme"""
@@ -127,17 +322,18 @@ class ExperimentRunner:
         print(f"Custom task '{task_name}' added")
     
     def list_available_tasks(self) -> List[str]:
-        """Mevcut görevleri listele"""
-        return list(self.tasks.keys())
+        """Mevcut görevleri listele (katalogdaki etkin görevler + özel görevler)"""
+        available = registry.list_tasks(self.config)
+        return available + [name for name in self.tasks if name not in available]
     
     def get_task_info(self, task_name: str) -> Dict[str, Any]:
         """Görev hakkında bilgi al"""
         if task_name not in self.tasks:
-            return {"error": f"Task '{task_name}' not found"}
+            return registry.get_task_info(task_name, self.config)
         
         task = self.tasks[task_name]
         return {
             "name": task.get_task_name(),
-            "test_data_count": len(task.get_test_data()),
-            "available_strategies": ["zero_shot", "one_shot", "few_shot"] # Default
+            "test_data_count": sum(1 for _ in task.iter_test_data()),
+            "available_strategies": list(task.available_strategies)
         }
\ No newline at end of file
@@ -1,6 +1,7 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Mapping, Optional, Tuple
 import json
 from dataclasses import dataclass
+from string import Formatter
 
 @dataclass
 class PromptTemplate:
@@ -12,10 +13,95 @@ class PromptTemplate:
     effectiveness_note: str
     use_case: str
 
+class CompiledTemplate:
+    """Sabit metin parçaları ve yer tutuculara bir kez ayrıştırılmış şablon.
+    
+    Yalnızca {ad}, {ad!r} ve {ad:biçim} biçimindeki adlandırılmış yer
+    tutucular desteklenir; konumsal ({} / {0}) ve nitelik/indeks erişimi
+    ({a.b} / {a[0]}) derleme sırasında ValueError ile reddedilir.
+    """
+    
+    __slots__ = ("source", "placeholders", "static_prefix", "_parts", "_slots", "_simple")
+    
+    def __init__(self, source: str):
+        self.source = source
+        parts: List[Optional[str]] = []
+        slots: List[Tuple[int, str, Optional[str], str]] = []
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as e:
+            raise ValueError(f"Invalid template: {e}")
+        
+        for literal, field_name, format_spec, conversion in parsed:
+            if literal:
+                parts.append(literal)
+            if field_name is None:
+                continue
+            if not field_name.isidentifier():
+                raise ValueError(f"Unsupported placeholder '{{{field_name}}}': use named fields like {{text}}")
+            if format_spec and "{" in format_spec:
+                raise ValueError(f"Nested placeholders are not supported: '{{{field_name}:{format_spec}}}'")
+            slots.append((len(parts), field_name, conversion, format_spec or ""))
+            parts.append(None)
+        
+        self._parts = parts
+        self._slots = tuple(slots)
+        # Dönüşüm/biçim içermeyen str değerler doğrudan yerleştirilebilir
+        self._simple = all(conversion is None and not format_spec for _, _, conversion, format_spec in slots)
+        self.placeholders = tuple(dict.fromkeys(name for _, name, _, _ in slots))
+        # İlk yer tutucudan önceki, tüm prompt'larda ortak olan metin (prefix/context caching için)
+        self.static_prefix = "".join(parts[:slots[0][0]] if slots else parts)
+    
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Yer tutucuları values ile doldur (eksik alan: KeyError, str.format gibi)"""
+        parts = self._parts.copy()
+        for index, name, conversion, format_spec in self._slots:
+            parts[index] = self._render_value(values[name], conversion, format_spec)
+        return "".join(parts)
+    
+    def render_many(self, rows: Iterable[Mapping[str, Any]]) -> List[str]:
+        """Her satır için şablonu doldur; parça listesi satırlar arasında yeniden kullanılır"""
+        slots = self._slots
+        if len(slots) == 1 and self._simple:
+            # Tek yer tutuculu şablonlar (kütüphanedekilerin tamamı): önek + değer + sonek
+            index, name, _, _ = slots[0]
+            prefix = "".join(self._parts[:index])
+            suffix = "".join(self._parts[index + 1:])
+            return [prefix + _as_text(row[name]) + suffix for row in rows]
+        
+        parts = self._parts.copy()
+        rendered = []
+        for row in rows:
+            for index, name, conversion, format_spec in slots:
+                parts[index] = self._render_value(row[name], conversion, format_spec)
+            rendered.append("".join(parts))
+        return rendered
+    
+    @staticmethod
+    def _render_value(value: Any, conversion: Optional[str], format_spec: str) -> str:
+        if conversion == "r":
+            value = repr(value)
+        elif conversion == "s":
+            value = str(value)
+        elif conversion == "a":
+            value = ascii(value)
+        if format_spec:
+            return format(value, format_spec)
+        return _as_text(value)
+
+def _as_text(value: Any) -> str:
+    return value if type(value) is str else format(value)
+
 class PromptLibrary:
     def __init__(self):
         self._templates: Dict[str, Dict[str, PromptTemplate]] = {}
         self._load_default_templates()
+        # Şablonlar bir kez derlenir; hatalı yer tutucular burada yakalanır
+        self._compiled: Dict[Tuple[str, str], CompiledTemplate] = {
+            (category, name): CompiledTemplate(template.template)
+            for category, templates in self._templates.items()
+            for name, template in templates.items()
+        }
     
     def _load_default_templates(self) -> None:
         """Varsayılan prompt şablonlarını yükle"""
@@ -103,7 +189,25 @@ Problem: {problem}
         """Kategori altındaki tüm template'leri getir"""
         return self._templates.get(category, {})
     
+    def get_compiled_template(self, category: str, template_name: str) -> CompiledTemplate:
+        """Derlenmiş template'i getir"""
+        compiled = self._compiled.get((category, template_name))
+        if compiled is None:
+            # get_template aynı KeyError'ı üretir
+            self.get_template(category, template_name)
+            compiled = self._compiled[(category, template_name)] = CompiledTemplate(
+                self._templates[category][template_name].template
+            )
+        return compiled
+    
     def format_prompt(self, category: str, template_name: str, **kwargs) -> str:
         """Template'i parametrelerle formatla"""
-        template = self.get_template(category, template_name)
-        return template.template.format(**kwargs)
\ No newline at end of file
+        return self.get_compiled_template(category, template_name).render(kwargs)
+    
+    def format_many(self, category: str, template_name: str, rows: Iterable[Mapping[str, Any]]) -> List[str]:
+        """Template'i her satırın parametreleriyle formatla (toplu üretim)"""
+        return self.get_compiled_template(category, template_name).render_many(rows)
+    
+    def get_static_prefix(self, category: str, template_name: str) -> str:
+        """Template'in tüm prompt'larda aynı kalan başlangıç metni"""
+        return self.get_compiled_template(category, template_name).static_prefix
\ No newline at end of file
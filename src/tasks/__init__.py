@@ -1,10 +1,25 @@
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple, Iterator, TYPE_CHECKING
 from dataclasses import dataclass
-import pandas as pd
+from ..analytics.aggregation import ResultAggregator
+from ..core.batching import chunked, run_batch
+from ..core.usage import GenerationResult
+from ..utils.result_sink import ResultSink
+from ..utils.result_store import ColumnarResultStore
+from ..utils.run_journal import RunJournal
+from ..utils.telemetry import telemetry
+from ..utils.dataset_loader import DatasetSource, InMemorySource, dataset_from_config
 
+if TYPE_CHECKING:
+    # pandas yalnızca DataFrame üretilirken yüklenir (hızlı CLI açılışı için)
+    import pandas as pd
+    from ..evaluation.sampling import StratifiedSample
+    from ..evaluation.sequential import SuccessiveElimination
 
-@dataclass
+
+@dataclass(slots=True)
 class TaskResult:
     task_name: str
     prompt_type: str
@@ -14,13 +29,53 @@ class TaskResult:
     expected_output: str = None
     accuracy: float = None
     metadata: Dict[str, Any] = None
+    input_tokens: int = None
+    output_tokens: int = None
+    latency_seconds: float = None
+    
+    def to_record(self) -> Dict[str, Any]:
+        """DataFrame / sonuç dosyası satırı olarak döndür"""
+        return {
+            "Task": self.task_name,
+            "Prompt Type": self.prompt_type,
+            "Prompt Format": self.prompt_format,
+            "Input": self.input_text,
+            "Response": self.model_response,
+            "Expected": self.expected_output,
+            "Accuracy": self.accuracy,
+            "Input Tokens": self.input_tokens,
+            "Output Tokens": self.output_tokens,
+            "Latency (s)": self.latency_seconds
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "TaskResult":
+        """to_record() çıktısından TaskResult oluştur"""
+        return cls(
+            task_name=record["Task"],
+            prompt_type=record["Prompt Type"],
+            prompt_format=record["Prompt Format"],
+            input_text=record["Input"],
+            model_response=record["Response"],
+            expected_output=record.get("Expected"),
+            accuracy=record.get("Accuracy"),
+            input_tokens=record.get("Input Tokens"),
+            output_tokens=record.get("Output Tokens"),
+            latency_seconds=record.get("Latency (s)")
+        )
 
 class BaseTask(ABC):
+    # settings.yaml içindeki tasks.<config_key> bloğu
+    config_key: str = None
+    available_strategies: List[str] = ["zero_shot", "one_shot", "few_shot"]
+    
     def __init__(self, model_manager, prompt_library, config):
         self.model_manager = model_manager
         self.prompt_library = prompt_library
         self.config = config
-        self.results: List[TaskResult] = []
+        self.results = ColumnarResultStore()
+        # Son çalıştırmanın strateji/format özetleri; sonuçlar saklanırken artımlı güncellenir
+        self.aggregator = ResultAggregator()
     
     @abstractmethod
     def get_task_name(self) -> str:
@@ -37,47 +92,318 @@ class BaseTask(ABC):
         """Model yanıtını değerlendir"""
         pass
     
-    def run_experiment(self, strategies: List[str] = None) -> pd.DataFrame:
-        """Görev deneyimini çalıştır"""
+    def evaluate_batch(self, expected: Sequence[str], actual: Sequence[str]) -> List[float]:
+        """Yanıt sütununu tek seferde puanla; görevler vektörel bir sürümle geçersiz kılabilir"""
+        return [self.evaluate_response(e, a) for e, a in zip(expected, actual)]
+    
+    def predict_labels(self, responses: Sequence[str]) -> Optional[List[Optional[str]]]:
+        """Yanıtlardan tahmin edilen etiketler (karışıklık sayaçları için); etiketsiz görevlerde None"""
+        return None
+    
+    def stratum_key(self, data_item: Dict[str, Any]) -> Any:
+        """Katmanlı örneklemede verinin katmanı; varsayılan olarak tek katman"""
+        return None
+    
+    def supported_strategies(self, strategies: Sequence[str]) -> List[str]:
+        """available_strategies içinde olmayan stratejileri (uyarıyla) ayıkla"""
+        supported = [strategy for strategy in strategies if strategy in self.available_strategies]
+        skipped = [strategy for strategy in strategies if strategy not in self.available_strategies]
+        if skipped:
+            print(f"Skipping strategies not supported by {self.get_task_name()}: {skipped}")
+        return supported
+    
+    def get_dataset_source(self) -> DatasetSource:
+        """tasks.<görev>.dataset ayarına göre veri kaynağını döndür.
+        
+        Ayar yoksa get_test_data() kullanılır; 'path' verilmeden yalnızca
+        offset/limit/sample_rate gibi seçenekler verilirse bunlar varsayılan
+        test verilerine uygulanır.
+        """
+        dataset_config = None
+        if self.config_key:
+            dataset_config = self.config.get(f'tasks.{self.config_key}.dataset')
+        
+        if not dataset_config:
+            return InMemorySource(self.get_test_data())
+        if 'path' not in dataset_config:
+            return InMemorySource(self.get_test_data(), **dataset_config)
+        return dataset_from_config(dataset_config)
+    
+    def iter_test_data(self) -> Iterator[Dict[str, Any]]:
+        """Test verilerini akış halinde döndür"""
+        return iter(self.get_dataset_source())
+    
+    def run_experiment(self, strategies: List[str] = None, sink: ResultSink = None,
+                       journal: RunJournal = None, stop_event: threading.Event = None,
+                       on_batch: Callable[[int], None] = None,
+                       sample: "StratifiedSample" = None) -> "pd.DataFrame":
+        """Görev deneyimini çalıştır.
+        
+        sink verilirse sonuçlar her batch sonunda sink'e yazılır, self.results'ta
+        tutulmaz ve dönen DataFrame sink'ten geri okunur. journal verilirse
+        günlükte tamamlanmış görünen birimler yeniden çalıştırılmaz; önceki
+        sonuçları çıktıya eklenir. stop_event set edilirse çalıştırma sıradaki
+        batch'ten önce durur ve o ana kadarki sonuçlar döner. on_batch her batch
+        sonunda işlenen birim sayısıyla çağrılır. sample verilirse tüm veri
+        yerine katmanlı bir alt örneklem değerlendirilir (bkz. _run_sample).
+        
+        Her çağrı yalnızca kendi sonuçlarını döndürür; self.results son
+        çalıştırmanın sonuçlarını tutar.
+        """
         if strategies is None:
             strategies = ["zero_shot", "one_shot", "few_shot"]
         
-        test_data = self.get_test_data()
+        self.reset_results()
+        
+        if sample is not None:
+            return self._run_sample(strategies, sample, sink, stop_event, on_batch)
+        
+        # Veri kaynağı her strateji için baştan akıtılır; bellekte yalnızca
+        # batch_size kadar birim tutulur
+        source = self.get_dataset_source()
+        units = ((strategy, data_item) for strategy in strategies for data_item in source)
+        batch_size = self.config.get('advanced_features.batch_size', 32)
         
-        for strategy in strategies:
-            for data_item in test_data:
-                self._run_single_test(strategy, data_item)
+        journal_task = self.config_key or self.get_task_name()
+        if journal is not None:
+            previous = (TaskResult.from_record(record)
+                        for record in journal.completed_records(journal_task)
+                        if record["Prompt Type"] in strategies)
+            self._store_results(list(previous), sink)
+            units = (unit for unit in units
+                     if not journal.is_completed(journal_task, unit[0], journal.item_id(unit[1])))
+        
+        for chunk in chunked(units, batch_size):
+            if stop_event is not None and stop_event.is_set():
+                print(f"Stop requested: {self.get_task_name()} stopped early")
+                break
+            results = self._execute_units(chunk)
+            self._store_results([result for result in results if result is not None], sink)
+            
+            if journal is not None:
+                journal.record_many(journal_task, (
+                    (strategy, journal.item_id(data_item), result.to_record())
+                    for (strategy, data_item), result in zip(chunk, results)
+                    if result is not None
+                ))
+            
+            if on_batch is not None:
+                on_batch(len(chunk))
         
+        if sink is not None:
+            return sink.read_dataframe()
         return self._results_to_dataframe()
     
-    def _run_single_test(self, strategy: str, data_item: Dict[str, Any]) -> None:
-        """Tek bir test durumunu çalıştır"""
-        try:
-            prompt = self._generate_prompt(strategy, data_item)
-            response = self.model_manager.generate(prompt)
+    def _run_sample(self, strategies: List[str], sample: "StratifiedSample", sink: Optional[ResultSink],
+                    stop_event: Optional[threading.Event],
+                    on_batch: Optional[Callable[[int], None]]) -> "pd.DataFrame":
+        """Katmanlı alt örneklemi, güven aralıkları hedef genişliğe inene kadar büyüterek değerlendir.
+        
+        Katman büyüklükleri için veri kaynağının tamamı belleğe alınır.
+        Günlük (journal) kullanılmaz; örneklem seed ile belirlendiğinden aynı
+        ayarlarla yeniden çalıştırma aynı verileri seçer.
+        """
+        sample.prepare(self.get_dataset_source(), self.stratum_key)
+        batch_size = self.config.get('advanced_features.batch_size', 32)
+        
+        while not sample.converged:
+            if stop_event is not None and stop_event.is_set():
+                print(f"Stop requested: {self.get_task_name()} stopped early")
+                break
+            drawn = sample.draw()
+            if not drawn:
+                break
             
-            accuracy = None
-            if "expected_output" in data_item:
-                accuracy = self.evaluate_response(
-                    data_item["expected_output"], 
-                    response
-                )
+            units = [(strategy, stratum, data_item) for strategy in strategies for stratum, data_item in drawn]
+            for chunk in chunked(units, batch_size):
+                results = self._execute_units([(strategy, data_item) for strategy, _, data_item in chunk])
+                self._store_results([result for result in results if result is not None], sink)
+                for (strategy, stratum, _), result in zip(chunk, results):
+                    if result is not None:
+                        sample.update(strategy, stratum, result.accuracy)
             
-            result = TaskResult(
-                task_name=self.get_task_name(),
-                prompt_type=strategy,
-                prompt_format=self._get_prompt_format_name(strategy),
-                input_text=data_item.get("input_text", ""),
-                model_response=response,
-                expected_output=data_item.get("expected_output"),
-                accuracy=accuracy,
-                metadata=data_item.get("metadata", {})
-            )
+            print(f"Sample {sample.sample_size}/{sample.population_size}: widest {sample.confidence:.0%} CI "
+                  f"{sample.max_ci_width:.3f} (target {sample.target_ci_width:.3f})")
+            if on_batch is not None:
+                on_batch(len(units))
+        
+        if sink is not None:
+            return sink.read_dataframe()
+        return self._results_to_dataframe()
+    
+    def run_comparison(self, comparison: "SuccessiveElimination", sink: ResultSink = None,
+                       stop_event: threading.Event = None,
+                       on_batch: Callable[[int], None] = None) -> "pd.DataFrame":
+        """Stratejileri ardışık elemeyle karşılaştır.
+        
+        Veri kaynağı tek kez akıtılır; her turda comparison.round_size veri,
+        yarışmada kalan stratejilerin her biriyle çalıştırılır ve puanlar
+        comparison'a verilir. Elenen stratejiler sonraki turlarda model çağrısı
+        almaz; kazanan ayrıştığında ya da veri bittiğinde çalıştırma durur.
+        Sonuçlar run_experiment'taki gibi saklanır ve DataFrame olarak döner.
+        """
+        self.reset_results()
+        batch_size = self.config.get('advanced_features.batch_size', 32)
+        
+        for items in chunked(iter(self.get_dataset_source()), comparison.round_size):
+            if stop_event is not None and stop_event.is_set():
+                print(f"Stop requested: {self.get_task_name()} stopped early")
+                break
+            
+            strategies = list(comparison.active)
+            units = [(strategy, data_item) for strategy in strategies for data_item in items]
+            results: List[Optional[TaskResult]] = []
+            for chunk in chunked(units, batch_size):
+                results.extend(self._execute_units(chunk))
+            self._store_results([result for result in results if result is not None], sink)
             
-            self.results.append(result)
+            for strategy in strategies:
+                comparison.update(strategy, [result.accuracy for result in results
+                                             if result is not None and result.prompt_type == strategy],
+                                  calls=len(items))
+            for strategy in comparison.end_round():
+                stats = comparison.stats[strategy]
+                print(f"Round {comparison.rounds}: eliminated {strategy} "
+                      f"(accuracy {stats.mean:.3f} over {stats.count} samples)")
             
+            if on_batch is not None:
+                on_batch(len(units))
+            if comparison.finished:
+                break
+        
+        if sink is not None:
+            return sink.read_dataframe()
+        return self._results_to_dataframe()
+    
+    def reset_results(self) -> None:
+        """Bellekte tutulan sonuçları ve özetleri temizle"""
+        self.results = ColumnarResultStore()
+        self.aggregator = ResultAggregator()
+    
+    def _store_results(self, results: List[TaskResult], sink: Optional[ResultSink]) -> None:
+        """Sonuçları özetlere ekle; sink'e yaz ya da bellekte biriktir.
+        
+        Sink kendi flush_every eşiğiyle (evaluation.sink_flush_every) diske yazar;
+        çökmede tamponda kalan satırlar ilerleme günlüğünden geri yüklenir.
+        """
+        if not results:
+            return
+        records = [result.to_record() for result in results]
+        predicted = self.predict_labels([result.model_response for result in results])
+        self.aggregator.add_records(records, self.config_key or self.get_task_name(), predicted)
+        if sink is not None:
+            sink.write_many(records)
+        else:
+            for record in records:
+                self.results.append_record(record)
+    
+    def _execute_units(self, units: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[TaskResult]]:
+        """Önce tüm prompt'ları oluştur, tek batch olarak gönder, yanıtları birimlere eşle"""
+        prompts = [self._build_prompt(strategy, data_item) for strategy, data_item in units]
+        pending = [index for index, prompt in enumerate(prompts) if prompt is not None]
+        with telemetry.span("task.generate_batch", task=self.get_task_name(), size=len(pending)):
+            responses = self._generate_responses([prompts[index] for index in pending])
+        
+        answered = []
+        for index, generation in zip(pending, responses):
+            strategy, data_item = units[index]
+            if isinstance(generation, Exception):
+                print(f"Test failed for {strategy}: {str(generation)}")
+                continue
+            answered.append((index, strategy, data_item, generation))
+        
+        accuracies = self._score_responses([(data_item, generation.text)
+                                            for _, _, data_item, generation in answered])
+        
+        results: List[Optional[TaskResult]] = [None] * len(units)
+        for (index, strategy, data_item, generation), accuracy in zip(answered, accuracies):
+            if isinstance(accuracy, Exception):
+                print(f"Test failed for {strategy}: {str(accuracy)}")
+                continue
+            results[index] = self._make_result(strategy, data_item, generation.text, accuracy, generation)
+        return results
+    
+    def _score_responses(self, pairs: List[Tuple[Dict[str, Any], str]]) -> List[Any]:
+        """(veri, yanıt) çiftlerini evaluate_batch ile puanla; hatalar exception olarak döner"""
+        accuracies: List[Any] = [None] * len(pairs)
+        scored = [index for index, (data_item, _) in enumerate(pairs) if "expected_output" in data_item]
+        if not scored:
+            return accuracies
+        
+        expected = [pairs[index][0]["expected_output"] for index in scored]
+        actual = [pairs[index][1] for index in scored]
+        try:
+            with telemetry.span("task.evaluate", task=self.get_task_name(), size=len(expected)):
+                scores = self.evaluate_batch(expected, actual)
+        except Exception:
+            # Toplu puanlama başarısızsa hatalı satırları ayırmak için tek tek puanla
+            scores = []
+            for expected_output, response in zip(expected, actual):
+                try:
+                    scores.append(self.evaluate_response(expected_output, response))
+                except Exception as e:
+                    scores.append(e)
+        
+        for index, score in zip(scored, scores):
+            accuracies[index] = score
+        return accuracies
+    
+    def _generate_responses(self, prompts: List[str]) -> List[Any]:
+        """Prompt'ları model yöneticisine toplu gönder; GenerationResult ya da exception döner"""
+        generate_batch = getattr(self.model_manager, 'generate_batch', None)
+        if generate_batch is not None and hasattr(self.model_manager, 'generate_with_usage'):
+            return generate_batch(prompts, return_exceptions=True, with_usage=True)
+        
+        if generate_batch is not None:
+            # Kullanım bilgisi vermeyen model yöneticileri: token sayıları tahmin edilir
+            responses = generate_batch(prompts, return_exceptions=True)
+            return [response if isinstance(response, Exception) else GenerationResult.estimate(prompt, response)
+                    for prompt, response in zip(prompts, responses)]
+        
+        # generate_batch sunmayan basit model yöneticileri için
+        def generate(prompt: str) -> GenerationResult:
+            start = time.perf_counter()
+            response = self.model_manager.generate(prompt)
+            return GenerationResult.estimate(prompt, response, time.perf_counter() - start)
+        
+        max_workers = 1
+        if self.config.get('advanced_features.parallel_processing', False):
+            max_workers = self.config.get('advanced_features.max_workers', 8)
+        return run_batch(
+            generate, prompts,
+            chunk_size=self.config.get('advanced_features.batch_size', 32),
+            max_workers=max_workers,
+            return_exceptions=True
+        )
+    
+    def _build_prompt(self, strategy: str, data_item: Dict[str, Any]) -> Optional[str]:
+        """Prompt oluştur; geçersiz strateji vb. durumda None döndür"""
+        try:
+            with telemetry.span("task.generate_prompt", strategy=strategy):
+                return self._generate_prompt(strategy, data_item)
         except Exception as e:
             print(f"Test failed for {strategy}: {str(e)}")
+            return None
+    
+    def _make_result(self, strategy: str, data_item: Dict[str, Any], response: str,
+                     accuracy: Optional[float], generation: Optional[GenerationResult] = None) -> TaskResult:
+        """Puanlanmış yanıttan TaskResult oluştur"""
+        usage = {}
+        if generation is not None:
+            usage = {"input_tokens": generation.input_tokens,
+                     "output_tokens": generation.output_tokens,
+                     "latency_seconds": generation.latency_seconds}
+        return TaskResult(
+            task_name=self.get_task_name(),
+            prompt_type=strategy,
+            prompt_format=self._get_prompt_format_name(strategy),
+            input_text=data_item.get("input_text", ""),
+            model_response=response,
+            expected_output=data_item.get("expected_output"),
+            accuracy=accuracy,
+            metadata=data_item.get("metadata", {}),
+            **usage
+        )
     
     @abstractmethod
     def _generate_prompt(self, strategy: str, data_item: Dict[str, Any]) -> str:
@@ -93,17 +419,6 @@ class BaseTask(ABC):
         }
         return format_names.get(strategy, strategy)
     
-    def _results_to_dataframe(self) -> pd.DataFrame:
+    def _results_to_dataframe(self) -> "pd.DataFrame":
         """Sonuçları DataFrame'e çevir"""
-        data = []
-        for result in self.results:
-            data.append({
-                "Task": result.task_name,
-                "Prompt Type": result.prompt_type,
-                "Prompt Format": result.prompt_format,
-                "Input": result.input_text,
-                "Response": result.model_response,
-                "Expected": result.expected_output,
-                "Accuracy": result.accuracy
-            })
-        return pd.DataFrame(data)
\ No newline at end of file
+        return self.results.to_dataframe()
\ No newline at end of file
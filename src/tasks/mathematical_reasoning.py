@@ -1,11 +1,27 @@
 import re
-from typing import List, Dict, Any
-import pandas as pd
+from typing import List, Dict, Any, Sequence, TYPE_CHECKING
 from . import BaseTask, TaskResult
+from ..analytics.aggregation import ResultAggregator
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Değerlendirme desenleri bir kez derlenir; tekil ve toplu puanlama aynı desenleri kullanır
+_NUMBER_PATTERN = re.compile(r'\b\d+\b')
+_CURRENCY_PATTERN = re.compile(r'tl|lira')
+_PRICE_TERMS_PATTERN = re.compile(r'fiyat|bilet|elma|portakal|kahve|çay')
+_NUMERIC_PRICE_PATTERN = re.compile(r'\d+\s*tl')
+_STEP_TERMS_PATTERN = re.compile(r'adım|önce|sonra|denklem')
+_MATH_TERMS_PATTERN = re.compile(r'bilinmeyen|değişken|çöz|hesap|toplam')
 
 class MathematicalReasoningTask(BaseTask):
+    config_key = "mathematical_reasoning"
+    available_strategies = ["vanilla", "zero_shot_cot", "few_shot_cot"]
+    
     def __init__(self, model_manager, prompt_library, config):
         super().__init__(model_manager, prompt_library, config)
+        # Puanlama ayrıntılarını yazdır (evaluation.debug_scoring)
+        self.debug_scoring = config.get('evaluation.debug_scoring', False)
     
     def get_task_name(self) -> str:
         return "Mathematical Reasoning - CoT"
@@ -33,6 +49,10 @@ class MathematicalReasoningTask(BaseTask):
             }
         ]
     
+    def stratum_key(self, data_item: Dict[str, Any]) -> str:
+        """Katmanlı örneklemede problem türü"""
+        return data_item.get("problem_type")
+    
     def _generate_prompt(self, strategy: str, data_item: Dict[str, Any]) -> str:
         """Strateji ve veri için prompt oluştur"""
         problem = data_item["input_text"]
@@ -59,10 +79,11 @@ class MathematicalReasoningTask(BaseTask):
         expected_numbers = self._extract_numbers(expected)
         actual_numbers = self._extract_numbers(actual)
         
-        print(f"Expected: {expected}")
-        print(f"Actual: {actual[:200]}...")
-        print(f"Expected numbers: {expected_numbers}")
-        print(f"Actual numbers: {actual_numbers}")
+        if self.debug_scoring:
+            print(f"Expected: {expected}")
+            print(f"Actual: {actual[:200]}...")
+            print(f"Expected numbers: {expected_numbers}")
+            print(f"Actual numbers: {actual_numbers}")
         
         # Çoklu değerlendirme kriterleri
         scores = []
@@ -82,11 +103,52 @@ class MathematicalReasoningTask(BaseTask):
         # Ağırlıklı ortalama
         total_score = sum(score * weight for _, score, weight in scores)
         
-        print(f"Scoring breakdown: {[(name, f'{score:.2f}') for name, score, _ in scores]}")
-        print(f"Final score: {total_score:.2f}")
+        if self.debug_scoring:
+            print(f"Scoring breakdown: {[(name, f'{score:.2f}') for name, score, _ in scores]}")
+            print(f"Final score: {total_score:.2f}")
         
         return total_score
     
+    def evaluate_batch(self, expected: Sequence[str], actual: Sequence[str]) -> List[float]:
+        """Yanıt sütununu tek seferde puanla - evaluate_response ile birebir aynı skorlar"""
+        if self.debug_scoring:
+            return super().evaluate_batch(expected, actual)
+        
+        import numpy as np
+        import pandas as pd
+        
+        responses = pd.Series(list(actual), dtype=object)
+        if responses.empty:
+            return []
+        lower = responses.str.lower()
+        
+        # 1. Sayısal doğruluk (beklenen yanıtlar az sayıda farklı değer alır)
+        expected_cache: Dict[str, List[int]] = {}
+        expected_numbers = [
+            expected_cache.setdefault(text, self._extract_numbers(text)) for text in expected
+        ]
+        numeric_score = np.array([
+            self._evaluate_numeric_accuracy(numbers, [int(n) for n in found])
+            for numbers, found in zip(expected_numbers, responses.str.findall(_NUMBER_PATTERN))
+        ], dtype=float)
+        
+        # 2. Format doğruluğu - tekil sürümdeki toplama sırası korunur
+        format_score = np.zeros(len(responses))
+        format_score = format_score + np.where(lower.str.contains(_CURRENCY_PATTERN, na=False), 0.3, 0.0)
+        format_score = format_score + np.where(lower.str.contains(_PRICE_TERMS_PATTERN, na=False), 0.4, 0.0)
+        format_score = format_score + np.where(lower.str.contains(_NUMERIC_PRICE_PATTERN, na=False), 0.3, 0.0)
+        format_score = np.minimum(format_score, 1.0)
+        
+        # 3. Açıklama kalitesi
+        explanation_score = np.zeros(len(responses))
+        explanation_score = explanation_score + np.where(lower.str.contains(_STEP_TERMS_PATTERN, na=False), 0.4, 0.0)
+        explanation_score = explanation_score + np.where(lower.str.contains(_MATH_TERMS_PATTERN, na=False), 0.3, 0.0)
+        explanation_score = explanation_score + np.where(responses.str.count('\n') > 3, 0.3, 0.0)
+        explanation_score = np.minimum(explanation_score, 1.0)
+        
+        total_score = numeric_score * 0.6 + format_score * 0.2 + explanation_score * 0.2
+        return total_score.tolist()
+    
     def _evaluate_numeric_accuracy(self, expected_numbers: List[int], actual_numbers: List[int]) -> float:
         """Sayısal doğruluk değerlendirmesi"""
         if not expected_numbers:
@@ -111,15 +173,15 @@ class MathematicalReasoningTask(BaseTask):
         score = 0.0
         
         # TL/Lira formatı
-        if "tl" in response_lower or "lira" in response_lower:
+        if _CURRENCY_PATTERN.search(response_lower):
             score += 0.3
         
         # Fiyat belirtimi
-        if any(word in response_lower for word in ["fiyat", "bilet", "elma", "portakal", "kahve", "çay"]):
+        if _PRICE_TERMS_PATTERN.search(response_lower):
             score += 0.4
         
         # Sayısal format (X TL şeklinde)
-        if re.search(r'\d+\s*tl', response_lower):
+        if _NUMERIC_PRICE_PATTERN.search(response_lower):
             score += 0.3
         
         return min(score, 1.0)
@@ -130,12 +192,11 @@ class MathematicalReasoningTask(BaseTask):
         score = 0.0
         
         # Adım adım çözüm
-        if any(word in response_lower for word in ["adım", "önce", "sonra", "denklem"]):
+        if _STEP_TERMS_PATTERN.search(response_lower):
             score += 0.4
         
         # Matematiksel terimler
-        math_terms = ["bilinmeyen", "değişken", "çöz", "hesap", "toplam"]
-        if any(term in response_lower for term in math_terms):
+        if _MATH_TERMS_PATTERN.search(response_lower):
             score += 0.3
         
         # Yapılandırılmış sunum
@@ -146,22 +207,23 @@ class MathematicalReasoningTask(BaseTask):
     
     def _extract_numbers(self, text: str) -> List[int]:
         """Metinden sayıları çıkar"""
-        numbers = re.findall(r'\b\d+\b', text)
+        numbers = _NUMBER_PATTERN.findall(text)
         return [int(n) for n in numbers]
     
-    def run_experiment(self, strategies: List[str] = None) -> pd.DataFrame:
+    def run_experiment(self, strategies: List[str] = None, **kwargs) -> "pd.DataFrame":
         """CoT için özel strateji listesi"""
         if strategies is None:
             strategies = ["vanilla", "zero_shot_cot", "few_shot_cot"]
         
-        return super().run_experiment(strategies)
+        return super().run_experiment(strategies, **kwargs)
     
-    def get_detailed_analysis(self, results_df: pd.DataFrame) -> Dict[str, Any]:
+    def get_detailed_analysis(self, results_df: "pd.DataFrame") -> Dict[str, Any]:
         """Detaylı analiz raporu"""
+        aggregator = ResultAggregator.from_dataframe(results_df)
         analysis = {
             "overview": {
-                "total_tests": len(results_df),
-                "average_accuracy": results_df['Accuracy'].mean(),
+                "total_tests": len(aggregator),
+                "average_accuracy": aggregator.overall().value,
                 "perfect_scores": (results_df['Accuracy'] == 1.0).sum()
             },
             "strategy_performance": {},
@@ -169,18 +231,15 @@ class MathematicalReasoningTask(BaseTask):
         }
         
         # Strateji bazında analiz
-        for strategy in results_df['Prompt Type'].unique():
-            strategy_data = results_df[results_df['Prompt Type'] == strategy]
+        for (strategy,), stats in aggregator.grouped().items():
             analysis["strategy_performance"][strategy] = {
-                "accuracy": strategy_data['Accuracy'].mean(),
-                "consistency": 1 - strategy_data['Accuracy'].std(),  # Düşük std = yüksek tutarlılık
-                "test_count": len(strategy_data)
+                "accuracy": stats.value,
+                "consistency": 1 - stats.std,  # Düşük std = yüksek tutarlılık
+                "test_count": stats.count
             }
         
         # Öneriler
-        best_strategy = max(analysis["strategy_performance"].items(), 
-                          key=lambda x: x[1]["accuracy"])[0]
-        analysis["recommendations"].append(f"En iyi performans: {best_strategy}")
+        analysis["recommendations"].append(f"En iyi performans: {aggregator.best_strategy()}")
         
         if analysis["overview"]["average_accuracy"] < 0.8:
             analysis["recommendations"].append("Prompt'ların iyileştirilmesi önerilir")
@@ -0,0 +1,97 @@
+import importlib
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from typing import Any, Dict, List
+
+# Harici paketler görevlerini bu entry point grubu ile kaydeder:
+#   [project.entry-points."prompt_engineering.tasks"]
+#   my_task = "my_package.tasks:MyTask"
+ENTRY_POINT_GROUP = "prompt_engineering.tasks"
+
+
+@dataclass
+class TaskSpec:
+    name: str
+    module: str
+    class_name: str
+    description: str = ""
+
+    def load_class(self) -> type:
+        """Görev sınıfını içeren modülü ilk kullanımda yükle"""
+        module = importlib.import_module(self.module, __package__)
+        return getattr(module, self.class_name)
+
+
+_REGISTRY: Dict[str, TaskSpec] = {}
+_entry_points_loaded = False
+
+
+def register_task(name: str, module: str, class_name: str, description: str = "") -> TaskSpec:
+    """Görevi modülünü import etmeden kataloğa ekle"""
+    spec = TaskSpec(name, module, class_name, description)
+    _REGISTRY[name] = spec
+    return spec
+
+
+def _load_entry_points() -> None:
+    """Kurulu eklenti paketlerinin görevlerini (modüllerini import etmeden) kataloğa ekle"""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in _REGISTRY:
+            continue  # Açıkça kaydedilen görevler önceliklidir
+        module, _, class_name = entry_point.value.partition(":")
+        register_task(entry_point.name, module.strip(), class_name.strip(),
+                      f"Plugin task ({entry_point.value})")
+
+
+def get_task_spec(name: str) -> TaskSpec:
+    _load_entry_points()
+    if name not in _REGISTRY:
+        raise ValueError(f"Task '{name}' not found. Available tasks: {list(_REGISTRY)}")
+    return _REGISTRY[name]
+
+
+def registered_tasks() -> List[str]:
+    """Kayıtlı tüm görev adları"""
+    _load_entry_points()
+    return list(_REGISTRY)
+
+
+def list_tasks(config=None) -> List[str]:
+    """Ayarlarda devre dışı bırakılmamış görev adları"""
+    return [name for name in registered_tasks()
+            if config is None or config.get(f'tasks.{name}.enabled', True)]
+
+
+def create_task(name: str, model_manager, prompt_library, config):
+    """Görev örneği oluştur"""
+    task_class = get_task_spec(name).load_class()
+    return task_class(model_manager, prompt_library, config)
+
+
+def get_task_info(name: str, config) -> Dict[str, Any]:
+    """ModelManager oluşturmadan görev bilgisi döndür"""
+    if name not in registered_tasks():
+        return {"error": f"Task '{name}' not found"}
+    
+    task = create_task(name, None, None, config)
+    return {
+        "name": task.get_task_name(),
+        "test_data_count": sum(1 for _ in task.iter_test_data()),
+        "available_strategies": list(task.available_strategies)
+    }
+
+
+# Yerleşik görevler
+register_task(
+    "text_classification", ".text_classification", "TextClassificationTask",
+    "Duygu analizi (Olumlu/Olumsuz/Nötr)"
+)
+register_task(
+    "mathematical_reasoning", ".mathematical_reasoning", "MathematicalReasoningTask",
+    "İki bilinmeyenli denklem sistemleri (Chain-of-Thought)"
+)
@@ -1,11 +1,16 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence
 from . import BaseTask, TaskResult
+from ..utils.keyword_matcher import KeywordMatcher
 import re
 
 class TextClassificationTask(BaseTask):
+    config_key = "text_classification"
+    
     def __init__(self, model_manager, prompt_library, config):
         super().__init__(model_manager, prompt_library, config)
         self.valid_labels = ["Olumlu", "Olumsuz", "Nötr"]
+        # Tüm etiketler yanıt üzerinde tek geçişte aranır
+        self._label_matcher = KeywordMatcher(self.valid_labels)
     
     def get_task_name(self) -> str:
         return "Text Classification - Sentiment Analysis"
@@ -72,34 +77,21 @@ Duygu:"""
             return 1.0
         return 0.0
     
+    def stratum_key(self, data_item: Dict[str, Any]) -> Optional[str]:
+        """Katmanlı örneklemede beklenen etiket"""
+        return data_item.get("expected_output")
+    
+    def predict_labels(self, responses: Sequence[str]) -> List[Optional[str]]:
+        """Yanıtlardan çıkarılan sınıf etiketleri"""
+        return [self._extract_label(response) for response in responses]
+    
     def _extract_label(self, response: str) -> str:
         """Model yanıtından sınıf etiketini çıkar"""
-        response_lower = response.lower().strip()
-        
-        # Doğrudan eşleşme kontrolü
-        for label in self.valid_labels:
-            if label.lower() in response_lower:
-                return label
-        
-        # JSON formatında kontrol
-        if "olumlu" in response_lower:
-            return "Olumlu"
-        elif "olumsuz" in response_lower:
-            return "Olumsuz"
-        elif "nötr" in response_lower:
-            return "Nötr"
-        
-        return None
+        # Birden fazla etiket geçiyorsa valid_labels sırası önceliklidir
+        # (JSON yanıtlar da etiketi metin olarak içerdiği için ayrıca ele alınmaz)
+        return self._label_matcher.first_of(response, self.valid_labels)
     
     def get_accuracy_summary(self) -> Dict[str, float]:
-        """Strateji bazında doğruluk özetini döndür"""
-        summary = {}
-        
-        for strategy in ["zero_shot", "one_shot", "few_shot"]:
-            strategy_results = [r for r in self.results if r.prompt_type == strategy]
-            if strategy_results:
-                accuracies = [r.accuracy for r in strategy_results if r.accuracy is not None]
-                if accuracies:
-                    summary[strategy] = sum(accuracies) / len(accuracies)
-        
-        return summary
\ No newline at end of file
+        """Strateji bazında doğruluk özetini döndür (sink kullanılan çalıştırmalarda da geçerli)"""
+        means = self.aggregator.strategy_means()
+        return {strategy: means[strategy] for strategy in ["zero_shot", "one_shot", "few_shot"] if strategy in means}
\ No newline at end of file
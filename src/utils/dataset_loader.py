@@ -0,0 +1,149 @@
+import csv
+import json
+import os
+import random
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class DatasetSource(ABC):
+    """Test verisini satır satır, tembel (generator) olarak okuyan kaynak.
+
+    Filtreler şu sırayla uygulanır: shard -> örnekleme -> offset -> limit.
+    Kaynak yeniden iterate edilebilir; her iterasyon dosyayı baştan okur ve
+    aynı seed ile aynı satırları üretir.
+    """
+
+    def __init__(self, offset: int = 0, limit: Optional[int] = None,
+                 shard_index: int = 0, num_shards: int = 1,
+                 sample_rate: Optional[float] = None, seed: int = 42):
+        if num_shards < 1 or not 0 <= shard_index < num_shards:
+            raise ValueError(f"Invalid shard {shard_index}/{num_shards}")
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise ValueError(f"sample_rate must be in (0, 1]: {sample_rate}")
+
+        self.offset = offset
+        self.limit = limit
+        self.shard_index = shard_index
+        self.num_shards = num_shards
+        self.sample_rate = sample_rate
+        self.seed = seed
+
+    @abstractmethod
+    def _iter_raw(self) -> Iterator[Dict[str, Any]]:
+        """Ham satırları sırayla üret"""
+        pass
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        rows: Iterable[Dict[str, Any]] = self._iter_raw()
+
+        if self.num_shards > 1:
+            rows = (row for index, row in enumerate(rows)
+                    if index % self.num_shards == self.shard_index)
+
+        if self.sample_rate is not None and self.sample_rate < 1:
+            rng = random.Random(self.seed)
+            rows = (row for row in rows if rng.random() < self.sample_rate)
+
+        stop = self.offset + self.limit if self.limit is not None else None
+        return islice(rows, self.offset, stop)
+
+
+class InMemorySource(DatasetSource):
+    """Bellekteki satır listesini kaynak olarak sun (varsayılan test verileri için)"""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], **options: Any):
+        super().__init__(**options)
+        self.rows = rows
+
+    def _iter_raw(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.rows)
+
+
+class JsonlSource(DatasetSource):
+    """Her satırı bir JSON nesnesi olan dosyayı akış halinde oku"""
+
+    def __init__(self, path: str, **options: Any):
+        super().__init__(**options)
+        self.path = path
+
+    def _iter_raw(self) -> Iterator[Dict[str, Any]]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+class CsvSource(DatasetSource):
+    """CSV dosyasını akış halinde oku; json_columns içindeki hücreler JSON olarak çözülür"""
+
+    def __init__(self, path: str, delimiter: str = ',',
+                 json_columns: Optional[List[str]] = None, **options: Any):
+        super().__init__(**options)
+        self.path = path
+        self.delimiter = delimiter
+        self.json_columns = json_columns or []
+
+    def _iter_raw(self) -> Iterator[Dict[str, Any]]:
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f, delimiter=self.delimiter):
+                for column in self.json_columns:
+                    if row.get(column):
+                        row[column] = json.loads(row[column])
+                yield row
+
+
+class ParquetSource(DatasetSource):
+    """Parquet dosyasını record batch'ler halinde oku (pyarrow gerekir)"""
+
+    def __init__(self, path: str, batch_size: int = 1024, **options: Any):
+        super().__init__(**options)
+        self.path = path
+        self.batch_size = batch_size
+
+    def _iter_raw(self) -> Iterator[Dict[str, Any]]:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet datasets require pyarrow: pip install pyarrow")
+
+        parquet_file = pq.ParquetFile(self.path)
+        for batch in parquet_file.iter_batches(batch_size=self.batch_size):
+            yield from batch.to_pylist()
+
+
+_SOURCES = {
+    "jsonl": JsonlSource,
+    "csv": CsvSource,
+    "parquet": ParquetSource,
+}
+
+_EXTENSIONS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+
+
+def open_dataset(path: str, format: Optional[str] = None, **options: Any) -> DatasetSource:
+    """Dosya uzantısından (veya format parametresinden) uygun kaynağı oluştur"""
+    if format is None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in _EXTENSIONS:
+            raise ValueError(f"Cannot infer dataset format from '{path}'")
+        format = _EXTENSIONS[extension]
+
+    if format not in _SOURCES:
+        raise ValueError(f"Unknown dataset format: {format}. Available: {list(_SOURCES)}")
+
+    return _SOURCES[format](path, **options)
+
+
+def dataset_from_config(dataset_config: Dict[str, Any]) -> DatasetSource:
+    """tasks.<görev>.dataset ayar bloğundan kaynak oluştur"""
+    options = dict(dataset_config)
+    path = options.pop("path")
+    return open_dataset(path, **options)
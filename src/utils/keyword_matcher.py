@@ -0,0 +1,79 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# str.lower() Türkçe büyük harfleri yanlış küçültür: 'İ' -> 'i̇' (iki karakter), 'I' -> 'i'
+_TURKISH_UPPER = str.maketrans({"İ": "i", "I": "ı"})
+
+
+def turkish_casefold(text: str) -> str:
+    """Türkçe kurallarına göre küçük harfe çevir (İ -> i, I -> ı)"""
+    return text.translate(_TURKISH_UPPER).lower()
+
+
+class KeywordMatcher:
+    """Anahtar kelimeleri metinde tek geçişte bulan Aho-Corasick otomatı.
+
+    Otomat oluşturulurken anahtar kelimeler, aranırken metin Türkçe kurallarıyla
+    küçültülür. Eşleşmeler alt dize olarak aranır (``keyword in text`` ile aynı).
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            self._add(turkish_casefold(keyword), index)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, index: int) -> None:
+        if not pattern:
+            raise ValueError("Keywords must be non-empty")
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(index)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Sonek olarak içerilen anahtar kelimeler de bu durumda eşleşir
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(bitiş konumu, anahtar kelime) çiftlerini metin sırasıyla üret"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for position, char in enumerate(turkish_casefold(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield position + 1, self.keywords[index]
+
+    def find_all(self, text: str) -> Set[str]:
+        """Metinde geçen tüm anahtar kelimeler"""
+        return {keyword for _, keyword in self.iter_matches(text)}
+
+    def first_of(self, text: str, candidates: Iterable[str]) -> Optional[str]:
+        """candidates sırasına göre metinde geçen ilk anahtar kelime (yoksa None)"""
+        found = self.find_all(text)
+        for candidate in candidates:
+            if candidate in found:
+                return candidate
+        return None
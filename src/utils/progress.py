@@ -0,0 +1,64 @@
+import math
+import sys
+import time
+from typing import Any, Dict, List, Optional, TextIO
+
+
+class ProgressView:
+    """Çalışan görevin anlık doğruluk özetini terminalde gösteren canlı görünüm.
+
+    ExperimentRunner.snapshot() çıktısını alır; en fazla min_interval saniyede
+    bir çizer. Terminalde önceki blok silinip yerine yazılır, terminal dışında
+    (log dosyası vb.) bloklar alt alta eklenir.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, min_interval: float = 1.0):
+        self.stream = stream if stream is not None else sys.stdout
+        self.min_interval = min_interval
+        self._interactive = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self._last_render = 0.0
+        self._lines = 0
+
+    def update(self, snapshot: Dict[str, Any], force: bool = False) -> bool:
+        """Snapshot'ı çiz; aralık dolmadıysa (force değilse) atla. Çizildiyse True"""
+        now = time.monotonic()
+        if not force and now - self._last_render < self.min_interval:
+            return False
+        self._last_render = now
+
+        lines = self.render(snapshot)
+        if self._interactive and self._lines:
+            # İmleci önceki bloğun başına taşı ve ekranın kalanını temizle
+            self.stream.write(f"\x1b[{self._lines}F\x1b[J")
+        self.stream.write("\n".join(lines) + "\n")
+        self.stream.flush()
+        self._lines = len(lines)
+        return True
+
+    def close(self) -> None:
+        """Son bloğu ekranda bırak; sonraki çıktı onun altına yazılır"""
+        self._lines = 0
+
+    @staticmethod
+    def render(snapshot: Dict[str, Any]) -> List[str]:
+        """Snapshot'ı metin satırlarına çevir"""
+        lines = []
+        for task_name, task in snapshot["tasks"].items():
+            accuracy = task["accuracy"]
+            lines.append(
+                f"[{task_name}] {task['status']} - {task['completed_units']} units, "
+                f"{task['units_per_second']:.1f} units/s, accuracy {_format(accuracy['mean'])}"
+            )
+            lines.append(f"  {'strategy':<16}{'n':>6}{'mean':>8}  {'95% CI':<16}{'std':>7}")
+            for strategy, stats in task["strategies"].items():
+                marker = "  *best" if strategy == task["best_strategy"] else ""
+                interval = f"[{_format(stats['ci_low'])}, {_format(stats['ci_high'])}]"
+                lines.append(f"  {str(strategy):<16}{stats['count']:>6}{_format(stats['mean']):>8}  "
+                             f"{interval:<16}{_format(stats['std']):>7}{marker}")
+        if snapshot.get("stop_requested"):
+            lines.append("Stop requested - finishing the current batch")
+        return lines
+
+
+def _format(value: float) -> str:
+    return "-" if value is None or math.isnan(value) else f"{value:.3f}"
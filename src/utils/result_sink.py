@@ -0,0 +1,188 @@
+import json
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TYPE_CHECKING
+
+from .telemetry import telemetry
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Parquet şemasında sayısal tutulacak sütunlar; diğerleri metin olarak yazılır
+NUMERIC_COLUMNS = {"Accuracy", "Input Tokens", "Output Tokens", "Latency (s)"}
+
+
+class ResultSink(ABC):
+    """Sonuçları tamamlandıkça diske ekleyen (append-only) akış hedefi.
+
+    Satırlar flush_every dolunca ya da flush()/close() çağrılınca yazılır;
+    böylece çökme anında yalnızca son yazılmamış tampon kaybolur.
+    """
+
+    extension = ""
+
+    def __init__(self, path: str, flush_every: int = 100):
+        self.path = path
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._closed = False
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Tek satırı tampona ekle"""
+        self._buffer.append(row)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def write_many(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Birden fazla satırı tampona ekle"""
+        for row in rows:
+            self.write(row)
+
+    def flush(self) -> None:
+        """Tampondaki satırları diske yaz"""
+        if not self._buffer:
+            return
+        with telemetry.span("io.sink_flush", rows=len(self._buffer)):
+            self._write_rows(self._buffer)
+        self.rows_written += len(self._buffer)
+        self._buffer = []
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._close()
+        self._closed = True
+
+    def read_dataframe(self) -> "pd.DataFrame":
+        """Şimdiye kadar yazılan sonuçları DataFrame olarak oku"""
+        self.flush()
+        if self.rows_written == 0:
+            import pandas as pd
+            return pd.DataFrame()
+        return self._read()
+
+    @abstractmethod
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Satırları dosyaya ekle"""
+        pass
+
+    def _close(self) -> None:
+        pass
+
+    @abstractmethod
+    def _read(self) -> "pd.DataFrame":
+        """Yazılan dosyayı DataFrame olarak oku"""
+        pass
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class JsonlResultSink(ResultSink):
+    """Her sonucu bir JSON satırı olarak ekleyen hedef"""
+
+    extension = ".jsonl"
+
+    def __init__(self, path: str, flush_every: int = 100):
+        super().__init__(path, flush_every)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+    def _read(self) -> "pd.DataFrame":
+        return read_jsonl(self.path)
+
+
+class ParquetResultSink(ResultSink):
+    """Her flush'ı ayrı bir row group olarak yazan Parquet hedefi (pyarrow gerekir)"""
+
+    extension = ".parquet"
+
+    def __init__(self, path: str, flush_every: int = 1000):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("Parquet result sink requires pyarrow: pip install pyarrow")
+        super().__init__(path, flush_every)
+        self._writer = None
+        self._schema = None
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._schema = pa.schema([
+                (column, pa.float64() if column in NUMERIC_COLUMNS else pa.string())
+                for column in rows[0]
+            ])
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+
+        table = pa.Table.from_pylist(rows, schema=self._schema)
+        self._writer.write_table(table)
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+    def _read(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        # Açık writer'ın footer'ı yazılmadan dosya okunamaz
+        self.close()
+        return pd.read_parquet(self.path)
+
+
+_SINKS = {
+    "jsonl": JsonlResultSink,
+    "parquet": ParquetResultSink,
+}
+
+
+def open_result_sink(path: str, format: str = "jsonl", flush_every: Optional[int] = None) -> ResultSink:
+    """Formata göre sonuç hedefi oluştur"""
+    if format not in _SINKS:
+        raise ValueError(f"Unknown result sink format: {format}. Available: {list(_SINKS)}")
+    sink_class = _SINKS[format]
+    if flush_every is None:
+        return sink_class(path)
+    return sink_class(path, flush_every=flush_every)
+
+
+def read_jsonl(path: str) -> "pd.DataFrame":
+    """JSONL sonuç dosyasını DataFrame olarak oku"""
+    import pandas as pd
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return pd.DataFrame.from_records(json.loads(line) for line in f if line.strip())
+
+
+def read_result_chunks(path: str, chunk_rows: int = 10000) -> Iterator["pd.DataFrame"]:
+    """Sonuç dosyasını (.jsonl, .parquet ya da .csv) en fazla chunk_rows satırlık parçalar halinde oku"""
+    import pandas as pd
+
+    if path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            records = (json.loads(line) for line in f if line.strip())
+            while True:
+                chunk = list(islice(records, chunk_rows))
+                if not chunk:
+                    return
+                yield pd.DataFrame.from_records(chunk)
+    elif path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, encoding='utf-8', chunksize=chunk_rows)
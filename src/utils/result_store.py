@@ -0,0 +1,174 @@
+import math
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Az sayıda farklı değer alan sütunlar sözlük kodlaması ile tutulur
+CATEGORICAL_COLUMNS = ("Task", "Prompt Type", "Prompt Format")
+TEXT_COLUMNS = ("Input", "Response", "Expected")
+NUMERIC_COLUMNS = ("Accuracy", "Input Tokens", "Output Tokens", "Latency (s)")
+# float64 dizisinde tutulup satır okunurken tekrar int'e çevrilen sütunlar
+INTEGER_COLUMNS = ("Input Tokens", "Output Tokens")
+COLUMNS = ("Task", "Prompt Type", "Prompt Format", "Input", "Response", "Expected", "Accuracy",
+           "Input Tokens", "Output Tokens", "Latency (s)")
+
+
+class CategoricalColumn:
+    """Değerleri int32 kod dizisi + kategori listesi olarak tutan sütun"""
+
+    __slots__ = ("categories", "codes", "_index")
+
+    def __init__(self):
+        self.categories: List[Any] = []
+        self.codes = array('i')
+        self._index: Dict[Any, int] = {}
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            code = -1
+        else:
+            code = self._index.get(value)
+            if code is None:
+                code = len(self.categories)
+                self._index[value] = code
+                self.categories.append(value)
+        _append_to_array(self, "codes", code)
+
+    def value(self, position: int) -> Any:
+        code = self.codes[position]
+        return None if code < 0 else self.categories[code]
+
+    def to_categorical(self) -> "pd.Categorical":
+        import numpy as np
+        import pandas as pd
+
+        # Kod dizisi kopyalanmadan salt okunur numpy görünümü olarak kullanılır
+        codes = np.frombuffer(self.codes, dtype=np.int32)
+        codes.setflags(write=False)
+        return pd.Categorical.from_codes(codes, categories=self.categories)
+
+
+class NumericColumn:
+    """Değerleri float64 dizisinde (None -> NaN) tutan sütun"""
+
+    __slots__ = ("values", "integer")
+
+    def __init__(self, integer: bool = False):
+        self.values = array('d')
+        self.integer = integer
+
+    def append(self, value: Any) -> None:
+        _append_to_array(self, "values", math.nan if value is None else float(value))
+
+    def value(self, position: int) -> Any:
+        value = self.values[position]
+        if math.isnan(value):
+            return None
+        return int(value) if self.integer else value
+
+    def to_numpy(self) -> "np.ndarray":
+        """Dizinin salt okunur, kopyasız görünümü (DataFrame üzerinden depo değiştirilemez)"""
+        import numpy as np
+
+        values = np.frombuffer(self.values, dtype=np.float64)
+        values.setflags(write=False)
+        return values
+
+    def to_series_values(self) -> Any:
+        """DataFrame sütunu: tamsayı sütunları nullable Int64 (kopya), diğerleri kopyasız float64"""
+        if not self.integer:
+            return self.to_numpy()
+        import numpy as np
+        import pandas as pd
+
+        values = self.to_numpy()
+        missing = np.isnan(values)
+        return pd.arrays.IntegerArray(np.where(missing, 0, values).astype(np.int64), missing)
+
+
+class ColumnarResultStore:
+    """TaskResult'ları satır nesneleri yerine sütun dizilerinde biriktiren depo.
+
+    Kategorik sütunlar sözlük kodlanır, sayısal sütunlar (Accuracy, token
+    sayıları, gecikme) float64 dizilerinde (None -> NaN) tutulur. to_dataframe() dizileri kopyalamadan salt okunur
+    görünümler olarak DataFrame'e sarar (token sayıları nullable Int64 olarak
+    kopyalanır); iterasyon geriye dönük uyumluluk için TaskResult nesneleri üretir.
+    """
+
+    def __init__(self):
+        self._categorical = {column: CategoricalColumn() for column in CATEGORICAL_COLUMNS}
+        self._text: Dict[str, List[Optional[str]]] = {column: [] for column in TEXT_COLUMNS}
+        self._numeric = {column: NumericColumn(integer=column in INTEGER_COLUMNS) for column in NUMERIC_COLUMNS}
+
+    def append(self, result) -> None:
+        """TaskResult ekle"""
+        self.append_record(result.to_record())
+
+    def extend(self, results: Iterable) -> None:
+        for result in results:
+            self.append(result)
+
+    def append_record(self, record: Dict[str, Any]) -> None:
+        """to_record() biçimindeki satırı ekle"""
+        for column in CATEGORICAL_COLUMNS:
+            self._categorical[column].append(record.get(column))
+        for column in TEXT_COLUMNS:
+            self._text[column].append(record.get(column))
+        for column in NUMERIC_COLUMNS:
+            self._numeric[column].append(record.get(column))
+
+    def __len__(self) -> int:
+        return len(self._numeric["Accuracy"].values)
+
+    def __iter__(self) -> Iterator:
+        from ..tasks import TaskResult
+
+        for position in range(len(self)):
+            yield TaskResult.from_record(self.record(position))
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """Tek satırı to_record() biçiminde döndür"""
+        record: Dict[str, Any] = {}
+        for column in CATEGORICAL_COLUMNS:
+            record[column] = self._categorical[column].value(position)
+        for column in TEXT_COLUMNS:
+            record[column] = self._text[column][position]
+        for column in NUMERIC_COLUMNS:
+            record[column] = self._numeric[column].value(position)
+        return record
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Sütun dizilerinden kopyasız DataFrame oluştur.
+        
+        Sayısal ve kategorik sütunlar deponun salt okunur görünümleridir; yerinde
+        değiştirmek için önce DataFrame.copy() kullanılmalıdır.
+        """
+        import pandas as pd
+
+        if len(self) == 0:
+            return pd.DataFrame()
+
+        data: Dict[str, Any] = {}
+        for column in COLUMNS:
+            if column in self._categorical:
+                data[column] = self._categorical[column].to_categorical()
+            elif column in self._text:
+                data[column] = self._text[column]
+            else:
+                data[column] = self._numeric[column].to_series_values()
+        return pd.DataFrame(data, copy=False)
+
+
+def _append_to_array(owner: Any, attribute: str, value: Any) -> None:
+    """Diziye ekle; dizi bir DataFrame'e görünüm olarak verilmişse önce kopyala"""
+    values = getattr(owner, attribute)
+    try:
+        values.append(value)
+    except BufferError:
+        # to_dataframe() ile dışa verilmiş tampon yeniden boyutlandırılamaz
+        values = array(values.typecode, values)
+        values.append(value)
+        setattr(owner, attribute, values)
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from .telemetry import telemetry
+
+
+class RunJournal:
+    """Bir çalıştırmanın tamamlanan birimlerini tutan, yalnızca eklemeli ilerleme günlüğü.
+
+    Her birim (task, strategy, item_id) anahtarıyla ve sonuç satırıyla birlikte
+    JSONL olarak yazılır, her batch sonunda fsync edilir. Aynı run_id ile
+    yeniden açılan günlük, tamamlanmış birimlerin atlanmasını sağlar.
+    """
+
+    def __init__(self, journal_dir: str, run_id: Optional[str] = None):
+        os.makedirs(journal_dir, exist_ok=True)
+        self.run_id = run_id or self.new_run_id()
+        self.path = os.path.join(journal_dir, f"{self.run_id}.jsonl")
+        self._completed: Set[Tuple[str, str, str]] = set()
+
+        is_new = not os.path.exists(self.path)
+        if not is_new:
+            for entry in self._iter_entries():
+                self._completed.add((entry["task"], entry["strategy"], entry["item_id"]))
+
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if not is_new and not self._ends_with_newline():
+            self._file.write("\n")
+        if is_new:
+            self._append([{"type": "run", "run_id": self.run_id,
+                           "started_at": datetime.now().isoformat()}])
+
+    @staticmethod
+    def new_run_id() -> str:
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+    @staticmethod
+    def exists(journal_dir: str, run_id: str) -> bool:
+        return os.path.exists(os.path.join(journal_dir, f"{run_id}.jsonl"))
+
+    @staticmethod
+    def item_id(data_item: Dict[str, Any]) -> str:
+        """Veri satırının kimliği: 'id' alanı ya da içeriğin özeti"""
+        if "id" in data_item:
+            return str(data_item["id"])
+        content = json.dumps(data_item, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+    def is_completed(self, task: str, strategy: str, item_id: str) -> bool:
+        return (task, strategy, item_id) in self._completed
+
+    @property
+    def completed_count(self) -> int:
+        return len(self._completed)
+
+    def record_many(self, task: str, entries: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """(strategy, item_id, sonuç satırı) üçlülerini kalıcı olarak işaretle"""
+        lines = []
+        for strategy, item_id, record in entries:
+            self._completed.add((task, strategy, item_id))
+            lines.append({"type": "unit", "task": task, "strategy": strategy,
+                          "item_id": item_id, "result": record})
+        if lines:
+            self._append(lines)
+
+    def completed_records(self, task: str) -> Iterator[Dict[str, Any]]:
+        """Görev için daha önce tamamlanan sonuç satırlarını diskten akıt"""
+        self._file.flush()
+        for entry in self._iter_entries():
+            if entry["task"] == task:
+                yield entry["result"]
+
+    def _iter_entries(self) -> Iterator[Dict[str, Any]]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Çökme sırasında yarım kalmış son satır
+                    continue
+                if entry.get("type") == "unit":
+                    yield entry
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _append(self, entries: Iterable[Dict[str, Any]]) -> None:
+        with telemetry.span("io.journal_append"):
+            self._file.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
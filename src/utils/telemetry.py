@@ -0,0 +1,294 @@
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+EXPORT_FORMATS = ("prometheus", "otel", "chrome")
+
+# Span süreleri için histogram sınırları (saniye)
+DURATION_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """Süresi ölçülen tek bir işlem; with bloğu olarak kullanılır"""
+
+    __slots__ = ("telemetry", "name", "span_id", "parent_id", "thread_id",
+                 "start_unix_ns", "duration_ns", "attributes", "_start_perf_ns", "_token")
+
+    def __init__(self, telemetry: "Telemetry", name: str, attributes: Dict[str, Any]):
+        self.telemetry = telemetry
+        self.name = name
+        self.attributes = attributes
+        self.span_id = ""
+        self.parent_id: Optional[str] = None
+        self.thread_id = 0
+        self.start_unix_ns = 0
+        self.duration_ns = 0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.span_id = self.telemetry._next_span_id()
+        self.thread_id = threading.get_ident()
+        self._token = _current_span.set(self)
+        self.start_unix_ns = time.time_ns()
+        self._start_perf_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.duration_ns = time.perf_counter_ns() - self._start_perf_ns
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.telemetry._finish(self)
+
+
+class _NoopSpan:
+    """Telemetri kapalıyken kullanılan, hiçbir şey kaydetmeyen span"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Telemetry:
+    """Span, sayaç ve süre histogramlarını toplayan süreç içi telemetri kaydı.
+
+    Kapalıyken span() paylaşılan no-op nesnesini döndürür, sayaçlar
+    güncellenmez; sıcak yoldaki maliyet tek bir bayrak kontrolüdür.
+    Bellekte en fazla max_spans span tutulur, fazlası sayılıp atılır
+    (histogram ve sayaçlar yine güncellenir).
+    """
+
+    def __init__(self, enabled: bool = False, max_spans: int = 100000, service_name: str = "prompt_engineering"):
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self._span_ids = itertools.count(1)
+        self.reset()
+
+    def configure(self, enabled: bool = True, max_spans: Optional[int] = None) -> None:
+        self.enabled = enabled
+        if max_spans is not None:
+            self.max_spans = max_spans
+
+    def reset(self) -> None:
+        """Toplanan tüm verileri temizle"""
+        with self._lock:
+            self.trace_id = os.urandom(16).hex()
+            self.spans: List[Span] = []
+            self.dropped_spans = 0
+            self._counters: Dict[Tuple[str, Tuple], float] = {}
+            self._histograms: Dict[str, List[float]] = {}
+
+    def span(self, name: str, **attributes: Any):
+        """İşlem süresini ölç: with telemetry.span("model.generate", task=...)"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, attributes)
+
+    def count(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Sayaç artır (Prometheus'ta <name>_total olarak yazılır)"""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def _next_span_id(self) -> str:
+        return f"{next(self._span_ids):016x}"
+
+    def _finish(self, span: Span) -> None:
+        seconds = span.duration_ns / 1e9
+        with self._lock:
+            if len(self.spans) < self.max_spans:
+                self.spans.append(span)
+            else:
+                self.dropped_spans += 1
+            # [bucket sayaçları..., toplam süre, adet]
+            histogram = self._histograms.get(span.name)
+            if histogram is None:
+                histogram = self._histograms[span.name] = [0] * len(DURATION_BUCKETS) + [0.0, 0]
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    histogram[index] += 1
+            histogram[-2] += seconds
+            histogram[-1] += 1
+
+    def counters(self) -> Dict[str, float]:
+        """Sayaçları 'ad{etiket="değer"}' anahtarlarıyla döndür"""
+        with self._lock:
+            return {_series_name(name, labels): value for (name, labels), value in self._counters.items()}
+
+    def span_summary(self) -> Dict[str, Dict[str, float]]:
+        """Span adı başına adet ve toplam süre (saniye)"""
+        with self._lock:
+            return {name: {"count": histogram[-1], "total_seconds": histogram[-2]}
+                    for name, histogram in self._histograms.items()}
+
+    # Dışa aktarım
+
+    def to_prometheus(self) -> str:
+        """Prometheus metin biçimi (textfile collector ile okunabilir)"""
+        prefix = self.service_name
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+
+        seen = set()
+        for (name, labels), value in counters:
+            metric = f"{prefix}_{_metric_name(name)}_total"
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{_series_name(metric, labels)} {_format_number(value)}")
+
+        if histograms:
+            metric = f"{prefix}_span_duration_seconds"
+            lines.append(f"# HELP {metric} Duration of instrumented operations")
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in histograms:
+                for bound, bucket_count in zip(DURATION_BUCKETS, histogram):
+                    labels = (("le", _format_number(bound)), ("span", name))
+                    lines.append(f"{_series_name(metric + '_bucket', labels)} {bucket_count}")
+                labels = (("le", "+Inf"), ("span", name))
+                lines.append(f"{_series_name(metric + '_bucket', labels)} {histogram[-1]}")
+                lines.append(f"{_series_name(metric + '_sum', (('span', name),))} {_format_number(histogram[-2])}")
+                lines.append(f"{_series_name(metric + '_count', (('span', name),))} {histogram[-1]}")
+
+        lines.append(f"# TYPE {prefix}_dropped_spans_total counter")
+        lines.append(f"{prefix}_dropped_spans_total {self.dropped_spans}")
+        return "\n".join(lines) + "\n"
+
+    def to_otel_json(self) -> Dict[str, Any]:
+        """OTLP/JSON (ExportTraceServiceRequest) biçiminde span'ler"""
+        with self._lock:
+            spans = list(self.spans)
+        return {"resourceSpans": [{
+            "resource": {"attributes": [_otel_attribute("service.name", self.service_name)]},
+            "scopeSpans": [{
+                "scope": {"name": "prompt_engineering.telemetry"},
+                "spans": [{
+                    "traceId": self.trace_id,
+                    "spanId": span.span_id,
+                    "parentSpanId": span.parent_id or "",
+                    "name": span.name,
+                    "kind": 1,  # SPAN_KIND_INTERNAL
+                    "startTimeUnixNano": str(span.start_unix_ns),
+                    "endTimeUnixNano": str(span.start_unix_ns + span.duration_ns),
+                    "attributes": [_otel_attribute(key, value) for key, value in span.attributes.items()],
+                    "status": {"code": 2 if "error" in span.attributes else 0}
+                } for span in spans]
+            }]
+        }]}
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """chrome://tracing ve Perfetto ile açılabilen Trace Event biçimi"""
+        with self._lock:
+            spans = list(self.spans)
+        pid = os.getpid()
+        return {
+            "traceEvents": [{
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": span.start_unix_ns / 1000.0,
+                "dur": span.duration_ns / 1000.0,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {key: _json_value(value) for key, value in span.attributes.items()}
+            } for span in spans],
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_spans": self.dropped_spans}
+        }
+
+    def export(self, path: str, format: Optional[str] = None) -> str:
+        """Telemetriyi dosyaya yaz; format verilmezse uzantıdan çıkarılır"""
+        if format is None:
+            format = _format_from_path(path)
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown telemetry format: {format}. Available: {list(EXPORT_FORMATS)}")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            if format == "prometheus":
+                f.write(self.to_prometheus())
+            elif format == "otel":
+                json.dump(self.to_otel_json(), f, ensure_ascii=False)
+            else:
+                json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        return path
+
+
+def _format_from_path(path: str) -> str:
+    if path.endswith((".prom", ".txt")):
+        return "prometheus"
+    if path.endswith(".otel.json"):
+        return "otel"
+    return "chrome"
+
+
+def _metric_name(name: str) -> str:
+    return "".join(char if char.isalnum() else "_" for char in name)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _series_name(metric: str, labels: Tuple) -> str:
+    if not labels:
+        return metric
+    rendered = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels)
+    return f"{metric}{{{rendered}}}"
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _json_value(value: Any) -> Any:
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+
+
+def _otel_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+# Tüm modüllerin paylaştığı süreç geneli telemetri kaydı (varsayılan: kapalı)
+telemetry = Telemetry()
+
+
+def configure_from_config(config) -> Telemetry:
+    """telemetry.* ayarlarını paylaşılan kayda uygula"""
+    telemetry.configure(
+        enabled=config.get('telemetry.enabled', False),
+        max_spans=config.get('telemetry.max_spans', 100000)
+    )
+    return telemetry
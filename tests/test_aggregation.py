@@ -0,0 +1,120 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.analytics.aggregation import ResultAggregator, RunningStats
+from src.utils.data_handler import DataHandler
+from src.utils.result_sink import JsonlResultSink
+from tests.test_base_task import DictConfig, EchoTask, SlowModelManager
+
+def make_results(rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    accuracy = rng.random(rows)
+    accuracy[rng.random(rows) < 0.1] = np.nan
+    return pd.DataFrame({
+        "Task": "Echo",
+        "Prompt Type": rng.choice(["zero_shot", "one_shot", "few_shot"], rows),
+        "Prompt Format": rng.choice(["Zero-shot", "Few-shot"], rows),
+        "Accuracy": accuracy,
+        "Input Tokens": rng.integers(10, 500, rows),
+        "Output Tokens": rng.integers(1, 50, rows),
+        "Latency (s)": rng.random(rows)
+    })
+
+class TestRunningStats(unittest.TestCase):
+    def test_merge_matches_numpy(self):
+        values = np.random.default_rng(1).normal(5, 2, 1000)
+        left, right = RunningStats(), RunningStats()
+        for value in values[:300]:
+            left.add(value)
+        for value in values[300:]:
+            right.add(value)
+        left.add(None)
+        left.add(float("nan"))
+
+        merged = left.merge(right)
+        self.assertEqual(merged.count, 1000)
+        self.assertAlmostEqual(merged.mean, values.mean(), places=10)
+        self.assertAlmostEqual(merged.std, values.std(ddof=1), places=10)
+
+    def test_empty(self):
+        self.assertTrue(np.isnan(RunningStats().value))
+        self.assertTrue(np.isnan(RunningStats(1, 2.0, 0.0).std))
+
+class TestResultAggregator(unittest.TestCase):
+    def setUp(self):
+        self.results_df = make_results()
+
+    def test_strategy_table_matches_groupby(self):
+        table = ResultAggregator.from_dataframe(self.results_df).strategy_table()
+        expected = self.results_df.groupby(['Prompt Type', 'Prompt Format'])['Accuracy'].agg(['mean', 'std', 'count'])
+
+        table = table.set_index(['Prompt Type', 'Prompt Format']).sort_index()
+        pd.testing.assert_frame_equal(table[['mean', 'std', 'count']], expected.round(3), check_dtype=False)
+        self.assertIn('accuracy_per_1k_tokens', table.columns)
+
+    def test_records_and_dataframe_agree(self):
+        from_frame = ResultAggregator.from_dataframe(self.results_df.iloc[:100])
+        from_frame.add_dataframe(self.results_df.iloc[100:])
+        from_records = ResultAggregator()
+        from_records.add_records(self.results_df.astype(object).where(self.results_df.notna(), None)
+                                 .to_dict("records"))
+
+        pd.testing.assert_frame_equal(from_frame.strategy_table(), from_records.strategy_table())
+        self.assertEqual(from_frame.best_strategy(), self.results_df.groupby('Prompt Type')['Accuracy'].mean().idxmax())
+        self.assertEqual(len(from_frame), len(self.results_df))
+
+    def test_summary_matches_previous_report(self):
+        other = make_results(50, seed=1)
+        summary = DataHandler(tempfile.mkdtemp()).create_summary_report({"a": self.results_df, "b": other})
+
+        self.assertEqual(summary["tasks"]["a"]["total_tests"], 300)
+        self.assertEqual(summary["tasks"]["a"]["successful_tests"], self.results_df['Accuracy'].notna().sum())
+        self.assertAlmostEqual(summary["tasks"]["b"]["average_accuracy"], other['Accuracy'].mean())
+        self.assertAlmostEqual(summary["overall_stats"]["overall_accuracy"],
+                               pd.concat([self.results_df, other])['Accuracy'].mean())
+        self.assertEqual(summary["overall_stats"]["total_tests"], 350)
+
+    def test_missing_group_columns(self):
+        aggregator = ResultAggregator.from_dataframe(self.results_df.drop(columns=["Prompt Format"]), task="t")
+        table = aggregator.strategy_table("t", by=("Prompt Type",))
+        self.assertEqual(table['count'].sum(), self.results_df['Accuracy'].notna().sum())
+
+    def test_merge_relabels_task(self):
+        aggregator = ResultAggregator().merge(ResultAggregator.from_dataframe(self.results_df), task="echo")
+        self.assertEqual(aggregator.tasks(), ["echo"])
+        self.assertEqual(aggregator.rows("echo"), 300)
+
+    def test_confusion_counters(self):
+        records = [{"Prompt Type": "few_shot", "Expected": "Olumlu"},
+                   {"Prompt Type": "few_shot", "Expected": "Olumlu"},
+                   {"Prompt Type": "zero_shot", "Expected": "Olumsuz"}]
+        aggregator = ResultAggregator()
+        aggregator.add_records(records, task="tc", predicted=["Olumlu", None, "Olumsuz"])
+
+        self.assertEqual(aggregator.confusion("tc", "few_shot"), {"Olumlu": {"Olumlu": 1, "Unknown": 1}})
+        merged = ResultAggregator().merge(aggregator, task="renamed")
+        self.assertEqual(merged.confusion("renamed"), {"Olumlu": {"Olumlu": 1, "Unknown": 1},
+                                                       "Olumsuz": {"Olumsuz": 1}})
+
+    def test_task_updates_aggregator_while_streaming(self):
+        """Sink kullanılsa da (self.results boşken) özetler güncellenmeli"""
+        task = EchoTask(SlowModelManager(delay=0), None, DictConfig({'advanced_features.batch_size': 2}))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with JsonlResultSink(os.path.join(tmp_dir, "results.jsonl")) as sink:
+                results_df = task.run_experiment(["a", "b"], sink=sink)
+
+        self.assertEqual(len(task.results), 0)
+        self.assertEqual(len(task.aggregator), len(results_df))
+        self.assertEqual(task.aggregator.strategy_means(),
+                         results_df.groupby('Prompt Type', observed=True)['Accuracy'].mean().to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
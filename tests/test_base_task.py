@@ -0,0 +1,191 @@
+import unittest
+import sys
+import os
+import gc
+import time
+import threading
+import tracemalloc
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.tasks import BaseTask
+from src.core.batching import chunked, run_batch
+
+class DictConfig:
+    """Config.get ile aynı noktalı erişimi sunan sözlük tabanlı test konfigürasyonu"""
+    def __init__(self, values=None):
+        self.values = values or {}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+class SlowModelManager:
+    """Her çağrıda gecikme ekleyen ve eşzamanlı çağrı sayısını ölçen sahte model"""
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return prompt.upper()
+
+    def is_ready(self):
+        return True
+
+class EchoTask(BaseTask):
+    def get_task_name(self):
+        return "Echo"
+
+    def get_test_data(self):
+        return [{"input_text": f"item {i}", "expected_output": f"A:ITEM {i}"} for i in range(5)]
+
+    def evaluate_response(self, expected, actual):
+        return 1.0 if expected.upper() == actual else 0.0
+
+    def _generate_prompt(self, strategy, data_item):
+        if strategy == "broken":
+            raise ValueError(f"Unknown strategy: {strategy}")
+        return f"{strategy}:{data_item['input_text']}"
+
+class TestBaseTask(unittest.TestCase):
+    def _make_task(self, model_manager, **config_values):
+        return EchoTask(model_manager, None, DictConfig(config_values))
+
+    def test_serial_run(self):
+        """Seri çalıştırmada sonuçlar strateji x veri sırasında olmalı"""
+        task = self._make_task(SlowModelManager(delay=0))
+        results_df = task.run_experiment(["a", "b"])
+
+        self.assertEqual(len(results_df), 10)
+        self.assertEqual(list(results_df["Prompt Type"]), ["a"] * 5 + ["b"] * 5)
+        self.assertEqual(results_df["Accuracy"].tolist()[:5], [1.0] * 5)
+
+    def test_parallel_run_is_deterministic_and_bounded(self):
+        """Paralel çalıştırma aynı sırayı korumalı ve eşzamanlılık sınırına uymalı"""
+        model_manager = SlowModelManager(delay=0.05)
+        task = self._make_task(model_manager, **{
+            'advanced_features.parallel_processing': True,
+            'advanced_features.max_workers': 4
+        })
+
+        start = time.perf_counter()
+        results_df = task.run_experiment(["a", "b", "c"])
+        elapsed = time.perf_counter() - start
+
+        serial_df = self._make_task(SlowModelManager(delay=0)).run_experiment(["a", "b", "c"])
+        self.assertEqual(results_df["Response"].tolist(), serial_df["Response"].tolist())
+        self.assertLessEqual(model_manager.max_in_flight, 4)
+        self.assertGreater(model_manager.max_in_flight, 1)
+        self.assertLess(elapsed, 15 * 0.05)
+
+    def test_failed_units_are_skipped(self):
+        """Prompt üretimi başarısız olan birimler sonuçlara eklenmemeli"""
+        task = self._make_task(SlowModelManager(delay=0), **{
+            'advanced_features.parallel_processing': True
+        })
+        results_df = task.run_experiment(["a", "broken"])
+
+        self.assertEqual(len(results_df), 5)
+        self.assertEqual(set(results_df["Prompt Type"]), {"a"})
+
+    def test_duplicate_prompts_are_generated_once(self):
+        """Aynı prompt'a sahip birimler tek model çağrısıyla yanıtlanmalı"""
+        model_manager = SlowModelManager(delay=0)
+        calls = []
+        model_manager.generate_batch = lambda prompts, return_exceptions: (
+            calls.append(list(prompts)) or run_batch(model_manager.generate, prompts,
+                                                     return_exceptions=return_exceptions)
+        )
+        task = self._make_task(model_manager)
+        task.get_test_data = lambda: [{"input_text": "same", "expected_output": "A:SAME"}] * 3
+
+        results_df = task.run_experiment(["a"])
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results_df), 3)
+        self.assertEqual(results_df["Accuracy"].tolist(), [1.0] * 3)
+
+class TestResultLifetime(unittest.TestCase):
+    """Tekrarlı çalıştırmalarda sonuçların birikmediğini doğrulayan regresyon benchmark'ı"""
+
+    ITERATIONS = 6
+    ITEMS = 300
+
+    def _make_task(self):
+        task = EchoTask(SlowModelManager(delay=0), None, DictConfig())
+        items = [{"input_text": f"item {i}", "expected_output": f"A:ITEM {i}"} for i in range(self.ITEMS)]
+        task.get_test_data = lambda: items
+        return task
+
+    def test_repeated_runs_stay_flat(self):
+        """Her iterasyon aynı sayıda satır döndürmeli; bellek ve süre artmamalı"""
+        task = self._make_task()
+        row_counts, retained, durations = [], [], []
+
+        tracemalloc.start()
+        try:
+            for _ in range(self.ITERATIONS):
+                start = time.perf_counter()
+                results_df = task.run_experiment(["a"])
+                durations.append(time.perf_counter() - start)
+                row_counts.append(len(results_df))
+
+                del results_df
+                gc.collect()
+                retained.append(tracemalloc.get_traced_memory()[0])
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(row_counts, [self.ITEMS] * self.ITERATIONS)
+        self.assertEqual(len(task.results), self.ITEMS)
+        # İlk iterasyon ısınma; sonrakilerde tutulan bellek sabit kalmalı
+        self.assertLess(retained[-1] - retained[1], 64 * 1024)
+        self.assertLess(min(durations[-2:]), 3 * max(durations[:2]) + 0.05)
+
+    def test_reset_results(self):
+        task = self._make_task()
+        task.run_experiment(["a"])
+        task.reset_results()
+        self.assertEqual(len(task.results), 0)
+
+class TestRunBatch(unittest.TestCase):
+    def test_chunked(self):
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_deduplicates_and_maps_back(self):
+        """Tekrarlı prompt'lar bir kez üretilmeli, sonuçlar girdi sırasına eşlenmeli"""
+        calls = []
+
+        def generate(prompt):
+            calls.append(prompt)
+            return prompt.upper()
+
+        results = run_batch(generate, ["a", "b", "a", "c", "b"], chunk_size=2, max_workers=2)
+
+        self.assertEqual(results, ["A", "B", "A", "C", "B"])
+        self.assertEqual(sorted(calls), ["a", "b", "c"])
+
+    def test_return_exceptions(self):
+        """return_exceptions=True ise hatalar yerinde döner, aksi halde yükselir"""
+        def generate(prompt):
+            if prompt == "bad":
+                raise RuntimeError("Model generation failed")
+            return prompt
+
+        results = run_batch(generate, ["ok", "bad"], return_exceptions=True)
+        self.assertEqual(results[0], "ok")
+        self.assertIsInstance(results[1], RuntimeError)
+
+        with self.assertRaises(RuntimeError):
+            run_batch(generate, ["ok", "bad"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+import sys
+import os
+import random
+import subprocess
+import tempfile
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.benchmarking.history import BenchmarkHistory, bootstrap_diff_ci
+
+def make_report(latency_scale=1.0, memory_mb=10.0, seed=0, iterations=5):
+    """BenchmarkRunner.to_dict() biçiminde sentetik benchmark çıktısı (~20 ms gecikmeler)"""
+    rng = random.Random(seed)
+    samples = sorted(rng.lognormvariate(0, 0.3) * 20 * latency_scale for _ in range(500))
+    runs = [{"mode": "cold", "wall_seconds": sum(samples) / 1000 + rng.uniform(0, 0.01),
+             "peak_memory_mb": memory_mb + rng.uniform(0, 0.1)} for _ in range(iterations)]
+    return {"tasks": [{
+        "task_name": "text_classification",
+        "runs": runs,
+        "summary": {"cold": {"latency_samples_ms": samples}, "warm_speedup": 2.0}
+    }]}
+
+class TestBootstrap(unittest.TestCase):
+    def test_ci_covers_true_difference(self):
+        rng = random.Random(1)
+        baseline = [rng.gauss(10, 1) for _ in range(400)]
+        current = [rng.gauss(12, 1) for _ in range(400)]
+
+        low, high = bootstrap_diff_ci(baseline, current, "mean", n_resamples=600)
+        self.assertLess(low, 2.0)
+        self.assertGreater(high, 2.0)
+        self.assertGreater(low, 0)
+
+    def test_percentile_statistic_is_deterministic(self):
+        values = [float(i) for i in range(100)]
+        self.assertEqual(bootstrap_diff_ci(values, values, "p95", seed=3),
+                         bootstrap_diff_ci(values, values, "p95", seed=3))
+
+class TestBenchmarkHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history = BenchmarkHistory(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_record_and_baseline(self):
+        first = self.history.record(make_report(), label="v1")
+        second = self.history.record(make_report(seed=1))
+
+        self.assertEqual([entry["id"] for entry in self.history.entries()], [first, second])
+        self.history.set_baseline("release-1.0", first)
+        self.assertEqual(self.history.list_baselines(), ["release-1.0"])
+        self.assertEqual(self.history.baseline("release-1.0")["label"], "v1")
+
+        with self.assertRaises(ValueError):
+            self.history.baseline("missing")
+        with self.assertRaises(ValueError):
+            self.history.set_baseline("../escape")
+
+    def test_same_distribution_is_not_a_regression(self):
+        self.history.record(make_report(seed=0))
+        self.history.set_baseline("main")
+
+        comparison = self.history.compare(make_report(seed=1), "main", n_resamples=300)
+        self.assertEqual({row.metric for row in comparison.rows},
+                         {"latency_p50_ms", "latency_p95_ms", "wall_seconds", "peak_memory_mb"})
+        self.assertFalse(comparison.has_regressions)
+
+    def test_slower_latency_and_memory_are_regressions(self):
+        self.history.record(make_report(seed=0))
+        self.history.set_baseline("main")
+
+        comparison = self.history.compare(make_report(latency_scale=1.5, memory_mb=13.0, seed=1),
+                                          "main", n_resamples=300)
+        regressed = {row.metric for row in comparison.regressions}
+        self.assertEqual(regressed, {"latency_p50_ms", "latency_p95_ms", "wall_seconds", "peak_memory_mb"})
+        self.assertTrue(comparison.to_dict()["has_regressions"])
+        self.assertEqual(len(comparison.to_dataframe()), 4)
+
+    def test_faster_run_is_not_a_regression(self):
+        self.history.record(make_report(seed=0))
+        self.history.set_baseline("main")
+
+        comparison = self.history.compare(make_report(latency_scale=0.5, seed=1), "main", n_resamples=300)
+        self.assertFalse(comparison.has_regressions)
+        self.assertTrue(all(row.change_pct <= 0 for row in comparison.rows if row.metric.startswith("latency")))
+
+    def test_single_run_reports_are_inconclusive(self):
+        """Tek iterasyonda süre/bellek tek örnektir; fark ne olursa olsun regresyon sayılmamalı"""
+        self.history.record(make_report(seed=0, iterations=1))
+        self.history.set_baseline("main")
+
+        comparison = self.history.compare(make_report(memory_mb=13.0, seed=1, iterations=1), "main",
+                                          n_resamples=300)
+        inconclusive = {row.metric for row in comparison.rows if row.inconclusive}
+        self.assertEqual(inconclusive, {"wall_seconds", "peak_memory_mb"})
+        self.assertFalse(any(row.significant for row in comparison.rows if row.inconclusive))
+        self.assertFalse(comparison.has_regressions)
+        self.assertIn("inconclusive", set(comparison.to_dataframe()["Status"]))
+
+    def test_changes_below_absolute_floor_are_not_regressions(self):
+        """Küçük çalıştırmalardaki MB altı bellek ve birkaç ms'lik süre oynamaları CI'ı düşürmemeli"""
+        self.history.record(make_report(latency_scale=0.002, memory_mb=0.067, seed=0))
+        self.history.set_baseline("main")
+
+        comparison = self.history.compare(make_report(latency_scale=0.0023, memory_mb=0.3, seed=1), "main",
+                                          n_resamples=300)
+        self.assertTrue(any(row.significant for row in comparison.rows))
+        self.assertFalse(comparison.has_regressions)
+
+class TestBaselineGate(unittest.TestCase):
+    def run_benchmark(self, *options):
+        main_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'main.py'))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = os.path.join(tmp_dir, "settings.yaml")
+            with open(config_path, 'w', encoding='utf-8') as f:
+                f.write("model:\n  mock_mode: true\nevaluation:\n  checkpointing: false\n")
+            return subprocess.run(
+                [sys.executable, main_path, "--benchmark", *options, "--config", config_path],
+                capture_output=True, text=True, cwd=tmp_dir,
+                env={**os.environ, "GEMINI_API_KEY": "test_key"}
+            )
+
+    def test_unknown_baseline_fails_before_running(self):
+        """Olmayan baseline ile --benchmark sıfırdan farklı kodla ve benchmark çalışmadan çıkmalı"""
+        completed = self.run_benchmark("--baseline", "nosuch")
+
+        self.assertEqual(completed.returncode, 2)
+        self.assertIn("Baseline 'nosuch' not found", completed.stdout)
+        self.assertNotIn("Running performance benchmarks", completed.stdout)
+
+    def test_invalid_save_baseline_fails_before_running(self):
+        completed = self.run_benchmark("--save-baseline", "../x")
+
+        self.assertEqual(completed.returncode, 2)
+        self.assertIn("Invalid baseline name", completed.stdout)
+        self.assertNotIn("Running performance benchmarks", completed.stdout)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.benchmarking.benchmark_runner import BenchmarkRunner, percentile, latency_summary
+from src.core.response_cache import ResponseCache
+from src.experiment_runner import ExperimentRunner
+
+class TestPercentiles(unittest.TestCase):
+    def test_percentile_matches_linear_interpolation(self):
+        values = [5.0, 1.0, 3.0, 2.0, 4.0]
+        self.assertEqual(percentile(values, 50), 3.0)
+        self.assertAlmostEqual(percentile(values, 95), 4.8)
+        self.assertEqual(percentile(values, 100), 5.0)
+        self.assertEqual(percentile([], 99), 0.0)
+
+    def test_latency_summary_in_millis(self):
+        summary = latency_summary([0.001, 0.002, 0.003])
+        self.assertEqual(summary["count"], 3)
+        self.assertAlmostEqual(summary["p50"], 2.0)
+        self.assertAlmostEqual(summary["max"], 3.0)
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def setUp(self):
+        os.environ['GEMINI_API_KEY'] = 'test_key'
+        self.runner = ExperimentRunner('config/settings.yaml')
+        self.benchmark = BenchmarkRunner(self.runner)
+
+    def test_cold_and_warm_runs(self):
+        result = self.benchmark.run_performance_benchmark(
+            "text_classification", iterations=2, strategies=["zero_shot"]
+        )
+
+        self.assertEqual([run["mode"] for run in result["runs"]], ["cold", "warm", "cold", "warm"])
+        test_count = len(self.runner.get_task("text_classification").get_test_data())
+        for run in result["runs"]:
+            self.assertEqual(run["requests"], test_count)
+            self.assertEqual(set(run["phases_seconds"]), {"prompt", "model", "scoring", "io", "other"})
+            self.assertLessEqual(run["latency_ms"]["p50"], run["latency_ms"]["p99"])
+
+        self.assertEqual(result["summary"]["cold"]["cache_hit_rate"], 0.0)
+        self.assertEqual(result["summary"]["warm"]["cache_hit_rate"], 1.0)
+        self.assertEqual(result["summary"]["warm"]["latency_ms"]["count"], 2 * test_count)
+
+    def test_runner_state_is_restored(self):
+        """Geçici önbellek ve zamanlama sarmalayıcıları benchmark sonrası kaldırılmalı"""
+        task = self.runner.get_task("text_classification")
+        self.benchmark.run_performance_benchmark("text_classification", iterations=1)
+
+        self.assertIsNone(self.runner.model_manager.cache)
+        self.assertNotIn("generate", vars(self.runner.model_manager))
+        self.assertNotIn("_build_prompt", vars(task))
+
+    def test_configured_cache_is_never_cleared(self):
+        """Benchmark kullanıcının önbelleğini temizlememeli, yerine geri takmalı"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ResponseCache(tmp_dir)
+            cache.put("paid-response", "Olumlu")
+            self.runner.model_manager.cache = cache
+            try:
+                result = self.benchmark.run_performance_benchmark("text_classification", iterations=1)
+                self.assertIs(self.runner.model_manager.cache, cache)
+                self.assertEqual(cache.get("paid-response")["response"], "Olumlu")
+                self.assertEqual(result["summary"]["cold"]["cache_hit_rate"], 0.0)
+            finally:
+                cache.close()
+
+    def test_json_output(self):
+        self.benchmark.run_performance_benchmark("mathematical_reasoning", iterations=1)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self.benchmark.save_json(os.path.join(tmp_dir, "benchmark.json"))
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+
+        self.assertEqual(data["format_version"], 1)
+        self.assertEqual(data["tasks"][0]["task_name"], "mathematical_reasoning")
+        self.assertIn("p95", data["tasks"][0]["summary"]["warm"]["latency_ms"])
+        self.assertEqual(len(self.benchmark.generate_benchmark_report()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Kısa CLI komutlarında yüklenmemesi gereken ağır bağımlılıklar
+HEAVY_MODULES = ["google.generativeai", "pandas", "numpy", "sklearn", "matplotlib", "seaborn"]
+
+# Yalnızca import + komut süresi için üst sınır (saniye)
+IMPORT_TIME_BUDGET = 1.0
+
+PROBE = """
+import json, sys, time, io, contextlib
+start = time.perf_counter()
+sys.argv = ["main.py"] + sys.argv[1:]
+sys.path.insert(0, {root!r})
+import main
+with contextlib.redirect_stdout(io.StringIO()) as output:
+    main.main()
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "output": output.getvalue(),
+    "heavy": [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+class TestCliStartup(unittest.TestCase):
+    def setUp(self):
+        handle = tempfile.NamedTemporaryFile('w', suffix='.yaml', delete=False, encoding='utf-8')
+        with handle:
+            handle.write("model:\n  mock_mode: true\ntasks:\n  text_classification:\n    enabled: true\n")
+        self.config_path = handle.name
+
+    def tearDown(self):
+        os.unlink(self.config_path)
+
+    def _run(self, *cli_args):
+        code = PROBE.format(root=os.path.abspath(PROJECT_ROOT), heavy=HEAVY_MODULES)
+        completed = subprocess.run(
+            [sys.executable, "-c", code, *cli_args, "--config", self.config_path],
+            capture_output=True, text=True, check=True,
+            env={**os.environ, "GEMINI_API_KEY": "test_key"}
+        )
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    def test_list_tasks_is_lightweight(self):
+        """--list-tasks ağır bağımlılıkları yüklememeli ve bütçe içinde bitmeli"""
+        result = self._run("--list-tasks")
+
+        self.assertIn("text_classification", result["output"])
+        self.assertIn("mathematical_reasoning", result["output"])
+        self.assertEqual(result["heavy"], [])
+        self.assertLess(result["elapsed"], IMPORT_TIME_BUDGET)
+
+    def test_task_info_is_lightweight(self):
+        """--task-info ModelManager oluşturmadan görev bilgisini vermeli"""
+        result = self._run("--task-info", "mathematical_reasoning")
+
+        self.assertIn("test_data_count: 3", result["output"])
+        self.assertIn("few_shot_cot", result["output"])
+        self.assertEqual(result["heavy"], [])
+        self.assertLess(result["elapsed"], IMPORT_TIME_BUDGET)
+
+    def test_resume_with_benchmark_is_rejected(self):
+        """--resume --benchmark tüm görevleri sessizce devam ettirmek yerine hata vermeli"""
+        completed = subprocess.run(
+            [sys.executable, os.path.join(PROJECT_ROOT, "main.py"), "--resume", "run1", "--benchmark",
+             "--config", self.config_path],
+            capture_output=True, text=True, env={**os.environ, "GEMINI_API_KEY": "test_key"}
+        )
+
+        self.assertEqual(completed.returncode, 2)
+        self.assertIn("--resume cannot be combined with --benchmark", completed.stderr)
+        self.assertNotIn("Running all available tasks", completed.stdout)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.dataset_loader import (
+    CsvSource, InMemorySource, JsonlSource, dataset_from_config, open_dataset
+)
+
+ROWS = [{"input_text": f"metin {i}", "expected_output": "Olumlu"} for i in range(10)]
+
+class TestDatasetLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_jsonl_streaming(self):
+        """JSONL dosyası satır satır okunmalı ve yeniden iterate edilebilmeli"""
+        path = self._write("data.jsonl", "\n".join(json.dumps(row) for row in ROWS) + "\n\n")
+        source = JsonlSource(path)
+
+        self.assertEqual(list(source), ROWS)
+        self.assertEqual(list(source), ROWS)
+
+    def test_csv_with_json_columns(self):
+        """CSV hücreleri json_columns için JSON olarak çözülmeli"""
+        path = self._write(
+            "data.csv",
+            'input_text,expected_numbers\n"Bir, iki","[6, 4]"\n'
+        )
+        rows = list(CsvSource(path, json_columns=["expected_numbers"]))
+        self.assertEqual(rows, [{"input_text": "Bir, iki", "expected_numbers": [6, 4]}])
+
+    def test_offset_limit(self):
+        source = InMemorySource(ROWS, offset=2, limit=3)
+        self.assertEqual([row["input_text"] for row in source], ["metin 2", "metin 3", "metin 4"])
+
+    def test_sharding_partitions_rows(self):
+        """Shard'lar ayrık olmalı ve birlikte tüm satırları kapsamalı"""
+        shards = [list(InMemorySource(ROWS, shard_index=i, num_shards=3)) for i in range(3)]
+        combined = sorted(row["input_text"] for shard in shards for row in shard)
+
+        self.assertEqual(combined, sorted(row["input_text"] for row in ROWS))
+        self.assertEqual(len(shards[0]), 4)
+
+    def test_sampling_is_deterministic(self):
+        """Aynı seed ile örnekleme aynı satırları seçmeli"""
+        first = list(InMemorySource(ROWS * 10, sample_rate=0.3, seed=7))
+        second = list(InMemorySource(ROWS * 10, sample_rate=0.3, seed=7))
+
+        self.assertEqual(first, second)
+        self.assertLess(len(first), 100)
+        self.assertGreater(len(first), 0)
+
+    def test_rows_are_consumed_lazily(self):
+        """limit dolunca kaynak daha fazla satır okumamalı"""
+        consumed = []
+
+        def generate_rows():
+            for row in ROWS:
+                consumed.append(row)
+                yield row
+
+        list(InMemorySource(generate_rows(), limit=2))
+        self.assertEqual(len(consumed), 2)
+
+    def test_open_dataset_infers_format(self):
+        path = self._write("data.jsonl", json.dumps(ROWS[0]) + "\n")
+        self.assertIsInstance(open_dataset(path), JsonlSource)
+        self.assertIsInstance(dataset_from_config({"path": path, "limit": 1}), JsonlSource)
+
+        with self.assertRaises(ValueError):
+            open_dataset(os.path.join(self.tmp_dir.name, "data.txt"))
+
+if __name__ == '__main__':
+    unittest.main()
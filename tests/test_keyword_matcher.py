@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.keyword_matcher import KeywordMatcher, turkish_casefold
+from src.tasks.text_classification import TextClassificationTask
+from src.core.model_manager import ModelManager
+from tests.test_base_task import DictConfig
+from tests.test_model_manager import make_config
+
+class TestKeywordMatcher(unittest.TestCase):
+    def test_turkish_casefold(self):
+        self.assertEqual(turkish_casefold("İYİ IŞIK"), "iyi ışık")
+        self.assertEqual(len(turkish_casefold("İstanbul")), len("İstanbul"))
+
+    def test_overlapping_keywords_in_one_pass(self):
+        matcher = KeywordMatcher(["he", "she", "his", "hers"])
+        matches = list(matcher.iter_matches("ushers"))
+
+        self.assertEqual(matches, [(4, "she"), (4, "he"), (6, "hers")])
+        self.assertEqual(matcher.find_all("ushers"), {"she", "he", "hers"})
+
+    def test_matches_like_substring_search(self):
+        keywords = ["çay", "sinir", "hayal kırıklığı", "geç", "güzel"]
+        matcher = KeywordMatcher(keywords)
+        texts = ["Geçen gün çaydanlık", "sinirli ve hayal kırıklığına uğramış", "", "güzelgüzel"]
+        for text in texts:
+            expected = {keyword for keyword in keywords if keyword in text.lower()}
+            self.assertEqual(matcher.find_all(text), expected)
+
+    def test_first_of_uses_candidate_order(self):
+        matcher = KeywordMatcher(["Olumlu", "Olumsuz", "Nötr"])
+        self.assertEqual(matcher.first_of("Nötr ya da olumsuz", ["Olumlu", "Olumsuz", "Nötr"]), "Olumsuz")
+        self.assertIsNone(matcher.first_of("belirsiz", ["Olumlu"]))
+
+    def test_empty_keyword_rejected(self):
+        with self.assertRaises(ValueError):
+            KeywordMatcher([""])
+
+class TestKeywordRouting(unittest.TestCase):
+    def test_label_extraction(self):
+        task = TextClassificationTask(None, None, DictConfig())
+        self.assertEqual(task._extract_label("Sınıf: NÖTR"), "Nötr")
+        self.assertEqual(task._extract_label('{"label": "olumsuz"}'), "Olumsuz")
+        self.assertIsNone(task._extract_label("Bilinmiyor"))
+
+    def test_mock_routing_handles_turkish_uppercase(self):
+        model_manager = ModelManager(make_config())
+        response = model_manager.generate("BU METNİ SINIFLANDIR: HAYAL KIRIKLIĞI")
+        self.assertEqual(response, model_manager.mock_responses["negative"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.tasks.mathematical_reasoning import MathematicalReasoningTask
+from tests.test_base_task import DictConfig, SlowModelManager
+
+RESPONSES = [
+    "",
+    "Elma 6 TL, portakal 4 TL.",
+    "1. adım: x + y = 10\n2. önce denklemi kur\n3. sonra çöz\n4. toplam\n5. x = 6, y = 4",
+    "CEVAP: ELMA 6 TL, PORTAKAL 4 TL. İKİ BİLİNMEYEN İÇİN DENKLEM ÇÖZÜLDÜ.",
+    "Kahve 5 lira, çay 2 lira",
+    "Sonuç 12tl ve 6 tl\n\n\n\n",
+    "Bilinmeyen yok, sadece 7 ve 8",
+    "Çocuk bileti 6, yetişkin bileti 12 TL; hesap tamam",
+]
+
+class TestBatchScoring(unittest.TestCase):
+    def setUp(self):
+        self.task = MathematicalReasoningTask(None, None, DictConfig())
+        data = self.task.get_test_data()
+        self.expected = [data[i % len(data)]["expected_output"] for i in range(len(RESPONSES))]
+
+    def test_batch_scores_match_scalar(self):
+        """Toplu puanlama evaluate_response ile bit düzeyinde aynı olmalı"""
+        scalar = [self.task.evaluate_response(e, a) for e, a in zip(self.expected, RESPONSES)]
+        batch = self.task.evaluate_batch(self.expected, RESPONSES)
+
+        self.assertEqual(batch, scalar)
+        self.assertTrue(all(type(score) is float for score in batch))
+
+    def test_empty_batch(self):
+        self.assertEqual(self.task.evaluate_batch([], []), [])
+
+    def test_scoring_is_silent_unless_debug(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.task.evaluate_response(self.expected[0], RESPONSES[1])
+            self.task.evaluate_batch(self.expected, RESPONSES)
+        self.assertEqual(output.getvalue(), "")
+
+        debug_task = MathematicalReasoningTask(None, None, DictConfig({'evaluation.debug_scoring': True}))
+        with redirect_stdout(output):
+            debug_task.evaluate_batch(self.expected[:1], RESPONSES[1:2])
+        self.assertIn("Final score", output.getvalue())
+
+    def test_run_experiment_uses_batch_scores(self):
+        task = MathematicalReasoningTask(SlowModelManager(delay=0), None, DictConfig())
+        results_df = task.run_experiment(["vanilla", "zero_shot_cot"])
+
+        expected = [task.evaluate_response(e, r)
+                    for e, r in zip(results_df["Expected"], results_df["Response"])]
+        self.assertEqual(results_df["Accuracy"].tolist(), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+import sys
+import os
+import asyncio
+import tempfile
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.config import Config
+from src.core.gemini_rest import GeminiRestClient
+from src.core.mock_backend import InjectedError, MockBackend
+from src.core.mock_server import MockGeminiServer
+from src.core.model_manager import ModelManager
+from src.core.rate_limiter import RateLimiter
+
+BACKEND_SETTINGS = """
+model:
+  name: "gemini-2.5-flash"
+  mock_mode: false
+  backend: "{backend}"
+  base_url: "{base_url}"
+  mock_backend:
+    seed: 7
+    rate_limit_rate: 0.3
+    retry_after_seconds: 0.01
+    rate_limited: {rate_limited}
+
+rate_limit:
+  max_retries: 20
+  base_backoff_seconds: 0.001
+  requests_per_minute: {requests_per_minute}
+"""
+
+def make_backend_config(backend: str, base_url: str = "", requests_per_minute: str = "null",
+                        rate_limited: bool = False) -> Config:
+    """Verilen backend için geçici Config oluştur"""
+    os.environ['GEMINI_API_KEY'] = 'test_key'
+    handle = tempfile.NamedTemporaryFile('w', suffix='.yaml', delete=False, encoding='utf-8')
+    with handle:
+        handle.write(BACKEND_SETTINGS.format(backend=backend, base_url=base_url,
+                                             requests_per_minute=requests_per_minute,
+                                             rate_limited=str(rate_limited).lower()))
+    try:
+        return Config(handle.name)
+    finally:
+        os.unlink(handle.name)
+
+class TestMockBackend(unittest.TestCase):
+    def test_output_is_deterministic_per_prompt(self):
+        backend = MockBackend(seed=1, min_output_tokens=5, max_output_tokens=50)
+        first = backend.generate_content("prompt a")
+
+        self.assertEqual(backend.generate_content("prompt a"), first)
+        self.assertEqual(MockBackend(seed=1, min_output_tokens=5, max_output_tokens=50)
+                         .generate_content("prompt a"), first)
+        self.assertNotEqual(MockBackend(seed=2).generate_content("prompt a").text, first.text)
+        self.assertTrue(5 <= first.usage_metadata.candidates_token_count <= 50)
+        self.assertEqual(len(first.text.split()), first.usage_metadata.candidates_token_count)
+
+    def test_error_injection_is_seeded(self):
+        def failures(seed):
+            backend = MockBackend(seed=seed, error_rate=0.1, rate_limit_rate=0.2)
+            outcome = []
+            for i in range(500):
+                try:
+                    backend.generate_content(str(i))
+                    outcome.append(200)
+                except InjectedError as e:
+                    outcome.append(e.status)
+            return outcome
+
+        outcome = failures(3)
+        self.assertEqual(outcome, failures(3))
+        self.assertAlmostEqual(outcome.count(429) / 500, 0.2, delta=0.06)
+        self.assertAlmostEqual(outcome.count(500) / 500, 0.1, delta=0.05)
+
+    def test_latency_distributions(self):
+        delays = []
+        backend = MockBackend(latency_ms=100, latency_distribution="lognormal",
+                              latency_jitter_ms=50, sleep=delays.append)
+        for i in range(2000):
+            backend.generate_content(str(i))
+
+        self.assertAlmostEqual(sum(delays) / len(delays), 0.1, delta=0.01)
+        with self.assertRaises(ValueError):
+            MockBackend(latency_distribution="pareto")
+
+    def test_async_generation(self):
+        backend = MockBackend(latency_ms=1)
+        response = asyncio.run(backend.generate_content_async("x"))
+        self.assertEqual(response, backend.render("x"))
+
+class TestMockServer(unittest.TestCase):
+    def test_rest_client_round_trip(self):
+        backend = MockBackend(seed=5)
+        with MockGeminiServer(backend) as server:
+            client = GeminiRestClient(server.url, "gemini-2.5-flash", api_key="k")
+            response = client.generate_content("merhaba")
+
+        self.assertEqual(response.text, backend.render("merhaba").text)
+        self.assertEqual(response.usage_metadata, backend.render("merhaba").usage_metadata)
+
+    def test_rate_limit_is_reported_as_429(self):
+        with MockGeminiServer(MockBackend(rate_limit_rate=1.0, retry_after_seconds=3)) as server:
+            client = GeminiRestClient(server.url, "gemini-2.5-flash")
+            with self.assertRaises(RuntimeError) as context:
+                client.generate_content("x")
+
+        self.assertTrue(str(context.exception).startswith("429"))
+        self.assertIn("retry after 3", str(context.exception))
+
+class TestModelManagerBackends(unittest.TestCase):
+    def setUp(self):
+        RateLimiter.reset_shared()
+
+    def test_mock_backend_retries_injected_rate_limits(self):
+        model_manager = ModelManager(make_backend_config("mock"))
+        responses = [model_manager.generate(f"prompt {i}") for i in range(30)]
+
+        self.assertEqual(responses, [model_manager._model.render(f"prompt {i}").text.strip()
+                                     for i in range(30)])
+        self.assertGreater(model_manager._model.stats()["rate_limited"], 0)
+
+    def test_mock_backend_bypasses_quota_unless_opted_in(self):
+        model_manager = ModelManager(make_backend_config("mock", requests_per_minute="10"))
+        self.assertIsNone(model_manager.rate_limiter._request_bucket)
+        self.assertEqual(model_manager.rate_limiter.base_backoff, 0.001)
+
+        opted_in = ModelManager(make_backend_config("mock", requests_per_minute="10", rate_limited=True))
+        self.assertIsNotNone(opted_in.rate_limiter._request_bucket)
+
+    def test_cache_key_includes_backend_and_endpoint(self):
+        keys = {
+            ModelManager(make_backend_config(backend, base_url))._cache_key("merhaba")
+            for backend, base_url in [("mock", ""), ("http", "http://127.0.0.1:1"), ("http", "http://127.0.0.1:2")]
+        }
+        self.assertEqual(len(keys), 3)
+
+    def test_http_backend(self):
+        with MockGeminiServer(MockBackend(seed=7)) as server:
+            model_manager = ModelManager(make_backend_config("http", server.url))
+            response = model_manager.generate("merhaba")
+            async_response = asyncio.run(model_manager.agenerate("merhaba"))
+
+        self.assertEqual(response, server.backend.render("merhaba").text)
+        self.assertEqual(async_response, response)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+import sys
+import os
+import asyncio
+import tempfile
+import time
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.config import Config
+from src.core.model_manager import ModelManager
+from src.core.rate_limiter import RateLimiter
+
+TEST_SETTINGS = """
+model:
+  name: "gemini-2.5-flash"
+  temperature: 0.1
+  max_tokens: 2048
+  mock_mode: true
+
+advanced_features:
+  response_caching: false
+  max_workers: 4
+"""
+
+def make_config(extra_yaml: str = "") -> Config:
+    """Geçici bir settings dosyasından Config oluştur"""
+    os.environ['GEMINI_API_KEY'] = 'test_key'
+    handle = tempfile.NamedTemporaryFile('w', suffix='.yaml', delete=False, encoding='utf-8')
+    with handle:
+        handle.write(TEST_SETTINGS + extra_yaml)
+    try:
+        return Config(handle.name)
+    finally:
+        os.unlink(handle.name)
+
+class FakeAsyncModel:
+    """generate_content_async'i gecikmeli taklit eden sahte Gemini modeli"""
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_content_async(self, prompt):
+        if prompt == "boom":
+            raise ValueError("500 internal error")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(float(prompt) if prompt.replace('.', '').isdigit() else self.delay)
+        finally:
+            self.in_flight -= 1
+        return type("Response", (), {"text": f" {prompt} "})()
+
+class FlakyModel:
+    """İlk çağrılarda 429 döndüren sahte Gemini modeli"""
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise Exception("429 Resource has been exhausted. retry_delay { seconds: 0 }")
+        return type("Response", (), {"text": "Olumlu"})()
+
+class TestModelManagerRetries(unittest.TestCase):
+    def setUp(self):
+        RateLimiter.reset_shared()
+        self.model_manager = ModelManager(make_config())
+        self.model_manager.mock_mode = False
+        self.model_manager.rate_limiter = RateLimiter(base_backoff=0.01, max_backoff=0.05)
+
+    def test_rate_limit_retry(self):
+        """429 sonrası kısa backoff ile yeniden denenmeli"""
+        self.model_manager._model = FlakyModel(failures=2)
+        self.assertEqual(self.model_manager.generate("prompt", max_retries=3), "Olumlu")
+        self.assertEqual(self.model_manager._model.calls, 3)
+
+    def test_rate_limit_exhausted(self):
+        """Deneme hakkı bitince RuntimeError yükselmeli"""
+        self.model_manager._model = FlakyModel(failures=5)
+        with self.assertRaises(RuntimeError):
+            self.model_manager.generate("prompt", max_retries=2)
+
+class TestModelManagerAsync(unittest.TestCase):
+    def setUp(self):
+        RateLimiter.reset_shared()
+        self.model_manager = ModelManager(make_config())
+
+    def _use_fake_model(self, delay=0.05):
+        self.model_manager.mock_mode = False
+        self.model_manager._model = FakeAsyncModel(delay)
+        return self.model_manager._model
+
+    def test_agenerate_mock_matches_generate(self):
+        """Mock modda asenkron yanıt senkron yanıtla aynı olmalı"""
+        prompt = "Bu metni sınıflandır: harika bir gün"
+        result = asyncio.run(self.model_manager.agenerate(prompt))
+        self.assertEqual(result, self.model_manager.generate(prompt))
+
+    def test_agenerate_many_preserves_order_and_bounds_concurrency(self):
+        """Sonuçlar prompt sırasıyla dönmeli ve eşzamanlılık sınırı aşılmamalı"""
+        fake_model = self._use_fake_model()
+        prompts = [f"prompt {i}" for i in range(20)]
+
+        results = asyncio.run(self.model_manager.agenerate_many(prompts, max_concurrency=5))
+
+        self.assertEqual(results, prompts)
+        self.assertEqual(fake_model.max_in_flight, 5)
+
+    def test_agenerate_timeout(self):
+        """Çağrı başına süre sınırı aşılınca TimeoutError yükselmeli"""
+        self._use_fake_model()
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(self.model_manager.agenerate("1.0", timeout=0.05))
+
+    def test_agenerate_many_return_exceptions(self):
+        """return_exceptions=True ise zaman aşımları sonuç listesinde yer almalı"""
+        self._use_fake_model()
+        results = asyncio.run(self.model_manager.agenerate_many(
+            ["fast", "1.0"], timeout=0.2, return_exceptions=True
+        ))
+        self.assertEqual(results[0], "fast")
+        self.assertIsInstance(results[1], asyncio.TimeoutError)
+
+    def test_agenerate_many_cancels_pending_on_error(self):
+        """Bir çağrı başarısız olunca bekleyen çağrılar iptal edilmeli"""
+        fake_model = self._use_fake_model()
+
+        async def run():
+            with self.assertRaises(RuntimeError):
+                await self.model_manager.agenerate_many(["5.0", "boom", "5.0"])
+            return fake_model.in_flight
+
+        start = time.perf_counter()
+        self.assertEqual(asyncio.run(run()), 0)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
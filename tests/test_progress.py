@@ -0,0 +1,109 @@
+import unittest
+import sys
+import os
+import io
+import threading
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.analytics.aggregation import ResultAggregator
+from src.experiment_runner import ExperimentRunner
+from src.utils.progress import ProgressView
+from tests.test_base_task import DictConfig, EchoTask, SlowModelManager
+
+def make_snapshot():
+    aggregator = ResultAggregator()
+    aggregator.add_records([{"Prompt Type": "zero_shot", "Accuracy": value} for value in (1.0, 0.0, 1.0)] +
+                           [{"Prompt Type": "few_shot", "Accuracy": 1.0}], task="t")
+    return {"stop_requested": False, "tasks": {"t": {
+        "status": "running", "completed_units": 4, "units_per_second": 2.0, **aggregator.snapshot("t")
+    }}}
+
+class TestProgressView(unittest.TestCase):
+    def test_render(self):
+        lines = ProgressView.render(make_snapshot())
+        self.assertEqual(lines[0], "[t] running - 4 units, 2.0 units/s, accuracy 0.750")
+        self.assertTrue(lines[2].startswith("  zero_shot"))
+        self.assertIn("[0.013, 1.320]", lines[2])
+        self.assertTrue(lines[3].endswith("*best"))
+        self.assertIn("-", lines[3])
+
+    def test_updates_are_rate_limited(self):
+        stream = io.StringIO()
+        view = ProgressView(stream, min_interval=60)
+        self.assertTrue(view.update(make_snapshot()))
+        self.assertFalse(view.update(make_snapshot()))
+        self.assertTrue(view.update(make_snapshot(), force=True))
+        # Terminal dışında bloklar silinmeden alt alta yazılır
+        self.assertEqual(stream.getvalue().count("[t] running"), 2)
+        self.assertNotIn("\x1b[", stream.getvalue())
+
+class TestStopRequest(unittest.TestCase):
+    def test_task_stops_between_batches(self):
+        stop_event = threading.Event()
+        task = EchoTask(SlowModelManager(delay=0), None, DictConfig({'advanced_features.batch_size': 2}))
+        batches = []
+
+        def on_batch(units):
+            batches.append(units)
+            stop_event.set()
+
+        results_df = task.run_experiment(["a", "b"], stop_event=stop_event, on_batch=on_batch)
+        self.assertEqual(batches, [2])
+        self.assertEqual(len(results_df), 2)
+
+class StopAfterFirstBatch:
+    """İlk batch'ten sonra çalışmayı durduran ilerleme görünümü"""
+    def __init__(self, runner):
+        self.runner = runner
+
+    def update(self, snapshot, force=False):
+        if not force:
+            self.runner.request_stop()
+
+    def close(self):
+        pass
+
+class TestRunnerSnapshot(unittest.TestCase):
+    def setUp(self):
+        os.environ['GEMINI_API_KEY'] = 'test_key'
+        self.runner = ExperimentRunner('config/settings.yaml')
+
+    def test_snapshot_during_and_after_run(self):
+        stream = io.StringIO()
+        self.runner.progress_view = ProgressView(stream, min_interval=0)
+        results_df = self.runner.run_single_task("text_classification", ["zero_shot", "few_shot"])
+
+        snapshot = self.runner.snapshot("text_classification")
+        task = snapshot["tasks"]["text_classification"]
+        self.assertEqual(task["status"], "completed")
+        self.assertEqual(task["completed_units"], len(results_df))
+        self.assertEqual(task["rows"], len(results_df))
+        self.assertAlmostEqual(task["accuracy"]["mean"], results_df["Accuracy"].mean())
+
+        zero_shot = task["strategies"]["zero_shot"]
+        confusion_total = sum(sum(row.values()) for row in zero_shot["confusion"].values())
+        self.assertEqual(confusion_total, zero_shot["count"])
+        self.assertIn("[text_classification] running", stream.getvalue())
+        self.assertIn("[text_classification] completed", stream.getvalue())
+
+    def test_request_stop_skips_remaining_work(self):
+        self.runner.progress_view = StopAfterFirstBatch(self.runner)
+        all_results = self.runner.run_all_tasks()
+
+        self.assertEqual(len(all_results), 1)
+        task_name = next(iter(all_results))
+        self.assertEqual(self.runner.snapshot()["tasks"][task_name]["status"], "stopped")
+        self.assertTrue(self.runner.snapshot()["stop_requested"])
+
+    def test_stop_request_does_not_outlive_the_run(self):
+        self.runner.request_stop()
+        results_df = self.runner.run_single_task("text_classification", ["zero_shot"])
+
+        self.assertFalse(results_df.empty)
+        self.assertEqual(self.runner.snapshot()["tasks"]["text_classification"]["status"], "completed")
+        self.assertFalse(self.runner.snapshot()["stop_requested"])
+
+if __name__ == '__main__':
+    unittest.main()
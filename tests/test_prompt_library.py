@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.prompts.prompt_library import CompiledTemplate, PromptLibrary
+
+class TestCompiledTemplate(unittest.TestCase):
+    def test_matches_str_format(self):
+        source = 'Değer: {{sabit}} {name!r} {score:.2f} - {name}'
+        compiled = CompiledTemplate(source)
+        values = {"name": "örnek", "score": 0.5}
+
+        self.assertEqual(compiled.render(values), source.format(**values))
+        self.assertEqual(compiled.placeholders, ("name", "score"))
+        self.assertEqual(compiled.static_prefix, "Değer: {sabit} ")
+        self.assertEqual(compiled.render_many([values, {"name": 3, "score": 1}]),
+                         [source.format(**values), source.format(name=3, score=1)])
+
+    def test_invalid_placeholders(self):
+        for source in ("{}", "{0}", "{item.text}", "{item[0]}", "{x:{width}}", "{unclosed"):
+            with self.subTest(source=source):
+                with self.assertRaises(ValueError):
+                    CompiledTemplate(source)
+
+    def test_missing_value(self):
+        with self.assertRaises(KeyError):
+            CompiledTemplate("{text}").render({})
+
+    def test_template_without_placeholders(self):
+        compiled = CompiledTemplate("sabit metin")
+        self.assertEqual(compiled.static_prefix, "sabit metin")
+        self.assertEqual(compiled.render_many([{}, {}]), ["sabit metin", "sabit metin"])
+
+class TestPromptLibrary(unittest.TestCase):
+    def setUp(self):
+        self.library = PromptLibrary()
+
+    def test_library_templates_render_like_str_format(self):
+        for category, name, field in [("text_classification", "sentiment_few_shot", "text"),
+                                      ("information_extraction", "entity_extraction_structured", "text"),
+                                      ("mathematical_reasoning", "equation_systems_few_shot", "problem")]:
+            with self.subTest(template=name):
+                source = self.library.get_template(category, name).template
+                rows = [{field: f"girdi {i}"} for i in range(3)]
+
+                self.assertEqual(self.library.format_prompt(category, name, **rows[0]), source.format(**rows[0]))
+                self.assertEqual(self.library.format_many(category, name, rows),
+                                 [source.format(**row) for row in rows])
+                prefix = self.library.get_static_prefix(category, name)
+                self.assertTrue(source.format(**rows[0]).startswith(prefix))
+                self.assertGreater(len(prefix), 50)
+
+    def test_unknown_template(self):
+        with self.assertRaises(KeyError):
+            self.library.format_many("text_classification", "missing", [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import sys
+import os
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.rate_limiter import RateLimiter, is_rate_limit_error, parse_retry_after
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class ConfigStub:
+    """Config.get ve model_name sunan sözlük tabanlı konfigürasyon"""
+    model_name = "gemini-2.5-flash"
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_requests_per_minute(self):
+        """Kapasite dolunca bekleme süresi dolum hızına göre hesaplanmalı"""
+        limiter = RateLimiter(requests_per_minute=60, clock=self.clock)
+
+        waits = [limiter.reserve() for _ in range(61)]
+        self.assertEqual(waits[:60], [0.0] * 60)
+        self.assertAlmostEqual(waits[60], 1.0)
+
+        self.clock.now = 10.0
+        self.assertEqual(limiter.reserve(), 0.0)
+
+    def test_tokens_per_minute(self):
+        """TPM kovası büyük prompt'larda bekleme üretmeli"""
+        limiter = RateLimiter(tokens_per_minute=600, clock=self.clock)
+
+        self.assertEqual(limiter.reserve(tokens=500), 0.0)
+        self.assertAlmostEqual(limiter.reserve(tokens=200), 10.0)
+
+    def test_penalize_blocks_all_callers(self):
+        """429 cezası sınırlayıcıyı paylaşan herkesi bekletmeli"""
+        limiter = RateLimiter(requests_per_minute=1000, clock=self.clock)
+        limiter.penalize(5.0)
+
+        self.assertAlmostEqual(limiter.reserve(), 5.0)
+        self.clock.now = 6.0
+        self.assertEqual(limiter.reserve(), 0.0)
+        self.assertEqual(limiter.stats()["throttled_requests"], 1)
+
+    def test_backoff_delay(self):
+        """Backoff üst sınırı aşmamalı ve retry-after ipucuna uymalı"""
+        limiter = RateLimiter(base_backoff=1.0, max_backoff=8.0)
+
+        for attempt in range(10):
+            delay = limiter.backoff_delay(attempt)
+            self.assertGreaterEqual(delay, 0.5)
+            self.assertLessEqual(delay, 8.0)
+
+        delay = limiter.backoff_delay(0, retry_after=30)
+        self.assertGreaterEqual(delay, 30)
+        self.assertLessEqual(delay, 31)
+
+    def test_shared_instance(self):
+        """Aynı anahtarla istenen sınırlayıcı tek örnek olmalı; reset_shared sonrası yenisi oluşur"""
+        first = RateLimiter.shared("test-model", requests_per_minute=10)
+        self.assertIs(RateLimiter.shared("test-model", requests_per_minute=10), first)
+        RateLimiter.reset_shared()
+        self.assertIsNot(RateLimiter.shared("test-model", requests_per_minute=10), first)
+
+    def test_from_config_keys_on_limits_and_backend(self):
+        """Farklı limit ya da backend ayarları aynı sınırlayıcıyı paylaşmamalı"""
+        RateLimiter.reset_shared()
+        make = lambda **values: RateLimiter.from_config(ConfigStub(values))
+        slow = make(**{'rate_limit.requests_per_minute': 10})
+        self.assertIs(make(**{'rate_limit.requests_per_minute': 10}), slow)
+        self.assertIsNot(make(**{'rate_limit.requests_per_minute': 1000}), slow)
+        self.assertIsNot(make(**{'rate_limit.requests_per_minute': 10, 'model.backend': 'http',
+                                 'model.base_url': 'http://127.0.0.1:8080'}), slow)
+        self.assertIsNone(make()._request_bucket)
+        RateLimiter.reset_shared()
+
+    def test_error_parsing(self):
+        """429 hatalarını ve retry-after ipuçlarını tanı"""
+        grpc_error = "429 Resource has been exhausted. retry_delay { seconds: 17 }"
+        self.assertTrue(is_rate_limit_error(grpc_error))
+        self.assertEqual(parse_retry_after(grpc_error), 17.0)
+        self.assertEqual(parse_retry_after("Please retry in 4.5s."), 4.5)
+        self.assertEqual(parse_retry_after("Retry-After: 12"), 12.0)
+        self.assertIsNone(parse_retry_after("500 internal error"))
+        self.assertFalse(is_rate_limit_error("500 internal error"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+import json
+import re
+import tempfile
+
+import pandas as pd
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.analytics.report_generator import ReportGenerator
+from src.utils.result_sink import open_result_sink
+
+def make_results(rows):
+    return pd.DataFrame({
+        "Task": ["Echo"] * rows,
+        "Prompt Type": ["zero_shot" if i % 2 else "few_shot" for i in range(rows)],
+        "Input": [f"girdi {i}" for i in range(rows)],
+        "Response": ["</script><b>x</b>" if i == 0 else "Olumlu" for i in range(rows)],
+        "Accuracy": [None if i == 3 else float(i % 2) for i in range(rows)]
+    })
+
+def page_payloads(report):
+    return [json.loads(page.replace("<\\/", "</"))
+            for page in re.findall(r'<script type="application/json" class="report-page">(.*?)</script>', report)]
+
+class TestReportGenerator(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_results_are_paginated(self):
+        generator = ReportGenerator(self.tmp_dir.name, rows_per_page=4, render_charts=False)
+        with open(generator.generate_comprehensive_report({"echo_task": make_results(10)}), encoding='utf-8') as f:
+            report = f.read()
+
+        pages = page_payloads(report)
+        self.assertEqual([len(page) for page in pages], [4, 4, 2])
+        self.assertEqual(pages[0][0][3], "</script><b>x</b>")
+        self.assertIsNone(pages[0][3][4])
+        self.assertNotIn("<b>x</b>", report)
+        self.assertIn("Best Strategy: <strong>zero_shot</strong>", report)
+        self.assertIn("Cross-Task Analysis", report)
+
+    def test_max_detail_rows(self):
+        generator = ReportGenerator(self.tmp_dir.name, rows_per_page=4, max_detail_rows=5, render_charts=False)
+        with open(generator.generate_comprehensive_report({"echo_task": make_results(10)}), encoding='utf-8') as f:
+            report = f.read()
+
+        self.assertEqual([len(page) for page in page_payloads(report)], [4, 1])
+        self.assertIn("Showing first 5 of 10 rows.", report)
+
+    def test_rows_streamed_from_result_file(self):
+        path = os.path.join(self.tmp_dir.name, "echo_task.jsonl")
+        with open_result_sink(path) as sink:
+            sink.write_many(make_results(10).to_dict(orient='records'))
+
+        generator = ReportGenerator(self.tmp_dir.name, rows_per_page=3, max_detail_rows=7, render_charts=False)
+        with open(generator.generate_comprehensive_report({"echo_task": path}), encoding='utf-8') as f:
+            report = f.read()
+
+        pages = page_payloads(report)
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(pages[0][0][3], "</script><b>x</b>")
+        self.assertIn("Showing first 7 of 10 rows.", report)
+        self.assertIn("Total Tests: <strong>10</strong>", report)
+
+    def test_default_detail_cap(self):
+        self.assertEqual(ReportGenerator(self.tmp_dir.name).max_detail_rows, 10000)
+
+    def test_charts_rendered_in_worker(self):
+        generator = ReportGenerator(self.tmp_dir.name)
+        with open(generator.generate_comprehensive_report({"echo_task": make_results(6)}), encoding='utf-8') as f:
+            report = f.read()
+
+        self.assertIn('<img alt="Strategy comparison" src="data:image/png;base64,iVBOR', report)
+
+if __name__ == '__main__':
+    unittest.main()
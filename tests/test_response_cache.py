@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.response_cache import ResponseCache
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self.tmp_dir.name, max_entries=3, max_size_mb=1)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_key_depends_on_model_parameters(self):
+        """Anahtar model adı, temperature, max_tokens ve prompt'a bağlı olmalı"""
+        base = ResponseCache.make_key("gemini", 0.1, 2048, "prompt")
+        self.assertEqual(base, ResponseCache.make_key("gemini", 0.1, 2048, "prompt"))
+        self.assertNotEqual(base, ResponseCache.make_key("gemini", 0.2, 2048, "prompt"))
+        self.assertNotEqual(base, ResponseCache.make_key("gemini", 0.1, 1024, "prompt"))
+        self.assertNotEqual(base, ResponseCache.make_key("other", 0.1, 2048, "prompt"))
+        self.assertNotEqual(base, ResponseCache.make_key("gemini", 0.1, 2048, "prompt2"))
+
+    def test_hit_and_miss_counters(self):
+        """İsabet ve ıskalama sayaçlarını test et"""
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", "Olumlu", {"input_tokens": 3})
+
+        entry = self.cache.get("a")
+        self.assertEqual(entry["response"], "Olumlu")
+        self.assertEqual(entry["metadata"], {"input_tokens": 3})
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_lru_eviction(self):
+        """Kayıt sınırı aşılınca en uzun süre erişilmeyen silinmeli"""
+        for key in ("a", "b", "c"):
+            self.cache.put(key, key)
+            time.sleep(0.01)
+
+        self.cache.get("a")  # 'a' yeniden kullanıldı, 'b' en eski oldu
+        time.sleep(0.01)
+        self.cache.put("d", "d")
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_size_bound_eviction(self):
+        """Toplam boyut sınırı aşılınca eski kayıtlar silinmeli"""
+        cache = ResponseCache(os.path.join(self.tmp_dir.name, "sized"),
+                              max_entries=100, max_size_mb=0.001)
+        try:
+            cache.put("a", "x" * 600)
+            time.sleep(0.01)
+            cache.put("b", "y" * 600)
+            self.assertIsNone(cache.get("a"))
+            self.assertIsNotNone(cache.get("b"))
+        finally:
+            cache.close()
+
+    def test_ttl_expiry(self):
+        """Süresi dolan kayıtlar ıskalama sayılmalı"""
+        cache = ResponseCache(os.path.join(self.tmp_dir.name, "ttl"), ttl_seconds=0.05)
+        try:
+            cache.put("a", "Olumlu")
+            self.assertIsNotNone(cache.get("a"))
+            time.sleep(0.1)
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(len(cache), 0)
+        finally:
+            cache.close()
+
+    def test_persistence(self):
+        """Kayıtlar yeni bir örnekte de okunabilmeli"""
+        self.cache.put("a", "Olumsuz")
+        self.cache.close()
+
+        self.cache = ResponseCache(self.tmp_dir.name, max_entries=3)
+        self.assertEqual(self.cache.get("a")["response"], "Olumsuz")
+
+if __name__ == '__main__':
+    unittest.main()
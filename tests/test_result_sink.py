@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.result_sink import JsonlResultSink, ResultSink, open_result_sink, read_jsonl
+from src.utils.data_handler import DataHandler
+from tests.test_base_task import DictConfig, EchoTask, SlowModelManager
+
+class TestResultSink(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "results.jsonl")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_rows_are_flushed_in_batches(self):
+        """flush_every dolunca satırlar diske yazılmalı"""
+        sink = JsonlResultSink(self.path, flush_every=2)
+        sink.write({"Task": "a", "Accuracy": 1.0})
+        self.assertEqual(sink.rows_written, 0)
+
+        sink.write({"Task": "b", "Accuracy": None})
+        self.assertEqual(sink.rows_written, 2)
+
+        # close() çağrılmadan (çökme) yazılanlar okunabilir olmalı
+        results_df = read_jsonl(self.path)
+        self.assertEqual(results_df["Task"].tolist(), ["a", "b"])
+        sink.close()
+
+    def test_read_dataframe_includes_buffer(self):
+        with open_result_sink(self.path, "jsonl", flush_every=100) as sink:
+            sink.write_many({"Task": "t", "Accuracy": i / 2} for i in range(3))
+            results_df = sink.read_dataframe()
+
+        self.assertEqual(results_df["Accuracy"].tolist(), [0.0, 0.5, 1.0])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            open_result_sink(self.path, "xlsx")
+
+    def test_task_streams_results_to_sink(self):
+        """Sink verilince sonuçlar bellekte birikmemeli, DataFrame aynı olmalı"""
+        config = DictConfig({'advanced_features.batch_size': 2})
+        expected_df = EchoTask(SlowModelManager(delay=0), None, config).run_experiment(["a", "b"])
+
+        task = EchoTask(SlowModelManager(delay=0), None, config)
+        with JsonlResultSink(self.path) as sink:
+            results_df = task.run_experiment(["a", "b"], sink=sink)
+
+        self.assertEqual(len(task.results), 0)
+        # Ölçülen gecikme çalıştırmalar arasında değişir; karşılaştırmaya alınmaz
+        expected_records = expected_df.drop(columns=["Latency (s)"]).to_dict("records")
+        self.assertEqual(results_df.drop(columns=["Latency (s)"]).to_dict("records"), expected_records)
+        self.assertTrue(results_df["Latency (s)"].notna().all())
+
+        handler = DataHandler(self.tmp_dir.name)
+        self.assertEqual(handler.load_results(self.path).drop(columns=["Latency (s)"]).to_dict("records"),
+                         expected_records)
+
+    def test_task_respects_flush_threshold(self):
+        """Görev her batch'te flush etmemeli; yazma sıklığını sink'in flush_every eşiği belirler"""
+        task = EchoTask(SlowModelManager(delay=0), None, DictConfig({'advanced_features.batch_size': 2}))
+        with JsonlResultSink(self.path, flush_every=4) as sink:
+            flushed = []
+            write_rows = sink._write_rows
+            sink._write_rows = lambda rows: (flushed.append(len(rows)), write_rows(rows))
+            results_df = task.run_experiment(["a", "b"], sink=sink)
+
+        self.assertEqual(len(results_df), 10)
+        self.assertEqual(flushed, [4, 4, 2])
+
+    def test_sink_requires_implementation(self):
+        with self.assertRaises(TypeError):
+            ResultSink(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
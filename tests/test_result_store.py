@@ -0,0 +1,85 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.tasks import TaskResult
+from src.utils.result_store import ColumnarResultStore
+
+def make_result(i, accuracy=1.0):
+    return TaskResult(
+        task_name="Echo",
+        prompt_type="few_shot" if i % 2 else "zero_shot",
+        prompt_format="Few-shot" if i % 2 else "Zero-shot",
+        input_text=f"item {i}",
+        model_response="Olumlu",
+        expected_output="Olumlu",
+        accuracy=accuracy
+    )
+
+class TestColumnarResultStore(unittest.TestCase):
+    def setUp(self):
+        self.results = [make_result(i) for i in range(4)] + [make_result(4, accuracy=None)]
+        self.store = ColumnarResultStore()
+        self.store.extend(self.results)
+
+    def test_dataframe_matches_row_based_build(self):
+        """Sütunlu DataFrame, satır sözlüklerinden kurulanla aynı değerleri içermeli"""
+        expected_df = pd.DataFrame([result.to_record() for result in self.results])
+        results_df = self.store.to_dataframe()
+
+        self.assertEqual(list(results_df.columns), list(expected_df.columns))
+        pd.testing.assert_frame_equal(results_df.astype(object).where(results_df.notna(), None),
+                                      expected_df.astype(object).where(expected_df.notna(), None))
+        self.assertIsInstance(results_df["Prompt Type"].dtype, pd.CategoricalDtype)
+        self.assertEqual(len(results_df["Task"].cat.categories), 1)
+
+    def test_iteration_returns_task_results(self):
+        self.assertEqual(len(self.store), 5)
+        self.assertEqual([result.input_text for result in self.store],
+                         [result.input_text for result in self.results])
+        self.assertIsNone(list(self.store)[-1].accuracy)
+
+    def test_accuracy_is_not_copied(self):
+        """Accuracy sütunu depo dizisinin kopyasız görünümü olmalı"""
+        results_df = self.store.to_dataframe()
+        accuracy = np.frombuffer(self.store._numeric["Accuracy"].values, dtype=np.float64)
+        self.assertTrue(np.shares_memory(results_df["Accuracy"].to_numpy(), accuracy))
+
+    def test_dataframe_does_not_alias_store(self):
+        """DataFrame üzerinden yerinde değişiklik depoyu değiştirmemeli"""
+        results_df = self.store.to_dataframe()
+        with self.assertRaises(ValueError):
+            results_df.loc[0, "Accuracy"] = 9
+        self.assertEqual(self.store.record(0)["Accuracy"], 1.0)
+
+        copied = results_df.copy()
+        copied.loc[0, "Accuracy"] = 9
+        self.assertEqual(self.store.record(0)["Accuracy"], 1.0)
+
+    def test_token_columns_are_nullable_integers(self):
+        self.store.append_record({**make_result(5).to_record(), "Input Tokens": 12, "Output Tokens": 3})
+        results_df = self.store.to_dataframe()
+        self.assertEqual(str(results_df["Input Tokens"].dtype), "Int64")
+        self.assertEqual(results_df["Input Tokens"].iloc[-1], 12)
+        self.assertTrue(pd.isna(results_df["Output Tokens"].iloc[0]))
+
+    def test_append_after_export(self):
+        """DataFrame'e verilmiş dizilere ekleme yapılabilmeli, eski DataFrame değişmemeli"""
+        results_df = self.store.to_dataframe()
+        self.store.append(make_result(5, accuracy=0.5))
+
+        self.assertEqual(len(results_df), 5)
+        self.assertEqual(len(self.store.to_dataframe()), 6)
+        self.assertEqual(self.store.to_dataframe()["Accuracy"].iloc[-1], 0.5)
+
+    def test_task_result_uses_slots(self):
+        self.assertFalse(hasattr(self.results[0], "__dict__"))
+
+if __name__ == '__main__':
+    unittest.main()
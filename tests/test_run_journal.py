@@ -0,0 +1,80 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.run_journal import RunJournal
+from tests.test_base_task import DictConfig, EchoTask, SlowModelManager
+
+class FailingModelManager(SlowModelManager):
+    """Belirli prompt'larda hata veren sahte model (çalıştırma yarıda kesilmiş gibi)"""
+    def __init__(self, failing_prompts):
+        super().__init__(delay=0)
+        self.failing_prompts = failing_prompts
+        self.calls = []
+
+    def generate(self, prompt):
+        self.calls.append(prompt)
+        if prompt in self.failing_prompts:
+            raise RuntimeError("Model generation failed: 503")
+        return super().generate(prompt)
+
+class TestRunJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_item_id(self):
+        """Kimlik 'id' alanından ya da içerikten türetilmeli"""
+        self.assertEqual(RunJournal.item_id({"id": 7, "input_text": "x"}), "7")
+        self.assertEqual(RunJournal.item_id({"input_text": "x"}), RunJournal.item_id({"input_text": "x"}))
+        self.assertNotEqual(RunJournal.item_id({"input_text": "x"}), RunJournal.item_id({"input_text": "y"}))
+
+    def test_resume_skips_completed_units(self):
+        """Devam eden çalıştırma yalnızca tamamlanmamış birimleri çalıştırmalı"""
+        config = DictConfig({'advanced_features.batch_size': 2})
+        failing = {"b:item 3", "b:item 4"}
+
+        journal = RunJournal(self.tmp_dir.name)
+        first_manager = FailingModelManager(failing)
+        first_df = EchoTask(first_manager, None, config).run_experiment(["a", "b"], journal=journal)
+        journal.close()
+        self.assertEqual(len(first_df), 8)
+
+        resumed = RunJournal(self.tmp_dir.name, journal.run_id)
+        self.assertEqual(resumed.completed_count, 8)
+
+        second_manager = FailingModelManager(set())
+        resumed_df = EchoTask(second_manager, None, config).run_experiment(["a", "b"], journal=resumed)
+        resumed.close()
+
+        self.assertEqual(sorted(second_manager.calls), sorted(failing))
+        self.assertEqual(len(resumed_df), 10)
+        self.assertEqual(sorted(resumed_df["Input"].tolist()),
+                         sorted([f"item {i}" for i in range(5)] * 2))
+
+    def test_truncated_last_line_is_ignored(self):
+        """Çökme sonucu yarım kalan satır okunurken atlanmalı"""
+        journal = RunJournal(self.tmp_dir.name)
+        journal.record_many("task", [("a", "1", {"Prompt Type": "a"})])
+        journal.close()
+
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "unit", "task": "task", "str')
+
+        resumed = RunJournal(self.tmp_dir.name, journal.run_id)
+        resumed.record_many("task", [("a", "2", {"Prompt Type": "a"})])
+        self.assertTrue(resumed.is_completed("task", "a", "1"))
+        resumed.close()
+
+        reopened = RunJournal(self.tmp_dir.name, journal.run_id)
+        self.assertEqual(reopened.completed_count, 2)
+        reopened.close()
+
+if __name__ == '__main__':
+    unittest.main()
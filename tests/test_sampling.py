@@ -0,0 +1,128 @@
+import unittest
+import sys
+import os
+import math
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.evaluation.sampling import StratifiedSample
+from src.tasks.mathematical_reasoning import MathematicalReasoningTask
+from src.tasks.text_classification import TextClassificationTask
+from tests.test_base_task import DictConfig, EchoTask, SlowModelManager
+
+def make_items():
+    # 3 katman: a (600), b (300), c (100)
+    return [{"input_text": f"item {i}", "label": "a" if i < 600 else "b" if i < 900 else "c"}
+            for i in range(1000)]
+
+class LabelledEchoTask(EchoTask):
+    """'a' katmanındaki çift numaralı verilerde doğru, diğerlerinde yanlış yanıt veren görev"""
+    def get_test_data(self):
+        items = make_items()
+        for index, item in enumerate(items):
+            correct = item["label"] == "a" and index % 2 == 0
+            item["expected_output"] = f"zero_shot:{item['input_text']}" if correct else "-"
+        return items
+
+    def stratum_key(self, data_item):
+        return data_item["label"]
+
+class TestStratifiedSample(unittest.TestCase):
+    def test_draw_is_proportional_and_deterministic(self):
+        sample = StratifiedSample(initial_size=50, step=100, seed=1)
+        sample.prepare(make_items(), lambda item: item["label"])
+        first = sample.draw()
+        self.assertEqual(len(first), 50)
+        self.assertEqual(sample.stratum_sizes(), {"a": (30, 600), "b": (15, 300), "c": (5, 100)})
+        self.assertTrue(all(item["label"] == stratum for stratum, item in first))
+
+        self.assertEqual(len(sample.draw()), 100)
+        self.assertEqual(sample.stratum_sizes()["c"], (15, 100))
+
+        again = StratifiedSample(initial_size=50, seed=1)
+        again.prepare(make_items(), lambda item: item["label"])
+        self.assertEqual([item["input_text"] for _, item in again.draw()],
+                         [item["input_text"] for _, item in first])
+
+    def test_small_strata_are_represented(self):
+        sample = StratifiedSample(initial_size=3)
+        sample.prepare(make_items()[:598] + make_items()[-2:], lambda item: item["label"])
+        self.assertEqual({stratum for stratum, _ in sample.draw()}, {"a", "c"})
+
+    def test_max_size_and_exhaustion(self):
+        sample = StratifiedSample(initial_size=40, step=40, max_size=60)
+        sample.prepare(make_items(), lambda item: item["label"])
+        self.assertEqual(len(sample.draw()), 40)
+        self.assertEqual(len(sample.draw()), 20)
+        self.assertEqual(sample.draw(), [])
+
+    def test_stratified_estimate(self):
+        sample = StratifiedSample()
+        sample.prepare(make_items(), lambda item: item["label"])
+        for accuracy in (1.0, 1.0, 0.0, 1.0):
+            sample.update("s", "a", accuracy)
+        for accuracy in (0.0, 0.0):
+            sample.update("s", "b", accuracy)
+
+        estimate = sample.estimate("s")
+        # Ağırlıklar gözlenen katmanlara göre: a = 2/3, b = 1/3
+        self.assertAlmostEqual(estimate["mean"], 2 / 3 * 0.75)
+        self.assertEqual(estimate["samples"], 6)
+        self.assertGreater(estimate["width"], 0)
+        self.assertTrue(math.isnan(sample.estimate("missing")["mean"]))
+
+    def test_identical_scores_do_not_collapse_interval(self):
+        """İlk puanların hepsi doğru olsa da aralık sıfıra inmemeli, örneklem büyümeye devam etmeli"""
+        items = [{"label": label} for label in ("a", "b", "c") for _ in range(1000)]
+        sample = StratifiedSample(target_ci_width=0.1, initial_size=30)
+        sample.prepare(items, lambda item: item["label"])
+        for stratum, _ in sample.draw():
+            sample.update("s", stratum, 1.0)
+
+        estimate = sample.estimate("s")
+        self.assertEqual(estimate["mean"], 1.0)
+        self.assertGreater(estimate["width"], 0.1)
+        self.assertLess(estimate["ci_low"], 0.97)
+        self.assertFalse(sample.converged)
+
+    def test_census_has_zero_width(self):
+        sample = StratifiedSample(target_ci_width=0.01)
+        sample.prepare([{"label": "a"}, {"label": "a"}], lambda item: item["label"])
+        sample.update("s", "a", 1.0)
+        sample.update("s", "a", 0.0)
+        self.assertEqual(sample.estimate("s")["width"], 0.0)
+        self.assertTrue(sample.converged)
+
+    def test_from_config_overrides(self):
+        sample = StratifiedSample.from_config(DictConfig({'sampling.initial_size': 10}), target_ci_width=0.2,
+                                              max_size=None)
+        self.assertEqual((sample.initial_size, sample.step, sample.target_ci_width), (10, 10, 0.2))
+        with self.assertRaises(ValueError):
+            StratifiedSample(target_ci_width=0)
+
+class TestSampledRun(unittest.TestCase):
+    def test_sample_grows_until_target_width(self):
+        task = LabelledEchoTask(SlowModelManager(delay=0), None, DictConfig())
+        sample = StratifiedSample(target_ci_width=0.1, initial_size=20, step=20)
+        batches = []
+        results_df = task.run_experiment(["zero_shot"], sample=sample, on_batch=batches.append)
+
+        self.assertTrue(sample.converged)
+        self.assertLess(sample.sample_size, 1000)
+        self.assertEqual(len(results_df), sample.sample_size)
+        self.assertEqual(sum(batches), sample.sample_size)
+        estimate = sample.estimate("zero_shot")
+        self.assertLessEqual(estimate["width"], 0.1)
+        self.assertLess(estimate["ci_low"], 0.3)
+        self.assertGreater(estimate["ci_high"], 0.3)
+
+    def test_task_strata(self):
+        config = DictConfig()
+        text_task = TextClassificationTask(None, None, config)
+        self.assertEqual(text_task.stratum_key(text_task.get_test_data()[0]), "Olumlu")
+        math_task = MathematicalReasoningTask(None, None, config)
+        self.assertEqual(math_task.stratum_key(math_task.get_test_data()[0]), "equation_system")
+
+if __name__ == '__main__':
+    unittest.main()
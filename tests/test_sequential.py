@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.evaluation.sequential import SuccessiveElimination
+from src.experiment_runner import ExperimentRunner
+from tests.test_base_task import DictConfig, EchoTask, SlowModelManager
+
+class SkewedTask(EchoTask):
+    """'good' stratejisi her zaman, 'coin' her iki veriden birinde, 'bad' hiçbir zaman doğru"""
+    available_strategies = ["good", "coin", "bad"]
+
+    def get_test_data(self):
+        return [{"input_text": f"item {i}", "expected_output": f"good:item {i}"} for i in range(400)]
+
+    def _generate_prompt(self, strategy, data_item):
+        index = int(data_item["input_text"].split()[1])
+        if strategy == "coin" and index % 2 == 0:
+            return f"good:{data_item['input_text']}"
+        return super()._generate_prompt(strategy, data_item)
+
+class TestSuccessiveElimination(unittest.TestCase):
+    def test_separated_strategy_is_eliminated(self):
+        comparison = SuccessiveElimination(["a", "b"], round_size=50, min_samples=50)
+        comparison.update("a", [1.0] * 50)
+        comparison.update("b", [0.0] * 50)
+        self.assertEqual(comparison.end_round(), ["b"])
+        self.assertTrue(comparison.finished)
+        self.assertEqual(comparison.winner, "a")
+        self.assertEqual(comparison.summary()["strategies"]["b"]["status"], "eliminated (round 1)")
+
+    def test_close_strategies_stay_in_contention(self):
+        comparison = SuccessiveElimination(["a", "b"], round_size=50, min_samples=50)
+        comparison.update("a", [1.0, 0.0] * 25)
+        comparison.update("b", [1.0, 0.0, 0.0] * 16 + [0.0, 0.0])
+        self.assertEqual(comparison.end_round(), [])
+        self.assertFalse(comparison.finished)
+        self.assertIsNone(comparison.winner)
+        self.assertEqual(comparison.leader, "a")
+
+    def test_no_elimination_before_min_samples(self):
+        comparison = SuccessiveElimination(["a", "b"], round_size=10, min_samples=100)
+        comparison.update("a", [1.0] * 10)
+        comparison.update("b", [0.0] * 10)
+        self.assertEqual(comparison.end_round(), [])
+
+    def test_max_samples_finishes(self):
+        comparison = SuccessiveElimination(["a", "b"], round_size=5, max_samples=5)
+        self.assertFalse(comparison.finished)
+        comparison.update("a", [1.0] * 5)
+        comparison.update("b", [None] * 5)
+        self.assertTrue(comparison.finished)
+        self.assertEqual(comparison.bounds("b"), (0.0, 1.0))
+
+    def test_from_config_and_validation(self):
+        comparison = SuccessiveElimination.from_config(
+            DictConfig({'comparison.round_size': 8, 'comparison.confidence': 0.9}), ["a", "a", "b"])
+        self.assertEqual(comparison.strategies, ["a", "b"])
+        self.assertEqual(comparison.min_samples, 8)
+        with self.assertRaises(ValueError):
+            SuccessiveElimination([])
+        with self.assertRaises(ValueError):
+            SuccessiveElimination(["a"], confidence=1.0)
+
+class TestRunComparison(unittest.TestCase):
+    def test_adaptive_run_spends_fewer_calls(self):
+        task = SkewedTask(SlowModelManager(delay=0), None, DictConfig({'advanced_features.batch_size': 64}))
+        comparison = SuccessiveElimination(task.available_strategies, round_size=20, min_samples=20)
+        batches = []
+        results_df = task.run_comparison(comparison, on_batch=batches.append)
+
+        self.assertEqual(comparison.winner, "good")
+        self.assertEqual(list(comparison.eliminated), ["bad", "coin"])
+        self.assertEqual(len(results_df), comparison.total_calls)
+        self.assertEqual(sum(batches), comparison.total_calls)
+        self.assertLess(comparison.total_calls, 400 * 3 / 2)
+        self.assertEqual(task.aggregator.rows(strategy="good"), comparison.calls["good"])
+
+    def test_supported_strategies(self):
+        task = EchoTask(SlowModelManager(delay=0), None, DictConfig())
+        self.assertEqual(task.supported_strategies(["few_shot", "broken", "zero_shot"]), ["few_shot", "zero_shot"])
+
+class TestRunnerComparison(unittest.TestCase):
+    def setUp(self):
+        os.environ['GEMINI_API_KEY'] = 'test_key'
+        self.runner = ExperimentRunner('config/settings.yaml')
+
+    def test_unsupported_strategies_are_skipped(self):
+        results_df, comparison = self.runner.compare_strategies(
+            "text_classification", ["zero_shot", "zero_shot_cot", "few_shot"], adaptive=False)
+        self.assertIsNone(comparison)
+        self.assertEqual(set(results_df["Prompt Type"]), {"zero_shot", "few_shot"})
+
+    def test_adaptive_comparison(self):
+        results_df, comparison = self.runner.compare_strategies("text_classification", adaptive=True)
+        self.assertEqual(comparison.strategies, ["zero_shot", "one_shot", "few_shot"])
+        self.assertEqual(len(results_df), comparison.total_calls)
+
+if __name__ == '__main__':
+    unittest.main()
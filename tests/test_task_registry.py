@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+from importlib.metadata import EntryPoint
+from unittest import mock
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.tasks import registry
+from tests.test_base_task import DictConfig, EchoTask
+
+class TestTaskRegistry(unittest.TestCase):
+    def setUp(self):
+        self._saved_registry = dict(registry._REGISTRY)
+        self._saved_loaded = registry._entry_points_loaded
+
+    def tearDown(self):
+        registry._REGISTRY.clear()
+        registry._REGISTRY.update(self._saved_registry)
+        registry._entry_points_loaded = self._saved_loaded
+
+    def test_builtin_tasks(self):
+        self.assertIn("text_classification", registry.registered_tasks())
+        self.assertIn("mathematical_reasoning", registry.registered_tasks())
+
+    def test_disabled_tasks_are_not_listed(self):
+        config = DictConfig({'tasks.mathematical_reasoning.enabled': False})
+        self.assertNotIn("mathematical_reasoning", registry.list_tasks(config))
+        self.assertIn("text_classification", registry.list_tasks(config))
+
+    def test_register_and_create(self):
+        """Kayıtlı görev ilk create_task çağrısında oluşturulmalı"""
+        registry.register_task("echo", "tests.test_base_task", "EchoTask")
+        task = registry.create_task("echo", None, None, DictConfig())
+
+        self.assertIsInstance(task, EchoTask)
+        self.assertEqual(registry.get_task_info("echo", DictConfig())["test_data_count"], 5)
+        self.assertIn("error", registry.get_task_info("missing", DictConfig()))
+        with self.assertRaises(ValueError):
+            registry.create_task("missing", None, None, DictConfig())
+
+    def test_entry_point_plugins(self):
+        """Entry point ile kurulan görevler katalogda görünmeli, yerleşikleri ezmemeli"""
+        plugins = [
+            EntryPoint("echo_plugin", "tests.test_base_task:EchoTask", registry.ENTRY_POINT_GROUP),
+            EntryPoint("text_classification", "tests.test_base_task:EchoTask", registry.ENTRY_POINT_GROUP),
+        ]
+        registry._entry_points_loaded = False
+
+        with mock.patch.object(registry, "entry_points", return_value=plugins):
+            self.assertIn("echo_plugin", registry.registered_tasks())
+
+        self.assertEqual(registry.get_task_spec("echo_plugin").class_name, "EchoTask")
+        self.assertEqual(registry.get_task_spec("text_classification").class_name,
+                         "TextClassificationTask")
+
+if __name__ == '__main__':
+    unittest.main()
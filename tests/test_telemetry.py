@@ -0,0 +1,114 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.model_manager import ModelManager
+from src.utils.telemetry import Telemetry, telemetry
+from tests.test_base_task import DictConfig, EchoTask, SlowModelManager
+from tests.test_mock_backend import make_backend_config
+
+class TestTelemetry(unittest.TestCase):
+    def test_disabled_records_nothing(self):
+        recorder = Telemetry(enabled=False)
+        with recorder.span("x") as span:
+            span.set_attribute("a", 1)
+        recorder.count("calls")
+
+        self.assertEqual(recorder.spans, [])
+        self.assertEqual(recorder.counters(), {})
+
+    def test_nested_spans_and_counters(self):
+        recorder = Telemetry(enabled=True)
+        with recorder.span("outer", task="t") as outer:
+            with recorder.span("inner") as inner:
+                pass
+        with self.assertRaises(KeyError):
+            with recorder.span("failing"):
+                raise KeyError("x")
+        recorder.count("model_calls", outcome="success")
+        recorder.count("model_calls", 2, outcome="success")
+
+        self.assertEqual([span.name for span in recorder.spans], ["inner", "outer", "failing"])
+        self.assertEqual(inner.parent_id, outer.span_id)
+        self.assertIsNone(outer.parent_id)
+        self.assertEqual(recorder.spans[2].attributes["error"], "KeyError")
+        self.assertEqual(recorder.counters(), {'model_calls{outcome="success"}': 3})
+        self.assertEqual(recorder.span_summary()["outer"]["count"], 1)
+
+    def test_span_limit(self):
+        recorder = Telemetry(enabled=True, max_spans=2)
+        for _ in range(5):
+            with recorder.span("x"):
+                pass
+        self.assertEqual(len(recorder.spans), 2)
+        self.assertEqual(recorder.dropped_spans, 3)
+        self.assertEqual(recorder.span_summary()["x"]["count"], 5)
+
+    def test_exporters(self):
+        recorder = Telemetry(enabled=True)
+        with recorder.span("model.call", attempt=1):
+            pass
+        recorder.count("model_retries")
+
+        prometheus = recorder.to_prometheus()
+        self.assertIn("prompt_engineering_model_retries_total 1", prometheus)
+        self.assertIn('prompt_engineering_span_duration_seconds_count{span="model.call"} 1', prometheus)
+        self.assertIn('_bucket{le="+Inf",span="model.call"} 1', prometheus)
+
+        span = recorder.to_otel_json()["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        self.assertEqual(len(span["traceId"]), 32)
+        self.assertEqual(span["attributes"], [{"key": "attempt", "value": {"intValue": "1"}}])
+
+        event = recorder.to_chrome_trace()["traceEvents"][0]
+        self.assertEqual((event["name"], event["ph"], event["cat"]), ("model.call", "X", "model"))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(recorder.export(os.path.join(tmp_dir, "metrics.prom")), encoding='utf-8') as f:
+                self.assertEqual(f.read(), prometheus)
+            with open(recorder.export(os.path.join(tmp_dir, "trace.otel.json")), encoding='utf-8') as f:
+                self.assertIn("resourceSpans", json.load(f))
+            with open(recorder.export(os.path.join(tmp_dir, "nested", "trace.json")), encoding='utf-8') as f:
+                self.assertIn("traceEvents", json.load(f))
+            with self.assertRaises(ValueError):
+                recorder.export(os.path.join(tmp_dir, "x"), "xml")
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        telemetry.reset()
+        telemetry.configure(enabled=True)
+
+    def tearDown(self):
+        telemetry.configure(enabled=False)
+        telemetry.reset()
+
+    def test_task_phases_are_traced(self):
+        EchoTask(SlowModelManager(delay=0), None, DictConfig()).run_experiment(["a"])
+
+        summary = telemetry.span_summary()
+        self.assertEqual(summary["task.generate_prompt"]["count"], 5)
+        self.assertEqual(summary["task.evaluate"]["count"], 1)
+        self.assertIn("task.generate_batch", summary)
+
+    def test_retries_and_waits_are_counted(self):
+        model_manager = ModelManager(make_backend_config("mock"))
+        for i in range(20):
+            model_manager.generate(f"prompt {i}")
+
+        counters = telemetry.counters()
+        rate_limited = model_manager._model.stats()["rate_limited"]
+        self.assertEqual(counters['model_calls{outcome="success"}'], 20)
+        self.assertEqual(counters['model_calls{outcome="rate_limited"}'], rate_limited)
+        self.assertEqual(counters["model_retries"], rate_limited)
+
+        calls = [span for span in telemetry.spans if span.name == "model.call"]
+        generates = {span.span_id for span in telemetry.spans if span.name == "model.generate"}
+        self.assertEqual(len(calls), 20 + rate_limited)
+        self.assertTrue(all(span.parent_id in generates for span in calls))
+
+if __name__ == '__main__':
+    unittest.main()
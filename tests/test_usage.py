@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import pandas as pd
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.mock_backend import MockResponse, UsageMetadata
+from src.core.model_manager import ModelManager
+from src.core.response_cache import ResponseCache
+from src.core.usage import GenerationResult
+from src.evaluation.metrics import EvaluationMetrics
+from tests.test_base_task import DictConfig, EchoTask, SlowModelManager
+from tests.test_mock_backend import make_backend_config
+
+class TestGenerationResult(unittest.TestCase):
+    def test_estimate(self):
+        result = GenerationResult.estimate("a" * 40, "b" * 8, latency_seconds=0.5)
+        self.assertEqual((result.input_tokens, result.output_tokens, result.total_tokens), (10, 2, 12))
+        self.assertTrue(result.estimated)
+
+    def test_from_response_uses_usage_metadata(self):
+        response = MockResponse(" yanıt ", UsageMetadata(120, 30, 150))
+        result = GenerationResult.from_response("prompt", response)
+        self.assertEqual((result.text, result.input_tokens, result.output_tokens), ("yanıt", 120, 30))
+        self.assertFalse(result.estimated)
+
+    def test_from_cache_keeps_usage(self):
+        original = GenerationResult("yanıt", 120, 30)
+        cached = GenerationResult.from_cache("prompt", {"response": "yanıt",
+                                                        "metadata": original.usage_metadata()})
+        self.assertEqual((cached.input_tokens, cached.output_tokens), (120, 30))
+        self.assertTrue(cached.cached)
+
+        # Kullanım bilgisi olmadan yazılmış eski kayıtlar tahmin edilir
+        legacy = GenerationResult.from_cache("prompt", {"response": "yanıt"})
+        self.assertTrue(legacy.estimated)
+
+class TestUsageFlow(unittest.TestCase):
+    def test_backend_usage_survives_cache(self):
+        model_manager = ModelManager(make_backend_config("mock"))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_manager.cache = ResponseCache(tmp_dir)
+            first = model_manager.generate_with_usage("prompt a")
+            second = model_manager.generate_with_usage("prompt a")
+
+        self.assertFalse(first.estimated)
+        self.assertEqual(first.output_tokens, len(first.text.split()))
+        self.assertTrue(second.cached)
+        self.assertEqual((second.text, second.input_tokens, second.output_tokens),
+                         (first.text, first.input_tokens, first.output_tokens))
+        self.assertEqual(model_manager.generate("prompt a"), first.text)
+
+    def test_task_results_carry_usage(self):
+        results_df = EchoTask(SlowModelManager(delay=0), None, DictConfig()).run_experiment(["a"])
+
+        self.assertTrue((results_df["Input Tokens"] > 0).all())
+        self.assertTrue((results_df["Output Tokens"] > 0).all())
+        self.assertTrue(results_df["Latency (s)"].notna().all())
+
+class TestStrategyEfficiency(unittest.TestCase):
+    def setUp(self):
+        self.results_df = pd.DataFrame({
+            "Prompt Type": ["zero_shot", "zero_shot", "few_shot", "few_shot"],
+            "Prompt Format": ["Zero-shot", "Zero-shot", "Few-shot", "Few-shot"],
+            "Accuracy": [1.0, 0.0, 1.0, 1.0],
+            "Input Tokens": [100, 100, 900, 900],
+            "Output Tokens": [50, 50, 100, 100],
+            "Latency (s)": [0.5, 0.5, 2.0, 2.0]
+        })
+
+    def test_efficiency_columns(self):
+        performance = EvaluationMetrics().calculate_strategy_performance(self.results_df)
+        zero_shot = performance.set_index("Prompt Type").loc["zero_shot"]
+
+        self.assertEqual(zero_shot["avg_input_tokens"], 100)
+        self.assertAlmostEqual(zero_shot["accuracy_per_1k_tokens"], 0.5 / 150 * 1000, places=3)
+        self.assertAlmostEqual(zero_shot["latency_ms_per_output_token"], 10.0)
+        self.assertNotIn("avg_cost_usd", performance.columns)
+
+    def test_cost_from_pricing(self):
+        performance = EvaluationMetrics().calculate_strategy_performance(
+            self.results_df, {"input_per_million": 1.0, "output_per_million": 2.0})
+        few_shot = performance.set_index("Prompt Type").loc["few_shot"]
+        self.assertAlmostEqual(few_shot["avg_cost_usd"], (900 * 1.0 + 100 * 2.0) / 1_000_000)
+
+    def test_without_token_columns(self):
+        performance = EvaluationMetrics().calculate_strategy_performance(
+            self.results_df[["Prompt Type", "Prompt Format", "Accuracy"]])
+        self.assertEqual(list(performance.columns), ["Prompt Type", "Prompt Format", "mean", "std", "count"])
+
+if __name__ == '__main__':
+    unittest.main()